@@ -0,0 +1,238 @@
+import re
+import time
+import logging
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from variable_registry import REGISTRY
+
+"""
+Supreme Ruler 2030 - Live Alert Rules
+- Rules are plain text, one per line:
+      Treasury < 0
+      Military Approval drops 5% in 7 days
+      Petroleum below 30 days of consumption
+      [Resources - Stock] below 15 days of consumption
+  A [Category] selector expands to every variable of that registry category.
+- Each rule is compiled once into a closure over the snapshot array and a
+  rolling buffer of daily rows, so a tick is a handful of numpy ops.
+- Alerts are edge-triggered: a rule fires when it becomes true and re-arms
+  once it is false again.
+"""
+
+logger = logging.getLogger(__name__)
+
+# Column order of the snapshot array (fixed for the lifetime of the process)
+ALERT_VARIABLES: List[str] = REGISTRY.names()
+VAR_INDEX: Dict[str, int] = {name: i for i, name in enumerate(ALERT_VARIABLES)}
+
+# Days kept in the rolling buffer (upper bound for "in N days" windows)
+MAX_WINDOW_DAYS = 120
+# Days used to estimate consumption for "below N days of consumption"
+CONSUMPTION_WINDOW_DAYS = 7
+
+_OPS: Dict[str, Callable[[np.ndarray, float], np.ndarray]] = {
+    "<": np.less, "<=": np.less_equal, ">": np.greater, ">=": np.greater_equal,
+    "==": np.equal, "!=": np.not_equal,
+}
+
+_NUM = r"(-?[\d,]*\.?\d+(?:e-?\d+)?)\s*([kmb]?)"
+_RE_COMPARE = re.compile(rf"^(?P<sel>.+?)\s*(?P<op><=|>=|==|!=|<|>)\s*{_NUM}$", re.I)
+_RE_CHANGE = re.compile(rf"^(?P<sel>.+?)\s+(?P<dir>drops|falls|rises|grows)\s+{_NUM}\s*%\s+in\s+(?P<days>\d+)\s+days?$", re.I)
+_RE_RUNWAY = re.compile(rf"^(?P<sel>.+?)\s+below\s+{_NUM}\s+days?\s+of\s+consumption$", re.I)
+
+_SUFFIX = {"": 1.0, "k": 1e3, "m": 1e6, "b": 1e9}
+
+
+class RuleError(ValueError):
+    """Raised when a rule line cannot be parsed."""
+
+
+# ============================================================
+# ROLLING DAILY BUFFER
+# ============================================================
+
+class DailyWindow:
+    """Fixed-size ring buffer holding one snapshot row per game day."""
+
+    def __init__(self, width: int, capacity: int = MAX_WINDOW_DAYS + 1):
+        self.capacity = capacity
+        self.rows = np.full((capacity, width), np.nan)
+        self.head = -1
+        self.count = 0
+
+    def push(self, row: np.ndarray):
+        self.head = (self.head + 1) % self.capacity
+        self.rows[self.head] = row
+        self.count = min(self.count + 1, self.capacity)
+
+    def ago(self, days: int) -> Optional[np.ndarray]:
+        """Row recorded `days` days before the latest one, or None if not yet available."""
+        if days >= self.count:
+            return None
+        return self.rows[(self.head - days) % self.capacity]
+
+
+# ============================================================
+# COMPILATION
+# ============================================================
+
+@dataclass
+class CompiledRule:
+    text: str
+    indices: np.ndarray
+    check: Callable[[np.ndarray, DailyWindow], np.ndarray]  # -> bool mask over `indices`
+    armed: np.ndarray = field(default=None)
+
+    def __post_init__(self):
+        if self.armed is None:
+            self.armed = np.ones(len(self.indices), dtype=bool)
+
+
+@dataclass
+class Alert:
+    rule: str
+    variable: str
+    value: float
+    date: str
+    timestamp: float
+
+    @property
+    def message(self) -> str:
+        return f"{self.rule}  →  {self.variable} = {self.value:,.2f} ({self.date})"
+
+
+def _parse_number(num: str, suffix: str) -> float:
+    return float(num.replace(",", "")) * _SUFFIX[suffix.lower()]
+
+
+def _resolve_selector(sel: str) -> np.ndarray:
+    sel = sel.strip()
+    if sel.startswith("[") and sel.endswith("]"):
+        wanted = sel[1:-1].strip().lower()
+        for category, cols in REGISTRY.categories().items():
+            if category.lower() == wanted:
+                idx = [VAR_INDEX[c] for c in cols if c in VAR_INDEX]
+                if idx:
+                    return np.array(idx, dtype=np.intp)
+        raise RuleError(f"Unknown category: {sel}")
+
+    for name, i in VAR_INDEX.items():
+        if name.lower() == sel.lower():
+            return np.array([i], dtype=np.intp)
+    raise RuleError(f"Unknown variable: {sel}")
+
+
+def compile_rule(text: str) -> CompiledRule:
+    """Compile one rule line. Raises RuleError on bad syntax or unknown names."""
+    line = " ".join(text.split())
+
+    m = _RE_CHANGE.match(line)
+    if m:
+        idx = _resolve_selector(m["sel"])
+        pct = _parse_number(m[3], m[4]) / 100.0
+        days = int(m["days"])
+        if not 0 < days <= MAX_WINDOW_DAYS:
+            raise RuleError(f"Window must be 1-{MAX_WINDOW_DAYS} days: {text}")
+        falling = m["dir"].lower() in ("drops", "falls")
+
+        def check(snap, window, idx=idx, pct=pct, days=days, falling=falling):
+            past = window.ago(days)
+            if past is None:
+                return np.zeros(len(idx), dtype=bool)
+            now, then = snap[idx], past[idx]
+            with np.errstate(divide="ignore", invalid="ignore"):
+                change = (now - then) / np.abs(then)
+            return (change <= -pct) if falling else (change >= pct)
+
+        return CompiledRule(line, idx, check)
+
+    m = _RE_RUNWAY.match(line)
+    if m:
+        idx = _resolve_selector(m["sel"])
+        runway = _parse_number(m[2], m[3])
+        span = CONSUMPTION_WINDOW_DAYS
+
+        def check(snap, window, idx=idx, runway=runway, span=span):
+            if window.count < 2:
+                return np.zeros(len(idx), dtype=bool)
+            days = min(span, window.count - 1)
+            past = window.ago(days)
+            burn = (past[idx] - snap[idx]) / days  # stock consumed per day
+            with np.errstate(invalid="ignore"):
+                return (burn > 0) & (snap[idx] < burn * runway)
+
+        return CompiledRule(line, idx, check)
+
+    m = _RE_COMPARE.match(line)
+    if m:
+        idx = _resolve_selector(m["sel"])
+        op = _OPS[m["op"]]
+        threshold = _parse_number(m[3], m[4])
+
+        def check(snap, window, idx=idx, op=op, threshold=threshold):
+            return op(snap[idx], threshold)
+
+        return CompiledRule(line, idx, check)
+
+    raise RuleError(f"Cannot parse rule: {text}")
+
+
+def compile_rules(lines: List[str]) -> Tuple[List[CompiledRule], List[str]]:
+    """Compile every non-empty, non-comment line. Returns (rules, errors)."""
+    rules, errors = [], []
+    for line in lines:
+        if not line.strip() or line.strip().startswith("#"):
+            continue
+        try:
+            rules.append(compile_rule(line))
+        except RuleError as e:
+            errors.append(str(e))
+    return rules, errors
+
+
+# ============================================================
+# ENGINE
+# ============================================================
+
+class AlertEngine:
+    """
+    Per-session rule evaluator. Feed it every snapshot; pass `new_day=True`
+    when the game date advanced so the daily window gets a new row.
+    """
+
+    def __init__(self, lines: List[str]):
+        self.rules, self.errors = compile_rules(lines)
+        for err in self.errors:
+            logger.warning(f"Alert rule ignored: {err}")
+        self.window = DailyWindow(len(ALERT_VARIABLES))
+        self._snap = np.full(len(ALERT_VARIABLES), np.nan)
+
+    def __bool__(self):
+        return bool(self.rules)
+
+    def _to_array(self, data: dict) -> np.ndarray:
+        snap = self._snap
+        get = data.get
+        for i, name in enumerate(ALERT_VARIABLES):
+            v = get(name)
+            snap[i] = np.nan if v is None else v
+        return snap
+
+    def evaluate(self, data: dict, date_str: str, new_day: bool = False) -> List[Alert]:
+        snap = self._to_array(data)
+        if new_day or self.window.count == 0:
+            self.window.push(snap)
+
+        fired: List[Alert] = []
+        now = time.time()
+        for rule in self.rules:
+            mask = rule.check(snap, self.window)
+            edge = mask & rule.armed
+            rule.armed = ~mask
+            if edge.any():
+                for i in rule.indices[edge]:
+                    fired.append(Alert(rule.text, ALERT_VARIABLES[i], float(snap[i]), date_str, now))
+        return fired
@@ -4,6 +4,8 @@ import pandas as pd
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
 from matplotlib.figure import Figure
+from matplotlib.cm import ScalarMappable
+from matplotlib.colors import Normalize
 from matplotlib.widgets import CheckButtons, Button
 import matplotlib.dates as mdates
 from pathlib import Path
@@ -11,10 +13,26 @@ import os
 import sys
 import numpy as np
 import datetime
+import threading
+import codecs
+import io
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 # Ensure local imports
 sys.path.append(str(Path(__file__).parent))
-from data_logger import get_existing_logs
+from data_logger import get_existing_logs, ALL_POSSIBLE_COLUMNS
+from variable_registry import REGISTRY
+from log_pipeline import LogPipeline, LogTailer
+from rollups import RollupIndex
+from campaign_compare import align_metrics, MAX_CAMPAIGNS
+from derived_metrics import derived_categories, derived_with_format, resource_columns
+from anomaly import scan as scan_anomalies
+from forecasting import FORECAST_MODELS, FORECAST_HORIZONS
+from downsampling import ViewportDownsampler
+from blitting import BlitManager
+from virtual_table import VirtualTable
+from intraday_capture import list_captures, load_capture
 
 # ---- THEMES: PAPER DOSSIER & NIGHT OPS ----
 
@@ -58,38 +76,15 @@ plt.rcParams.update({
 BASE_DIR = Path.home() / "Documents" / "SR2030_Logger"
 LOGS_DIR = BASE_DIR / "logs"
 
-# ---- CATEGORY MAP ----
-CATEGORY_MAP = {
-    "Economy": ["GameDate", "Treasury", "Credit Rating", "Inflation", "Unemployment", "GDP/c", "Bond Debt"],
-    "Resources - Stock": ["GameDate", "Agriculture", "Rubber", "Timber", "Petroleum", "Coal", "Metal Ore",
-                          "Uranium", "Electric Power", "Consumer Goods", "Industry Goods", "Military Goods"],
-    "Resources - Production Costs": ["GameDate", "Agriculture Production Cost", "Rubber Production Cost",
-                                     "Timber Production Cost", "Petroleum Production Cost", "Coal Production Cost",
-                                     "Metal Ore Production Cost", "Uranium Production Cost",
-                                     "Electric Power Production Cost", "Consumer Goods Production Cost",
-                                     "Industry Goods Production Cost", "Military Goods Production Cost"],
-    "Resources - Market Prices": ["GameDate", "Agriculture Market Price", "Rubber Market Price",
-                                  "Timber Market Price", "Petroleum Market Price", "Coal Market Price",
-                                  "Metal Ore Market Price", "Uranium Market Price", "Electric Power Market Price",
-                                  "Consumer Goods Market Price", "Industry Goods Market Price",
-                                  "Military Goods Market Price"],
-    "Resources - Trades": ["GameDate", "Agriculture Trades", "Rubber Trades", "Timber Trades", "Petroleum Trades",
-                           "Coal Trades", "Metal Ore Trades", "Uranium Trades", "Electric Power Trades",
-                           "Consumer Goods Trades", "Industry Goods Trades", "Military Goods Trades"],
-    "Demographics": ["GameDate", "Population", "Emigration", "Immigration", "Births", "Deaths", "Tourism"],
-    "Politics & Military": ["GameDate", "Domestic Approval", "Military Approval", "Literacy", "Treaty Integrity",
-                            "Subsidy Rate", "Active Personnel", "Reserve Personnel"],
-    "Research": ["GameDate", "Research Efficiency"],
-}
+# ---- CATEGORY MAP (from the variable registry) ----
+CATEGORY_MAP = {cat: ["GameDate"] + names for cat, names in REGISTRY.categories().items()}
+CATEGORY_MAP.update({cat: ["GameDate"] + names for cat, names in derived_categories().items()})
 
 # ---- FORMATTING ----
-PERCENT_COLS = {
-    "Domestic Approval", "Military Approval", "Inflation", "Unemployment",
-    "Research Efficiency", "Subsidy Rate", "Treaty Integrity",
-    "Credit Rating", "Tourism", "Literacy"
-}
-MILLION_COLS = {"Treasury", "Bond Debt"}
-THOUSAND_COLS = {"Population", "Active Personnel", "Reserve Personnel"}
+PERCENT_COLS = REGISTRY.with_format("percent")
+MILLION_COLS = REGISTRY.with_format("million")
+THOUSAND_COLS = REGISTRY.with_format("thousand")
+MONEY_COLS = derived_with_format("money")
 
 META_COLS = {
     "Timestamp", "Game Date", "GameDate", "GameDate_str",
@@ -97,43 +92,143 @@ META_COLS = {
 }
 
 
+def _column_format(col: str):
+    """(format, scale) shared by every number of a column"""
+    if col in MILLION_COLS:
+        return "{:,.2f} M", 1e-6
+    if col in THOUSAND_COLS:
+        return "{:,.1f} K", 1e-3
+    if col in PERCENT_COLS:
+        return "{:.1f}%", 100.0
+    if col in MONEY_COLS:
+        return "${:,.2f}", 1.0
+    if "Trades" in col:
+        return "{:,.0f}", 1.0
+    if "Price" in col or "Cost" in col or "GDP/c" in col:
+        return "${:,.2f}", 1.0
+    return "{:,.0f}", 1.0
+
+
 def _format_value(col: str, val):
     if pd.isna(val):
         return ""
     if isinstance(val, (int, float)):
-        if col in MILLION_COLS:
-            return f"{val/1_000_000:,.2f} M"
-        if col in THOUSAND_COLS:
-            return f"{val/1_000:,.1f} K"
-        if col in PERCENT_COLS:
-            return f"{val*100:.1f}%"
-        if "Trades" in col:
-            return f"{val:,.0f}"
-        if "Price" in col or "Cost" in col or "GDP/c" in col:
-            return f"${val:,.2f}"
-        return f"{val:,.0f}"
+        fmt, scale = _column_format(col)
+        return fmt.format(val * scale)
     if isinstance(val, pd.Timestamp):
         return val.strftime('%Y-%m-%d')
     return str(val)
 
 
+def _format_column(col: str, values: np.ndarray) -> list:
+    """_format_value over a whole numeric array: the rule is picked once, scaling is vectorized"""
+    fmt, scale = _column_format(col)
+    scaled = values.astype(float) * scale
+    return [fmt.format(v) if v == v else "" for v in scaled.tolist()]
+
+
 def _resource_names_from_stock():
     return ["Agriculture", "Rubber", "Timber", "Petroleum", "Coal", "Metal Ore",
             "Uranium", "Electric Power", "Consumer Goods", "Industry Goods", "Military Goods"]
 
 
 def _cols_for_resource(res_name: str):
-    return {
-        "stock": res_name,
-        "cost": f"{res_name} Production Cost",
-        "price": f"{res_name} Market Price",
-        "trades": f"{res_name} Trades"
-    }
+    return resource_columns(res_name)
+
+
+# ---- LOG LOADING ----
+CATEGORICAL_COLS = {"GameName", "Nation", "Game Name", "Game Version"}
+LOAD_CHUNK_ROWS = 20000
+SNIFF_BYTES = 4096
+
+
+def sniff_encoding(path: str, nbytes: int = SNIFF_BYTES) -> str:
+    """Guess the file encoding from its first few KB (BOM, then strict UTF-8, else cp1252/latin-1)"""
+    with open(path, "rb") as f:
+        head = f.read(nbytes)
+
+    if head.startswith(codecs.BOM_UTF8):
+        return "utf-8-sig"
+    try:
+        head.decode("utf-8")
+        return "utf-8"
+    except UnicodeDecodeError as e:
+        # A multi-byte character cut by the sniff window is still UTF-8
+        if e.start >= len(head) - 3 and e.reason == "unexpected end of data":
+            return "utf-8"
+    try:
+        head.decode("cp1252")
+        return "cp1252"
+    except UnicodeDecodeError:
+        return "latin-1"
+
+
+def _log_dtypes(header: list) -> dict:
+    """Explicit dtypes from the known log schema: float32 metrics, string metadata"""
+    dtypes = {}
+    for col in header:
+        name = col.strip()
+        var = REGISTRY.by_name.get(name)
+        if var is not None:
+            # Doubles (Treasury) keep full precision; float32 would round billions
+            dtypes[col] = "float64" if var.type == "double" else "float32"
+        elif name in CATEGORICAL_COLS or name in META_COLS:
+            dtypes[col] = "string"
+    return dtypes
+
+
+def _compact_columns(df: pd.DataFrame) -> pd.DataFrame:
+    for col in df.columns:
+        if col.strip() in CATEGORICAL_COLS:
+            df[col] = df[col].astype("category")
+        elif df[col].dtype == np.float64 and col.strip() not in REGISTRY.by_name:
+            # Columns outside the registry (older/newer logs): halve them too
+            df[col] = df[col].astype(np.float32)
+    return df
+
+
+def load_log_csv(path: str, progress=None):
+    """
+    Read a log CSV in chunks with explicit dtypes.
+    Returns (df, tailer): the tailer starts right after the last complete line,
+    so a row being written during the load is picked up by live mode instead.
+    `progress(fraction)` is called after every chunk (from the calling thread).
+    """
+    encoding = sniff_encoding(path)
+    with open(path, "rb") as f:
+        data = f.read()
+    end = data.rfind(b"\n") + 1 or len(data)
+    total = max(1, end)
+
+    buf = io.BytesIO(data[:end])
+    header = pd.read_csv(buf, nrows=0, encoding=encoding).columns.tolist()
+    buf.seek(0)
+    reader = pd.read_csv(buf, encoding=encoding, dtype=_log_dtypes(header), chunksize=LOAD_CHUNK_ROWS)
+    chunks = []
+    for chunk in reader:
+        chunks.append(chunk)
+        if progress:
+            progress(min(1.0, buf.tell() / total))
+
+    df = pd.concat(chunks, ignore_index=True) if chunks else pd.DataFrame(columns=header)
+    return _compact_columns(df), LogTailer(path, end, header=header, encoding=encoding)
+
+
+def read_log_csv(path: str, progress=None) -> pd.DataFrame:
+    return load_log_csv(path, progress)[0]
 
 
-def prepare_dataframe(df: pd.DataFrame) -> pd.DataFrame:
-    """Normalizza il dataframe"""
-    df = df.copy()
+def parse_log_rows(tailer: LogTailer, data: bytes) -> pd.DataFrame:
+    """Parse header-less CSV lines returned by LogTailer.poll()"""
+    df = pd.read_csv(io.BytesIO(data), header=None, names=tailer.header,
+                     encoding=tailer.encoding, dtype=_log_dtypes(tailer.header))
+    return _compact_columns(df)
+
+
+def prepare_dataframe(df: pd.DataFrame, copy: bool = True) -> pd.DataFrame:
+    """Normalizza il dataframe (copy=False lavora in place sul frame appena caricato)"""
+    if copy:
+        df = df.copy()
     df.columns = [c.strip() for c in df.columns]
 
     if "Game Date" in df.columns and "GameDate" not in df.columns:
@@ -148,9 +243,13 @@ def prepare_dataframe(df: pd.DataFrame) -> pd.DataFrame:
             df["GameDate"] = range(1, len(df) + 1)
 
     try:
-        df["GameDate"] = pd.to_datetime(df["GameDate"], errors="coerce")
+        raw_dates = df["GameDate"]
+        # Logger format first (fast path), then free-form, then unix seconds
+        df["GameDate"] = pd.to_datetime(raw_dates, format="%Y-%m-%d", errors="coerce")
         if df["GameDate"].isna().all():
-            df["GameDate"] = pd.to_datetime(df["GameDate"], unit='s', errors='coerce')
+            df["GameDate"] = pd.to_datetime(raw_dates, errors="coerce")
+        if df["GameDate"].isna().all():
+            df["GameDate"] = pd.to_datetime(raw_dates, unit='s', errors='coerce')
     except Exception:
         pass
 
@@ -170,6 +269,60 @@ def prepare_dataframe(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
+# ---- LOADED LOG CACHE (shared by the main view and campaign comparison) ----
+MAX_CACHED_LOGS = 12
+_loaded_logs: "OrderedDict[str, tuple]" = OrderedDict()
+_loaded_lock = threading.Lock()
+
+
+def load_pipeline(path: str, progress=None):
+    """
+    (df, pipeline, tailer) for a log, reusing the last load while the file is
+    unchanged (same size and mtime). Safe to call from worker threads.
+    """
+    path = str(path)
+    st = os.stat(path)
+    key = (st.st_size, st.st_mtime_ns)
+    with _loaded_lock:
+        hit = _loaded_logs.get(path)
+        if hit and hit[0] == key:
+            _loaded_logs.move_to_end(path)
+            return hit[1:]
+
+    df, tailer = load_log_csv(path, progress=progress)
+    df = prepare_dataframe(df, copy=False)
+    empty = df.columns[df.isna().all()]
+    if len(empty):
+        df.drop(columns=empty, inplace=True)
+    try:
+        rollups = RollupIndex(path)
+        rollups.update()  # incremental: only rows added since the last index
+    except Exception as e:
+        print(f"⚠️ Rollups unavailable for {os.path.basename(path)}: {e}")
+        rollups = None
+    pipeline = LogPipeline(df, log_key=path, rollups=rollups)
+
+    with _loaded_lock:
+        _loaded_logs[path] = (key, df, pipeline, tailer)
+        while len(_loaded_logs) > MAX_CACHED_LOGS:
+            _loaded_logs.popitem(last=False)
+    return df, pipeline, tailer
+
+
+# ---- LIVE MODE ----
+LIVE_POLL_MS = 1000
+LIVE_HEADROOM = 0.10   # x-axis room kept past the last point so new rows can be blitted
+
+
+def _active_session_logs() -> list:
+    """CSVs written by running sessions of this process (analytics opened from the launcher)"""
+    sessions = sys.modules.get("logging_session")
+    if sessions is None:
+        return []
+    paths = sessions.SESSIONS.active_paths()
+    return [str(p) for p in paths]
+
+
 # ---- MAIN APP ----
 class AnalyticsApp:
     def __init__(self, root):
@@ -183,15 +336,28 @@ class AnalyticsApp:
         self.style = ttk.Style()
 
         self.df = None
+        self.pipeline = None  # memoized year/granularity views of self.df
         self.selected_log = None
         self.metric_vars = {}
         self.time_granularity = tk.StringVar(value="auto")
         self.logs = []
         self.log_files_map = {}
+        self._load_token = 0  # bumps on every load; stale worker results are dropped
+
+        # Live tail state
+        self.live_var = tk.BooleanVar(value=False)
+        self._tailer = None
+        self._live_job = None
+        self._blit = None
 
         # Matplotlib figure will be created in setup_ui
         self.fig = None
         self.ax = None
+        self._downsampler = None  # re-reduces the embedded chart on zoom/pan
+        self._layout_done = False  # tight_layout runs on resize, not on every refresh
+        self._shown_level = "day"  # aggregation level on screen ("auto" resolves per zoom)
+        self._event_marker = None  # vertical line of the last anomaly jumped to
+        self._forecast_artists = []  # bands and dashed lines past the last row
 
         self._configure_theme()   # configure base ttk theme
         self.setup_ui()
@@ -306,7 +472,6 @@ class AnalyticsApp:
             self.ax.grid(color=theme["grid_color"], alpha=0.4)
 
             if hasattr(self, "canvas_mpl"):
-                self.fig.tight_layout()
                 self.canvas_mpl.draw_idle()
 
     def toggle_theme(self):
@@ -335,6 +500,7 @@ class AnalyticsApp:
         btn_frame.pack(fill=tk.X, pady=(0, 5))
         ttk.Button(btn_frame, text="🔄 Refresh", command=self.load_logs).pack(side=tk.LEFT, padx=(0, 5))
         ttk.Button(btn_frame, text="📂 Open CSV...", command=self._open_csv_dialog).pack(side=tk.LEFT)
+        ttk.Button(btn_frame, text="⏱ Intraday...", command=self.show_intraday_captures).pack(side=tk.LEFT, padx=(5, 0))
 
         self.log_listbox = tk.Listbox(logs_frame, font=('Courier New', 10), activestyle="none")
         self.log_listbox.pack(fill=tk.BOTH, expand=True)
@@ -343,6 +509,13 @@ class AnalyticsApp:
         self.log_listbox.configure(yscrollcommand=log_scroll.set)
         self.log_listbox.bind("<<ListboxSelect>>", self.on_log_select)
 
+        # Loading indicator (shown only while a log loads in the background)
+        self.load_frame = ttk.Frame(logs_frame)
+        self.load_label = ttk.Label(self.load_frame, text="", font=('Courier New', 9))
+        self.load_label.pack(anchor="w")
+        self.load_progress = ttk.Progressbar(self.load_frame, mode="determinate", maximum=100)
+        self.load_progress.pack(fill=tk.X)
+
         # Page & Metrics section
         page_frame = ttk.LabelFrame(left, text=" VIEW & METRICS ", padding=5)
         page_frame.pack(fill=tk.BOTH, expand=True)
@@ -383,6 +556,25 @@ class AnalyticsApp:
         self.year_menu.pack(anchor="w", pady=(0, 10))
         self.year_var.trace_add('write', self.update_display)
 
+        ttk.Label(page_frame, text="Forecast:").pack(anchor="w", pady=(0, 2))
+        forecast_frame = ttk.Frame(page_frame)
+        forecast_frame.pack(fill=tk.X, pady=(0, 10))
+        self.forecast_var = tk.StringVar(value="Off")
+        self.forecast_menu = ttk.Combobox(
+            forecast_frame, textvariable=self.forecast_var, state="disabled", width=10,
+            values=["Off"] + [m.title() for m in FORECAST_MODELS]
+        )
+        self.forecast_menu.pack(side=tk.LEFT)
+        self.horizon_var = tk.StringVar(value=str(FORECAST_HORIZONS[1]))
+        self.horizon_menu = ttk.Combobox(
+            forecast_frame, textvariable=self.horizon_var, state="disabled", width=5,
+            values=[str(h) for h in FORECAST_HORIZONS]
+        )
+        self.horizon_menu.pack(side=tk.LEFT, padx=(5, 2))
+        ttk.Label(forecast_frame, text="days").pack(side=tk.LEFT)
+        self.forecast_var.trace_add('write', self.update_display)
+        self.horizon_var.trace_add('write', self.update_display)
+
         # Metrics checkboxes
         metrics_outer = ttk.LabelFrame(page_frame, text=" METRICS ", padding=5)
         metrics_outer.pack(fill=tk.BOTH, expand=True, pady=(0, 5))
@@ -473,6 +665,7 @@ class AnalyticsApp:
         self.canvas_mpl = FigureCanvasTkAgg(self.fig, master=chart_frame)
         self.canvas_widget = self.canvas_mpl.get_tk_widget()
         self.canvas_widget.pack(fill=tk.BOTH, expand=True)
+        self.canvas_mpl.mpl_connect("resize_event", lambda _e: self.fig.tight_layout())
 
         toolbar_frame = ttk.Frame(chart_frame)
         toolbar_frame.pack(side=tk.BOTTOM, fill=tk.X)
@@ -499,6 +692,28 @@ class AnalyticsApp:
         )
         self.resource_btn.pack(side=tk.LEFT, padx=6)
 
+        ttk.Button(
+            btn_frame,
+            text="🗂 Compare Campaigns",
+            command=self.show_campaign_comparison
+        ).pack(side=tk.LEFT, padx=6)
+
+        self.anomaly_btn = ttk.Button(
+            btn_frame,
+            text="⚠ Anomalies",
+            command=self.show_anomalies,
+            state="disabled"
+        )
+        self.anomaly_btn.pack(side=tk.LEFT, padx=6)
+
+        self.correlation_btn = ttk.Button(
+            btn_frame,
+            text="🔗 Correlations",
+            command=self.show_correlations,
+            state="disabled"
+        )
+        self.correlation_btn.pack(side=tk.LEFT, padx=6)
+
         self.export_btn = ttk.Button(
             btn_frame,
             text="💾 Export Plot",
@@ -507,18 +722,30 @@ class AnalyticsApp:
         )
         self.export_btn.pack(side=tk.LEFT, padx=6)
 
+        self.live_chk = ttk.Checkbutton(
+            btn_frame,
+            text="🔴 Live",
+            variable=self.live_var,
+            command=self._toggle_live,
+            state="disabled"
+        )
+        self.live_chk.pack(side=tk.LEFT, padx=6)
+        self.root.bind("<Destroy>", lambda e: e.widget is self.root and self._stop_live(), add="+")
+
         # Table section
-        table_frame = ttk.LabelFrame(right, text=" LAST 20 ENTRIES (INTEL FEED) ", padding=5)
+        table_frame = ttk.LabelFrame(right, text=" FULL HISTORY (INTEL FEED) ", padding=5)
         table_frame.pack(fill=tk.X, padx=10, pady=(0, 10))
         table_frame.configure(height=250)
 
         self.tree = ttk.Treeview(table_frame, show='headings', height=10)
         vsb = ttk.Scrollbar(table_frame, orient="vertical", command=self.tree.yview)
         hsb = ttk.Scrollbar(table_frame, orient="horizontal", command=self.tree.xview)
-        self.tree.configure(yscrollcommand=vsb.set, xscrollcommand=hsb.set)
+        self.tree.configure(xscrollcommand=hsb.set)
         vsb.pack(side='right', fill='y')
         hsb.pack(side='bottom', fill='x')
         self.tree.pack(fill='both', expand=True)
+        # Whole filtered history, sortable by heading; only the visible rows are formatted
+        self.table = VirtualTable(self.tree, vsb, _format_column)
 
         ttk.Separator(right, orient='horizontal').pack(fill=tk.X, pady=10)
         self.footer_label = ttk.Label(
@@ -554,24 +781,43 @@ class AnalyticsApp:
             self._load_log_from_path(path)
 
     def _load_log_from_path(self, path: str):
-        """Carica un log da un percorso specifico"""
-        try:
-            encodings = ['utf-8', 'utf-8-sig', 'latin-1', 'cp1252', 'iso-8859-1']
-            df = None
-            for encoding in encodings:
-                try:
-                    df = pd.read_csv(path, encoding=encoding)
-                    break
-                except (UnicodeDecodeError, KeyError):
-                    continue
+        """Carica un log da un percorso specifico (in background, con barra di avanzamento)"""
+        self._load_token += 1
+        token = self._load_token
+
+        self.load_label.config(text=f"Loading {os.path.basename(path)}...")
+        self.load_progress["value"] = 0
+        self.load_frame.pack(side=tk.BOTTOM, fill=tk.X, pady=(5, 0))
 
-            if df is None:
-                df = pd.read_csv(path)
+        def report(fraction):
+            self.root.after(0, lambda: token == self._load_token and self.load_progress.config(value=fraction * 100))
 
-            df = prepare_dataframe(df)
-            df = df.dropna(axis=1, how='all').sort_values('GameDate')
+        def worker():
+            try:
+                df, pipeline, tailer = load_pipeline(path, progress=report)
+                self.root.after(0, lambda: self._on_log_loaded(token, path, df, pipeline, tailer))
+            except Exception as e:
+                self.root.after(0, lambda e=e: self._on_log_failed(token, e))
+
+        threading.Thread(target=worker, daemon=True).start()
+
+    def _on_log_failed(self, token: int, error: Exception):
+        if token != self._load_token:
+            return
+        self.load_frame.pack_forget()
+        messagebox.showerror("Load Error", f"Cannot read log file:\n{error}")
 
+    def _on_log_loaded(self, token: int, path: str, df: pd.DataFrame, pipeline: LogPipeline,
+                       tailer: LogTailer = None):
+        """UI thread: install a freshly loaded frame"""
+        if token != self._load_token:
+            return
+        self.load_frame.pack_forget()
+        try:
+            self._stop_live(keep_toggle=True)
             self.df = df
+            self.pipeline = pipeline
+            self._tailer = tailer
 
             basename = os.path.basename(path)
             self.selected_log = {
@@ -586,18 +832,25 @@ class AnalyticsApp:
             # Enable controls
             self.category_menu.config(state="readonly")
             self.year_menu.config(state="readonly")
+            self.forecast_menu.config(state="readonly")
+            self.horizon_menu.config(state="readonly")
             self.interactive_btn.config(state="normal")
             self.export_btn.config(state="normal")
+            self.anomaly_btn.config(state="normal")
+            self.correlation_btn.config(state="normal")
+            self.live_chk.config(state="normal" if tailer else "disabled")
 
             for rb in self.granularity_radios:
                 rb.config(state="normal")
 
-            years = ["All"] + sorted([str(y) for y in df['GameDate'].dt.year.unique()])
+            years = ["All"] + [str(y) for y in pipeline.years()]
             self.year_menu['values'] = years
             self.year_var.set("All")
 
             self._rebuild_metrics_checkboxes()
             self.update_display()
+            if self.live_var.get():
+                self._start_live()
 
             # Add to list if not present
             if basename not in self.log_listbox.get(0, tk.END):
@@ -648,7 +901,8 @@ class AnalyticsApp:
         if self.df is None:
             return []
         cols = CATEGORY_MAP.get(self.category_var.get(), [])
-        return [c for c in cols if c != 'GameDate' and c in self.df.columns]
+        available = set(self.pipeline.columns)  # logged + derived
+        return [c for c in cols if c != 'GameDate' and c in available]
 
     def _rebuild_metrics_checkboxes(self):
         for child in self.metrics_inner.winfo_children():
@@ -674,41 +928,31 @@ class AnalyticsApp:
             var.set(state)
         self.update_display()
 
-    def _apply_time_granularity(self, df: pd.DataFrame) -> pd.DataFrame:
-        gran = self.time_granularity.get()
-        if gran in ("auto", "day"):
-            return df
-
-        df = df.copy()
-        if "GameDate" not in df.columns:
-            return df
-
-        df = df.set_index("GameDate")
-
-        for col in df.columns:
-            try:
-                df[col] = pd.to_numeric(df[col])
-            except Exception:
-                pass
-
-        numeric_cols = df.select_dtypes(include=["number"]).columns
-        df_num = df[numeric_cols]
+    def _view_granularity(self, span_days=None) -> str:
+        """Selected level; "auto" picks the coarsest rollup that still fills the span"""
+        granularity = self.time_granularity.get()
+        if granularity == "auto":
+            return self.pipeline.auto_granularity(self.year_var.get(), span_days)
+        return granularity
 
-        try:
-            if gran == "week":
-                df_res = df_num.resample("W").mean()
-            elif gran == "month":
-                df_res = df_num.resample("MS").mean()
-            elif gran == "year":
-                df_res = df_num.resample("YS").mean()
-            else:
-                return df.reset_index()
-        except Exception:
-            return df.reset_index()
+    def _current_view(self) -> pd.DataFrame:
+        """Year-filtered, resampled frame for the current controls (cached, read-only)"""
+        return self.pipeline.view(self.year_var.get(), self._view_granularity())
 
-        df_res = df_res.reset_index()
-        df_res["GameDate_str"] = df_res["GameDate"].dt.strftime("%Y-%m-%d")
-        return df_res
+    def _on_auto_zoom(self, ax):
+        """Auto scale: swap the lines to a finer/coarser level when the zoom changes"""
+        if self.time_granularity.get() != "auto" or not self._downsampler:
+            return
+        x0, x1 = ax.get_xlim()
+        level = self._view_granularity(span_days=x1 - x0)
+        if level == self._shown_level:
+            return
+        self._shown_level = level
+        view = self.pipeline.view(self.year_var.get(), level)
+        for s in self._downsampler.series:
+            col = s.line.get_label()
+            if col in view.columns:
+                self._downsampler.set_series(s.line, view["GameDate"], view[col])
 
     def _setup_time_axis(self, dates):
         granularity = self.time_granularity.get()
@@ -746,17 +990,18 @@ class AnalyticsApp:
 
         theme = self._current_theme()
 
-        temp_df = self.df.copy()
-        if self.year_var.get() != "All":
-            temp_df = temp_df[temp_df['GameDate'].dt.year == int(self.year_var.get())]
-
-        temp_df = self._apply_time_granularity(temp_df)
+        self._shown_level = self._view_granularity()
+        temp_df = self.pipeline.view(self.year_var.get(), self._shown_level)
 
         selected = [name for name, var in self.metric_vars.items() if var.get()]
 
         # Update plot
         self.ax.clear()
         self.ax.set_facecolor(theme["plot_bg"])
+        self._forecast_artists = []
+        if self._downsampler:
+            self._downsampler.disconnect()
+        self._downsampler = ViewportDownsampler(self.ax)
 
         # line colors: intel palette
         colors = ['#004400', '#550000', '#0A1A3A', '#556B2F', '#B36B00', '#808080', '#AA8800', '#333366']
@@ -769,11 +1014,16 @@ class AnalyticsApp:
             for i, col in enumerate(selected):
                 if col in temp_df.columns:
                     try:
-                        y = pd.to_numeric(temp_df[col], errors="coerce")
+                        y = temp_df[col]
                         color = colors[i % len(colors)]
-                        self.ax.plot(x, y, label=col, color=color, linewidth=1.5, alpha=0.85, marker='o', markersize=3)
+                        line, = self.ax.plot(x.iloc[:1], y.iloc[:1], label=col, color=color,
+                                             linewidth=1.5, alpha=0.85, marker='o', markersize=3)
+                        self._downsampler.add(line, x, y)
                     except Exception:
                         continue
+            self._draw_forecasts()
+            # Connected once every line is in, so a level swap covers all of them
+            self.ax.callbacks.connect("xlim_changed", self._on_auto_zoom)
 
             self.ax.set_xlabel("Game Date", color=theme["fg"])
             self.ax.set_ylabel("Value", color=theme["fg"])
@@ -799,32 +1049,178 @@ class AnalyticsApp:
                     legend.get_frame().set_edgecolor("#555555")
                     legend.get_frame().set_alpha(0.95)
 
-        self.fig.tight_layout()
+        if self._live_job is not None:
+            self._setup_blit()
+            self._live_headroom()
+        if not self._layout_done and selected:
+            self.fig.tight_layout()
+            self._layout_done = True
         self.canvas_mpl.draw()
 
         # Update table
-        self.tree.delete(*self.tree.get_children())
         if selected:
-            last_rows = temp_df.tail(20)
-            cols = ["GameDate_str"] + selected
-
-            self.tree["columns"] = cols
-            self.tree["show"] = "headings"
-
-            for c in cols:
-                header = "GameDate" if c == "GameDate_str" else c
-                self.tree.heading(c, text=header)
-                width = max(100, min(200, len(header) * 8 + 20))
-                self.tree.column(c, width=width, anchor="center")
-
-            for _, row in last_rows.iterrows():
-                values = []
-                for c in cols:
-                    if c == "GameDate_str":
-                        values.append(row.get("GameDate_str", ""))
-                    else:
-                        values.append(_format_value(c, row.get(c, "")))
-                self.tree.insert("", "end", values=values)
+            cols = ["GameDate_str"] + [c for c in selected if c in temp_df.columns]
+            self.table.set_frame(temp_df, cols, headers={"GameDate_str": "GameDate"})
+        else:
+            self.table.clear()
+
+    def _draw_forecasts(self):
+        """Dashed projection and shaded band after the last row of each plotted line"""
+        for artist in self._forecast_artists:
+            if artist.axes is self.ax:
+                artist.remove()
+        self._forecast_artists = []
+
+        model = self.forecast_var.get().lower()
+        if model not in FORECAST_MODELS or not self._downsampler:
+            return
+        year = self.year_var.get()
+        if year != "All" and int(year) != self.pipeline.years()[-1]:
+            return  # the projection starts after the last row, outside this year
+
+        lines = {s.line.get_label(): s.line for s in self._downsampler.series}
+        forecasts = self.pipeline.forecast(list(lines), model, int(self.horizon_var.get()))
+        for col, fc in forecasts.items():
+            color = lines[col].get_color()
+            band = self.ax.fill_between(fc["GameDate"], fc["Lower"], fc["Upper"],
+                                        color=color, alpha=0.15, linewidth=0)
+            line, = self.ax.plot(fc["GameDate"], fc["Forecast"], color=color,
+                                 linestyle="--", linewidth=1.2, label=f"_forecast {col}")
+            self._forecast_artists += [band, line]
+
+    # ---------- LIVE TAIL ----------
+
+    def _toggle_live(self):
+        if not self.live_var.get():
+            self._stop_live()
+            self.canvas_mpl.draw_idle()
+            return
+
+        # Follow the log a running session is writing, if it isn't the one on screen
+        active = _active_session_logs()
+        current = self.selected_log.get("file_path") if self.selected_log else None
+        if active and not any(current and Path(p) == Path(current) for p in active):
+            self._load_log_from_path(active[0])  # live starts once it is loaded
+            return
+        self._start_live()
+
+    def _start_live(self):
+        if self._tailer is None or self.pipeline is None:
+            self.live_var.set(False)
+            return
+        self._stop_live(keep_toggle=True)
+        self._setup_blit()
+        self._live_headroom()
+        self.canvas_mpl.draw_idle()
+        self._live_job = self.root.after(LIVE_POLL_MS, self._live_poll)
+
+    def _stop_live(self, keep_toggle: bool = False):
+        if self._live_job is not None:
+            try:
+                self.root.after_cancel(self._live_job)
+            except tk.TclError:
+                pass
+            self._live_job = None
+        if self._blit:
+            self._blit.disconnect()
+            self._blit = None
+        if not keep_toggle:
+            self.live_var.set(False)
+
+    def _setup_blit(self):
+        if self._blit:
+            self._blit.disconnect()
+        lines = [s.line for s in self._downsampler.series] if self._downsampler else self.ax.get_lines()
+        self._blit = BlitManager(self.canvas_mpl, lines)
+
+    def _live_headroom(self):
+        """Leave room past the last point so the next rows land inside the current limits"""
+        if not self._downsampler or not self._downsampler.series:
+            return
+        last = max(s.x[-1] for s in self._downsampler.series if s.n)
+        x0, x1 = self.ax.get_xlim()
+        if x1 >= last:
+            self.ax.set_xlim(x0, last + LIVE_HEADROOM * max(last - x0, 1.0))
+
+    def _live_poll(self):
+        self._live_job = None
+        try:
+            data = self._tailer.poll()
+        except EOFError:
+            # Log rewritten from scratch: reload it (live resumes after the load)
+            self._load_log_from_path(self._tailer.path)
+            return
+
+        if data:
+            try:
+                rows = prepare_dataframe(parse_log_rows(self._tailer, data), copy=False)
+                if len(rows):
+                    self._apply_live_rows(rows)
+            except Exception as e:
+                print(f"⚠️ Live update skipped: {e}")
+
+        self._live_job = self.root.after(LIVE_POLL_MS, self._live_poll)
+
+    def _apply_live_rows(self, rows: pd.DataFrame):
+        last = self.pipeline.last_date()
+        numeric = self.pipeline.append(rows)
+        if numeric.empty:
+            return
+        if last is not None and numeric.index[0] <= last:
+            # Dates went back (an earlier save reloaded): the rows land mid-chart, redraw it all
+            self.update_display()
+            return
+        tail = self.pipeline.tail_view(numeric.index[0], self.year_var.get(), self._shown_level)
+        if tail.empty:
+            return
+        self._update_live_chart(tail)
+        self._update_live_table()
+        if self._forecast_artists:
+            # Forecaster already folded the new rows in: just redraw the projections
+            self._draw_forecasts()
+            self.canvas_mpl.draw_idle()
+
+    def _update_live_chart(self, tail: pd.DataFrame):
+        sampler = self._downsampler
+        if not sampler or not sampler.series:
+            return
+
+        x0, x1 = self.ax.get_xlim()
+        y0, y1 = self.ax.get_ylim()
+        following = x1 >= max(s.x[-1] for s in sampler.series if s.n)
+
+        blit_ok = True
+        values = []
+        for s in list(sampler.series):
+            col = s.line.get_label()
+            if col in tail.columns:
+                blit_ok &= sampler.update_tail(s.line, tail["GameDate"], tail[col])
+                values.append(tail[col].to_numpy(dtype=float))
+
+        new_x = mdates.date2num(tail["GameDate"].iloc[-1])
+        ys = np.concatenate(values) if values else np.array([])
+        ys = ys[np.isfinite(ys)]
+        inside = new_x <= x1 and (not len(ys) or (ys.min() >= y0 and ys.max() <= y1))
+
+        if following and not inside:
+            # Grow the limits once (full redraw), with headroom for the following rows
+            if len(ys):
+                pad = 0.05 * max(y1 - y0, ys.max() - ys.min(), 1e-9)
+                self.ax.set_ylim(min(y0, ys.min() - pad), max(y1, ys.max() + pad))
+            self._live_headroom()
+            self.canvas_mpl.draw_idle()
+        elif blit_ok and self._blit:
+            self._blit.update()
+        else:
+            self.canvas_mpl.draw_idle()
+
+    def _update_live_table(self):
+        """Point the table at the refreshed view; it keeps following the newest rows if it was there"""
+        if not self.table.columns:
+            return
+        view = self.pipeline.view(self.year_var.get(), self._shown_level)
+        self.table.set_frame(view, [c for c in self.table.columns if c in view.columns],
+                             headers={"GameDate_str": "GameDate"})
 
     def _export_plot(self):
         if self.df is None:
@@ -845,9 +1241,16 @@ class AnalyticsApp:
 
     @staticmethod
     def _robust_rescale_axis(ax):
+        limits = AnalyticsApp._robust_limits(ax)
+        if limits:
+            ax.set_ylim(*limits)
+
+    @staticmethod
+    def _robust_limits(ax, lines=None):
+        """Padded y-range of the visible lines (None if nothing is visible)"""
         ymin = None
         ymax = None
-        for line in ax.get_lines():
+        for line in (ax.get_lines() if lines is None else lines):
             if not line.get_visible():
                 continue
             y = np.asarray(line.get_ydata(), dtype=float)
@@ -859,13 +1262,12 @@ class AnalyticsApp:
             ymin = low if ymin is None else min(ymin, low)
             ymax = high if ymax is None else max(ymax, high)
         if ymin is None or ymax is None:
-            return
+            return None
         if ymin == ymax:
             pad = 1.0 if ymin == 0 else abs(ymin) * 0.05
-            ax.set_ylim(ymin - pad, ymax + pad)
         else:
             pad = (ymax - ymin) * 0.10
-            ax.set_ylim(ymin - pad, ymax + pad)
+        return ymin - pad, ymax + pad
 
     # ---------- INTERACTIVE CHART ----------
 
@@ -877,10 +1279,7 @@ class AnalyticsApp:
         try:
             theme = self._current_theme()
 
-            gdf = self.df.copy()
-            if self.year_var.get() != "All":
-                gdf = gdf[gdf['GameDate'].dt.year == int(self.year_var.get())]
-            gdf = self._apply_time_granularity(gdf)
+            gdf = self._current_view()
 
             metrics = [name for name, var in self.metric_vars.items() if var.get()]
             if not metrics:
@@ -899,9 +1298,10 @@ class AnalyticsApp:
             if "Treasury" in metrics:
                 ax2 = ax1.twinx()
                 tre = gdf["Treasury"]
-                t_line, = ax2.plot(gdf["GameDate"], tre, linewidth=2.5,
+                t_line, = ax2.plot(gdf["GameDate"].iloc[:1], tre.iloc[:1], linewidth=2.5,
                                    label="Treasury (Right Axis)",
                                    color="#004400")
+                ViewportDownsampler(ax2, label_threshold=0).add(t_line, gdf["GameDate"], tre)
                 lines.append(t_line)
                 labels.append("Treasury (Right Axis)")
                 metrics.remove("Treasury")
@@ -921,27 +1321,20 @@ class AnalyticsApp:
                 ax2.ticklabel_format(style='plain', axis='y')
                 ax2.tick_params(colors=theme["fg"])
 
-            # Other metrics (left axis)
+            # Other metrics (left axis): value labels only when few points are visible
+            sampler = ViewportDownsampler(ax1)
             intel_colors = ['#550000', '#0A1A3A', '#556B2F', '#B36B00', '#808080', '#AA8800', '#333366']
             for i, col in enumerate(metrics):
                 if col not in gdf.columns:
                     continue
                 series = gdf[col]
                 color = intel_colors[i % len(intel_colors)]
-                line, = ax1.plot(gdf["GameDate"], series, marker='o', label=col, color=color)
+                line, = ax1.plot(gdf["GameDate"].iloc[:1], series.iloc[:1], marker='o', label=col, color=color)
+                sampler.add(line, gdf["GameDate"], series,
+                            label_fmt=lambda v, c=col: _format_value(c, v),
+                            fontsize=7, ha='center', va='bottom', alpha=0.8, color=theme["fg"])
                 lines.append(line)
                 labels.append(col)
-                texts = []
-                for x, y in zip(gdf["GameDate"], series):
-                    if pd.notna(y):
-                        txt = ax1.text(
-                            x, y, _format_value(col, y),
-                            fontsize=7, ha='center', va='bottom',
-                            alpha=0.8, clip_on=True,
-                            color=theme["fg"]
-                        )
-                        texts.append(txt)
-                label_texts[col] = texts
 
             ax1.set_xlabel("Date", color=theme["fg"])
             ax1.set_ylabel("Value", color=theme["fg"])
@@ -976,12 +1369,29 @@ class AnalyticsApp:
 
             all_visible = True
 
+            # Lines, fixed labels and the checkbox panel are blitted over a cached
+            # background; a full redraw only happens when the y-limits must change
+            check.drawon = False
+            blit = BlitManager(fig.canvas, lines + [t for ts in label_texts.values() for t in ts] + [rax])
+
             def robust_rescale(event=None):
                 self._robust_rescale_axis(ax1)
                 if ax2:
                     self._robust_rescale_axis(ax2)
                 fig.canvas.draw_idle()
 
+            def redraw_after_toggle(shown):
+                """Blit unless a newly shown line falls outside its axis limits"""
+                for line in shown:
+                    limits = self._robust_limits(line.axes, [line])
+                    lo, hi = line.axes.get_ylim()
+                    if limits and (limits[0] < lo or limits[1] > hi):
+                        return robust_rescale()
+                if any(s.texts for s in sampler.series):
+                    # Per-point value labels are recreated on zoom: not blit-managed
+                    return fig.canvas.draw_idle()
+                blit.update()
+
             def toggle_all(event):
                 nonlocal all_visible
                 all_visible = not all_visible
@@ -990,7 +1400,8 @@ class AnalyticsApp:
                 for texts in label_texts.values():
                     for t in texts:
                         t.set_visible(all_visible)
-                robust_rescale()
+                sampler.sync_visibility()
+                redraw_after_toggle(lines if all_visible else [])
 
             toggle_btn.on_clicked(toggle_all)
             rescale_btn.on_clicked(robust_rescale)
@@ -1002,7 +1413,8 @@ class AnalyticsApp:
                 line.set_visible(new_vis)
                 for t in label_texts.get(label, []):
                     t.set_visible(new_vis)
-                robust_rescale()
+                sampler.sync_visibility()
+                redraw_after_toggle([line] if new_vis else [])
 
             check.on_clicked(toggle)
 
@@ -1065,11 +1477,7 @@ class AnalyticsApp:
         try:
             theme = self._current_theme()
             cols = _cols_for_resource(res_name)
-            gdf = self.df.copy()
-
-            if self.year_var.get() != "All":
-                gdf = gdf[gdf['GameDate'].dt.year == int(self.year_var.get())]
-            gdf = self._apply_time_granularity(gdf)
+            gdf = self._current_view()
 
             fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(15, 9), sharex=True)
             fig.subplots_adjust(hspace=0.25)
@@ -1078,22 +1486,22 @@ class AnalyticsApp:
             ax1.set_facecolor(theme["plot_bg"])
             ax2.set_facecolor(theme["plot_bg"])
 
+            dates = gdf["GameDate"]
+            label_style = dict(fontsize=7, ha='center', va='bottom', color=theme["fg"])
+            top, bottom = ViewportDownsampler(ax1), ViewportDownsampler(ax2)
+
+            def plot_series(sampler, ax, col, label, color, fmt):
+                line, = ax.plot(dates.iloc[:1], gdf[col].iloc[:1], marker='o', label=label, color=color)
+                sampler.add(line, dates, gdf[col], label_fmt=fmt, **label_style)
+
             # TOP: prices
             if cols["cost"] in gdf.columns:
-                ax1.plot(gdf["GameDate"], gdf[cols["cost"]], marker='o',
-                         label=f"{res_name} Production Cost", color="#0A1A3A")
-                for x, y in zip(gdf["GameDate"], gdf[cols["cost"]]):
-                    if pd.notna(y):
-                        ax1.text(x, y, f"${y:.2f}", fontsize=7, ha='center', va='bottom',
-                                 clip_on=True, color=theme["fg"])
+                plot_series(top, ax1, cols["cost"], f"{res_name} Production Cost", "#0A1A3A",
+                            lambda y: f"${y:.2f}")
 
             if cols["price"] in gdf.columns:
-                ax1.plot(gdf["GameDate"], gdf[cols["price"]], marker='o',
-                         label=f"{res_name} Market Price", color="#B36B00")
-                for x, y in zip(gdf["GameDate"], gdf[cols["price"]]):
-                    if pd.notna(y):
-                        ax1.text(x, y, f"${y:.2f}", fontsize=7, ha='center', va='bottom',
-                                 clip_on=True, color=theme["fg"])
+                plot_series(top, ax1, cols["price"], f"{res_name} Market Price", "#B36B00",
+                            lambda y: f"${y:.2f}")
 
             ax1.legend(loc='best')
             ax1.set_ylabel("Price / Cost", color=theme["fg"])
@@ -1102,20 +1510,12 @@ class AnalyticsApp:
 
             # BOTTOM: stock/trades
             if cols["stock"] in gdf.columns:
-                ax2.plot(gdf["GameDate"], gdf[cols["stock"]], marker='o',
-                         label=f"{res_name} Stock", color="#004400")
-                for x, y in zip(gdf["GameDate"], gdf[cols["stock"]]):
-                    if pd.notna(y):
-                        ax2.text(x, y, f"{y:,.0f}", fontsize=7, ha='center', va='bottom',
-                                 clip_on=True, color=theme["fg"])
+                plot_series(bottom, ax2, cols["stock"], f"{res_name} Stock", "#004400",
+                            lambda y: f"{y:,.0f}")
 
             if cols["trades"] in gdf.columns:
-                ax2.plot(gdf["GameDate"], gdf[cols["trades"]], marker='o',
-                         label=f"{res_name} Imports (Trades)", color="#550000")
-                for x, y in zip(gdf["GameDate"], gdf[cols["trades"]]):
-                    if pd.notna(y):
-                        ax2.text(x, y, f"{y:,.0f}", fontsize=7, ha='center', va='bottom',
-                                 clip_on=True, color=theme["fg"])
+                plot_series(bottom, ax2, cols["trades"], f"{res_name} Imports (Trades)", "#550000",
+                            lambda y: f"{y:,.0f}")
 
             ax2.legend(loc='best')
             ax2.set_ylabel("Stock / Imports", color=theme["fg"])
@@ -1138,6 +1538,380 @@ class AnalyticsApp:
         except Exception as e:
             messagebox.showerror("Chart Error", f"Cannot create resource chart:\n{e}")
 
+    # ---------- ANOMALIES ----------
+
+    def show_anomalies(self):
+        """Scan every daily series for spikes, regime shifts, zero and missing runs"""
+        if self.pipeline is None:
+            return
+        view = self.pipeline.view("All", "day")
+        frame = view.set_index("GameDate").select_dtypes(include="number")
+
+        t0 = datetime.datetime.now()
+        events = scan_anomalies(frame)
+        elapsed_ms = (datetime.datetime.now() - t0).total_seconds() * 1000
+
+        dialog = tk.Toplevel(self.root)
+        dialog.title("Anomaly Scan")
+        dialog.geometry("760x480")
+        dialog.transient(self.root)
+        dialog.configure(bg=self._current_theme()["bg"])
+
+        ttk.Label(
+            dialog,
+            text=f"{len(events)} events • {frame.shape[1]} series × {frame.shape[0]} rows • {elapsed_ms:.0f} ms",
+            font=('Courier New', 10, 'bold')
+        ).pack(anchor="w", padx=10, pady=(10, 4))
+
+        cols = ("rank", "date", "variable", "kind", "score", "detail")
+        tree = ttk.Treeview(dialog, columns=cols, show="headings")
+        widths = (50, 100, 200, 80, 60, 240)
+        for c, w in zip(cols, widths):
+            tree.heading(c, text=c.title())
+            tree.column(c, width=w, anchor="w" if c in ("variable", "detail") else "center")
+        for i, ev in enumerate(events):
+            tree.insert("", "end", iid=str(i), values=(
+                i + 1, ev.date.strftime("%Y-%m-%d"), ev.column, ev.kind, f"{ev.score:.1f}", ev.detail))
+        vsb = ttk.Scrollbar(dialog, orient="vertical", command=tree.yview)
+        tree.configure(yscrollcommand=vsb.set)
+        vsb.pack(side=tk.RIGHT, fill=tk.Y, pady=(0, 10))
+        tree.pack(fill=tk.BOTH, expand=True, padx=(10, 0), pady=(0, 10))
+
+        def on_open(event=None):
+            sel = tree.selection()
+            if sel:
+                self._jump_to_event(events[int(sel[0])])
+
+        tree.bind("<Double-1>", on_open)
+        tree.bind("<Return>", on_open)
+        ttk.Label(dialog, text="Double-click an event to show it on the chart.").pack(pady=(0, 8))
+
+    def _jump_to_event(self, event):
+        """Show the event's variable on the embedded chart, centred on its date"""
+        if self.year_var.get() not in ("All", str(event.date.year)):
+            self.year_var.set("All")
+        category = next((c for c, names in CATEGORY_MAP.items() if event.column in names), None)
+        if category and category != self.category_var.get():
+            self.category_var.set(category)  # rebuilds the checkboxes and the chart
+        var = self.metric_vars.get(event.column)
+        if var is not None and not var.get():
+            var.set(True)
+            self.update_display()
+
+        center = mdates.date2num(event.date)
+        x0, x1 = self.ax.get_xlim()
+        half = max(15.0, min((x1 - x0) / 2, 90.0))
+        if self._event_marker is not None and self._event_marker.axes is self.ax:
+            self._event_marker.remove()
+        # A span (patch) rather than axvline so the y autoscale of the lines ignores it
+        self._event_marker = self.ax.axvspan(center - 0.5, center + 0.5, alpha=0.35,
+                                             color=self._current_theme()["accent"])
+        self.ax.set_xlim(center - half, center + half)
+        self.canvas_mpl.draw_idle()
+
+    # ---------- CORRELATIONS ----------
+
+    def show_correlations(self):
+        """Heatmap of correlations (lag 0 or strongest lead/lag) across every logged variable"""
+        if self.pipeline is None:
+            return
+        theme = self._current_theme()
+        units = {"day": "days", "week": "weeks", "month": "months", "year": "years"}
+
+        dialog = tk.Toplevel(self.root)
+        dialog.title("Correlation & Lead-Lag")
+        dialog.geometry("1200x800")
+        dialog.transient(self.root)
+        dialog.configure(bg=theme["bg"])
+
+        controls = ttk.Frame(dialog)
+        controls.pack(fill=tk.X, padx=10, pady=(10, 4))
+        gran_var = tk.StringVar(value=self._view_granularity())
+        for text, value in [("Daily", "day"), ("Weekly", "week"), ("Monthly", "month"), ("Yearly", "year")]:
+            ttk.Radiobutton(controls, text=text, variable=gran_var, value=value).pack(side=tk.LEFT, padx=(0, 5))
+        ttk.Separator(controls, orient="vertical").pack(side=tk.LEFT, fill=tk.Y, padx=8)
+        series_var = tk.StringVar(value="changes")
+        ttk.Radiobutton(controls, text="Changes", variable=series_var, value="changes").pack(side=tk.LEFT)
+        ttk.Radiobutton(controls, text="Levels", variable=series_var, value="levels").pack(side=tk.LEFT, padx=(5, 0))
+        ttk.Separator(controls, orient="vertical").pack(side=tk.LEFT, fill=tk.Y, padx=8)
+        show_var = tk.StringVar(value="peak")
+        ttk.Radiobutton(controls, text="Strongest lag", variable=show_var, value="peak").pack(side=tk.LEFT)
+        ttk.Radiobutton(controls, text="Lag 0", variable=show_var, value="corr").pack(side=tk.LEFT, padx=(5, 0))
+        status = ttk.Label(controls, text="", font=('Courier New', 9))
+        status.pack(side=tk.RIGHT)
+
+        hover = ttk.Label(dialog, text="Hover a cell for details.", font=('Courier New', 10, 'bold'))
+        hover.pack(anchor="w", padx=10)
+
+        body = ttk.Frame(dialog)
+        body.pack(fill=tk.BOTH, expand=True, padx=10, pady=(4, 10))
+
+        pairs = ttk.Treeview(body, columns=("leader", "follower", "lag", "r"), show="headings", width=1)
+        for c, text, w in (("leader", "Leader", 170), ("follower", "Follower", 170), ("lag", "Lag", 50), ("r", "r", 60)):
+            pairs.heading(c, text=text)
+            pairs.column(c, width=w, anchor="w" if c in ("leader", "follower") else "center")
+        pairs.pack(side=tk.RIGHT, fill=tk.Y)
+
+        fig = Figure(figsize=(8, 7), dpi=100)
+        fig.patch.set_facecolor(theme["bg"])
+        ax = fig.add_subplot(111)
+        cbar = fig.colorbar(ScalarMappable(norm=Normalize(-1, 1), cmap="RdBu_r"), ax=ax, fraction=0.04)
+        cbar.ax.tick_params(colors=theme["fg"])
+        canvas = FigureCanvasTkAgg(fig, master=body)
+        canvas.get_tk_widget().pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+        state = {}
+
+        def refresh(*_):
+            columns = [c for c in ALL_POSSIBLE_COLUMNS if c in self.pipeline.columns]
+            granularity = gran_var.get()
+            t0 = datetime.datetime.now()
+            result = self.pipeline.lead_lag(columns, self.year_var.get(), granularity,
+                                            changes=series_var.get() == "changes")
+            elapsed_ms = (datetime.datetime.now() - t0).total_seconds() * 1000
+            state.update(result=result, unit=units[granularity])
+
+            ax.clear()
+            matrix = result.peak if show_var.get() == "peak" else result.corr
+            ax.imshow(matrix, cmap="RdBu_r", vmin=-1, vmax=1, interpolation="nearest", aspect="auto")
+            ticks = np.arange(len(result.columns))
+            ax.set_xticks(ticks)
+            ax.set_yticks(ticks)
+            ax.set_xticklabels(result.columns, rotation=90, fontsize=5, color=theme["fg"])
+            ax.set_yticklabels(result.columns, fontsize=5, color=theme["fg"])
+            label = "strongest lag" if show_var.get() == "peak" else "lag 0"
+            ax.set_title(f"Correlation ({series_var.get()}, {label})", color=theme["accent2"], fontweight='bold')
+            fig.tight_layout()
+            canvas.draw_idle()
+
+            pairs.delete(*pairs.get_children())
+            for leader, follower, lag, r in result.top_pairs(40):
+                pairs.insert("", "end", values=(leader, follower, f"{lag}", f"{r:+.2f}"))
+            status.config(text=f"{len(result.columns)} vars • {result.rows} rows • "
+                               f"±{result.max_lag} {state['unit']} • {elapsed_ms:.0f} ms")
+
+        def on_move(event):
+            result = state.get("result")
+            if result is None or event.inaxes is not ax or event.xdata is None:
+                return
+            i, j = int(round(event.ydata)), int(round(event.xdata))
+            if not (0 <= i < len(result.columns) and 0 <= j < len(result.columns)):
+                return
+            a, b = result.columns[i], result.columns[j]
+            text = f"{a} vs {b}: r = {result.corr[i, j]:+.2f} at lag 0"
+            lag = int(result.lag[i, j])
+            if lag:
+                leader, follower = (a, b) if lag > 0 else (b, a)
+                text += f" • peak r = {result.peak[i, j]:+.2f}: {leader} leads {follower} by {abs(lag)} {state['unit']}"
+            hover.config(text=text)
+
+        canvas.mpl_connect("motion_notify_event", on_move)
+        for var in (gran_var, series_var, show_var):
+            var.trace_add("write", refresh)
+        refresh()
+
+    # ---------- CAMPAIGN COMPARISON ----------
+
+    def show_campaign_comparison(self):
+        """Pick several logs and metrics, then overlay them on aligned time axes"""
+        logs = get_existing_logs()
+        if self.selected_log and all(l.get("file_path") != self.selected_log.get("file_path") for l in logs):
+            logs.insert(0, self.selected_log)
+        if not logs:
+            messagebox.showinfo("Compare", "No log files found.")
+            return
+
+        theme = self._current_theme()
+        dialog = tk.Toplevel(self.root)
+        dialog.title("Campaign Comparison")
+        dialog.geometry("420x620")
+        dialog.transient(self.root)
+        dialog.configure(bg=theme["bg"])
+
+        ttk.Label(dialog, text=f"Campaigns (up to {MAX_CAMPAIGNS}):",
+                  font=('Courier New', 11, 'bold')).pack(anchor="w", padx=10, pady=(10, 2))
+        log_list = tk.Listbox(dialog, height=8, selectmode=tk.EXTENDED, exportselection=False)
+        for i, log in enumerate(logs):
+            log_list.insert(tk.END, log.get("display_name", log.get("name", "?")))
+            if self.selected_log and log.get("file_path") == self.selected_log.get("file_path"):
+                log_list.selection_set(i)
+        log_list.pack(fill=tk.BOTH, expand=True, padx=10)
+
+        ttk.Label(dialog, text="Category:").pack(anchor="w", padx=10, pady=(8, 2))
+        category_var = tk.StringVar(value=self.category_var.get())
+        ttk.Combobox(dialog, textvariable=category_var, values=list(CATEGORY_MAP.keys()),
+                     state="readonly").pack(fill=tk.X, padx=10)
+
+        ttk.Label(dialog, text="Metrics:").pack(anchor="w", padx=10, pady=(8, 2))
+        metric_list = tk.Listbox(dialog, height=8, selectmode=tk.EXTENDED, exportselection=False)
+        metric_list.pack(fill=tk.BOTH, expand=True, padx=10)
+
+        def fill_metrics(*_):
+            metric_list.delete(0, tk.END)
+            for name in CATEGORY_MAP.get(category_var.get(), []):
+                if name != "GameDate":
+                    metric_list.insert(tk.END, name)
+            metric_list.selection_set(0)
+
+        category_var.trace_add("write", fill_metrics)
+        fill_metrics()
+
+        options = ttk.Frame(dialog)
+        options.pack(fill=tk.X, padx=10, pady=(8, 0))
+        align_var = tk.StringVar(value="calendar")
+        ttk.Radiobutton(options, text="Calendar date", variable=align_var, value="calendar").pack(side=tk.LEFT)
+        ttk.Radiobutton(options, text="Days since start", variable=align_var, value="days").pack(side=tk.LEFT, padx=(10, 0))
+
+        scale = ttk.Frame(dialog)
+        scale.pack(fill=tk.X, padx=10, pady=(4, 0))
+        gran_var = tk.StringVar(value="day")
+        for text, value in [("Daily", "day"), ("Weekly", "week"), ("Monthly", "month"), ("Yearly", "year")]:
+            ttk.Radiobutton(scale, text=text, variable=gran_var, value=value).pack(side=tk.LEFT, padx=(0, 5))
+
+        status = ttk.Label(dialog, text="", font=('Courier New', 9))
+        status.pack(anchor="w", padx=10, pady=(6, 0))
+
+        def on_compare():
+            chosen = [logs[i] for i in log_list.curselection()]
+            metrics = [metric_list.get(i) for i in metric_list.curselection()]
+            if not chosen or not metrics:
+                return messagebox.showwarning("Compare", "Select at least one campaign and one metric.", parent=dialog)
+            if len(chosen) > MAX_CAMPAIGNS:
+                return messagebox.showwarning("Compare", f"Select at most {MAX_CAMPAIGNS} campaigns.", parent=dialog)
+
+            compare_btn.config(state="disabled")
+            status.config(text=f"Loading {len(chosen)} logs...")
+            mode, granularity = align_var.get(), gran_var.get()
+
+            def worker():
+                try:
+                    # Logs already open (or compared before) come from the load cache
+                    with ThreadPoolExecutor(max_workers=4) as pool:
+                        loaded = list(pool.map(lambda log: load_pipeline(log["file_path"]), chosen))
+                    pipelines = {log.get("name") or Path(log["file_path"]).stem: res[1]
+                                 for log, res in zip(chosen, loaded)}
+                    aligned = align_metrics(pipelines, metrics, mode, granularity)
+                    self.root.after(0, lambda: done(aligned, mode))
+                except Exception as e:
+                    self.root.after(0, lambda e=e: failed(e))
+
+            def done(aligned, mode):
+                if dialog.winfo_exists():
+                    compare_btn.config(state="normal")
+                    status.config(text="")
+                self._show_comparison_chart(aligned, mode)
+
+            def failed(error):
+                if dialog.winfo_exists():
+                    compare_btn.config(state="normal")
+                    status.config(text="")
+                messagebox.showerror("Compare", f"Cannot load logs:\n{error}")
+
+            threading.Thread(target=worker, daemon=True).start()
+
+        compare_btn = ttk.Button(dialog, text="COMPARE", command=on_compare)
+        compare_btn.pack(pady=10)
+
+    def _show_comparison_chart(self, aligned: dict, mode: str):
+        aligned = {m: frame for m, frame in aligned.items() if not frame.empty}
+        if not aligned:
+            messagebox.showinfo("Compare", "None of the selected logs contain these metrics.")
+            return
+        try:
+            theme = self._current_theme()
+            fig, axes = plt.subplots(len(aligned), 1, figsize=(15, 3.2 * len(aligned) + 1.5),
+                                     sharex=True, squeeze=False)
+            fig.patch.set_facecolor(theme["bg"])
+            colors = ['#004400', '#550000', '#0A1A3A', '#556B2F', '#B36B00',
+                      '#808080', '#AA8800', '#333366', '#7A3E9D', '#2E8B8B']
+
+            for ax, (metric, frame) in zip(axes[:, 0], aligned.items()):
+                ax.set_facecolor(theme["plot_bg"])
+                sampler = ViewportDownsampler(ax)
+                x = frame.index.to_numpy()
+                for i, campaign in enumerate(frame.columns):
+                    y = frame[campaign].to_numpy()
+                    first = np.flatnonzero(np.isfinite(y))[:1]
+                    line, = ax.plot(x[first], y[first], label=campaign,
+                                    color=colors[i % len(colors)], linewidth=1.4, marker='o', markersize=3)
+                    sampler.add(line, x, y)
+                ax.set_ylabel(metric, color=theme["fg"])
+                ax.grid(True, linestyle='--', linewidth=0.5, color=theme["grid_color"])
+                ax.tick_params(colors=theme["fg"])
+                for spine in ax.spines.values():
+                    spine.set_color(theme["frame_border"])
+                self._robust_rescale_axis(ax)
+
+            axes[0, 0].legend(loc='best', fontsize=9)
+            axes[-1, 0].set_xlabel("Game Date" if mode == "calendar" else "Days since start", color=theme["fg"])
+            fig.suptitle("Campaign Comparison", fontsize=16, fontweight='bold', color=theme["accent2"])
+            if mode == "calendar":
+                fig.autofmt_xdate(rotation=45)
+            plt.show()
+        except Exception as e:
+            messagebox.showerror("Chart Error", f"Cannot create comparison chart:\n{e}")
+
+    # ---------- INTRADAY CAPTURES ----------
+
+    def show_intraday_captures(self):
+        """Pick a high-rate capture folder and chart it"""
+        captures = list_captures()
+        if not captures:
+            messagebox.showinfo("Intraday", "No intraday captures found.\nStart one from the launcher's Sessions window.")
+            return
+
+        dialog = tk.Toplevel(self.root)
+        dialog.title("Intraday Captures")
+        dialog.geometry("360x400")
+        dialog.transient(self.root)
+        dialog.configure(bg=self._current_theme()["bg"])
+
+        listbox = tk.Listbox(dialog, height=14)
+        for path in captures:
+            listbox.insert(tk.END, path.name)
+        listbox.selection_set(0)
+        listbox.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+
+        def on_select():
+            if listbox.curselection():
+                path = captures[listbox.curselection()[0]]
+                dialog.destroy()
+                self._show_intraday_chart(path)
+
+        ttk.Button(dialog, text="Show Chart", command=on_select).pack(pady=10)
+
+    def _show_intraday_chart(self, capture_dir: Path):
+        try:
+            meta, t, series = load_capture(capture_dir)
+            if len(t) == 0:
+                messagebox.showinfo("Intraday", "This capture has no samples yet.")
+                return
+
+            theme = self._current_theme()
+            n = len(series)
+            fig, axes = plt.subplots(n, 1, figsize=(14, max(3, 2.2 * n)), sharex=True, squeeze=False)
+            fig.patch.set_facecolor(theme["bg"])
+
+            for ax, (name, values) in zip(axes[:, 0], series.items()):
+                line, = ax.plot(t[:1], values[:1], linewidth=0.8, color=theme["accent2"])
+                # Min/max keeps every spike of a 100+ Hz capture at any zoom level
+                ViewportDownsampler(ax, method="minmax", points_per_px=2.0, marker_threshold=0).add(line, t, values)
+                ax.set_facecolor(theme["plot_bg"])
+                ax.set_ylabel(name, color=theme["fg"], fontsize=8)
+                ax.grid(True, linestyle='--', linewidth=0.5, color=theme["grid_color"])
+                ax.tick_params(colors=theme["fg"], labelsize=8)
+                for spine in ax.spines.values():
+                    spine.set_color(theme["frame_border"])
+
+            axes[-1, 0].set_xlabel("Seconds since capture start", color=theme["fg"])
+            stats = meta.get("stats", {})
+            fig.suptitle(f"{capture_dir.name} • {meta.get('rate_hz', 0):.0f} Hz target, "
+                         f"{stats.get('achieved_hz', 0)} Hz achieved, {len(t):,} samples",
+                         fontsize=13, fontweight='bold', color=theme["accent2"])
+            plt.show()
+        except Exception as e:
+            messagebox.showerror("Chart Error", f"Cannot load intraday capture:\n{e}")
+
 
 def show_simple_analytics():
     """Entry point for standalone or launcher use"""
@@ -0,0 +1,188 @@
+import warnings
+from dataclasses import dataclass
+from typing import List, Optional
+
+import numpy as np
+import pandas as pd
+
+"""
+Supreme Ruler 2030 - Anomaly & Regime-Change Scan
+Vectorized over the whole (rows x columns) matrix of a log, no per-row loops:
+- Spikes: rolling z-score of the day-over-day change against the previous
+  `window` changes (rolling mean/std from cumulative sums).
+- Regime changes: mean of the next `window` values vs the previous `window`
+  values (cumulative-sum window means), scaled by the pooled deviation.
+- Zero runs (a stock or figure stuck at 0) and NaN runs (missing readings).
+Each detector keeps only local peaks, then all events are ranked together
+by a score normalized to their thresholds (1.0 = just flagged) and
+log-compressed, so no single detector's scale dominates the list.
+- Windows need MIN_FILL of their rows present, and deviations are floored by
+  a robust per-column scale (MAD of the day-over-day changes): a column that
+  starts mid-log or sat flat before a crash gets a sane score, not 1e8.
+"""
+
+SPIKE_WINDOW = 30
+SPIKE_Z = 4.0
+SHIFT_WINDOW = 30
+SHIFT_T = 6.0
+MIN_RUN = 7
+MAX_EVENTS = 250
+MIN_FILL = 0.5   # share of a window's rows that must be present
+
+
+@dataclass
+class Event:
+    date: pd.Timestamp
+    column: str
+    kind: str       # "spike", "shift", "zero run", "missing"
+    score: float    # >= 1.0; higher is more severe
+    detail: str
+
+
+# ============================================================
+# HELPERS
+# ============================================================
+
+def _window_sums(values: np.ndarray, window: int):
+    """Trailing sums, squared sums and counts over `window` rows (NaN-aware), per column."""
+    ok = np.isfinite(values)
+    v = np.where(ok, values, 0.0)
+    zero = np.zeros((1, values.shape[1]))
+    c1 = np.vstack([zero, np.cumsum(v, axis=0)])
+    c2 = np.vstack([zero, np.cumsum(v * v, axis=0)])
+    cn = np.vstack([zero, np.cumsum(ok, axis=0)])
+    s1 = c1[window:] - c1[:-window]
+    s2 = c2[window:] - c2[:-window]
+    n = cn[window:] - cn[:-window]
+    return s1, s2, n   # row i covers values[i : i + window]
+
+
+def _change_scale(change: np.ndarray) -> np.ndarray:
+    """
+    Robust spread of each column's day-over-day changes: 1.4826 * MAD, or the
+    mean absolute change for columns that mostly don't move (MAD 0). NaN for
+    columns that never change.
+    """
+    with np.errstate(invalid="ignore"), warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)  # all-NaN columns
+        mad = 1.4826 * np.nanmedian(np.abs(change - np.nanmedian(change, axis=0)), axis=0)
+        mean_abs = np.nanmean(np.abs(change), axis=0)
+    scale = np.where(mad > 0, mad, mean_abs)
+    return np.where(scale > 0, scale, np.nan)
+
+
+def _severity(ratio) -> float:
+    """Score of an event `ratio` times over its threshold: 1.0 at the threshold, log-compressed above."""
+    return float(1.0 + np.log(max(float(ratio), 1.0)))
+
+
+def _local_peaks(score: np.ndarray, flagged: np.ndarray, radius: int):
+    """(rows, cols) of flagged cells that are the maximum of their column within +-radius rows."""
+    rows, cols = np.nonzero(flagged)
+    if not len(rows):
+        return rows, cols
+    padded = np.pad(np.where(np.isfinite(score), score, -np.inf), ((radius, radius), (0, 0)),
+                    constant_values=-np.inf)
+    # Gather only the neighbourhoods of flagged cells (they are sparse)
+    around = rows[:, None] + np.arange(2 * radius + 1)
+    keep = score[rows, cols] >= padded[around, cols[:, None]].max(axis=1)
+    return rows[keep], cols[keep]
+
+
+def _runs(mask: np.ndarray, min_len: int):
+    """(start_row, length, col) of every run of True at least `min_len` long."""
+    edges = np.diff(np.pad(mask.astype(np.int8), ((1, 1), (0, 0))), axis=0)
+    # Column-major order so starts and ends pair up column by column
+    s_col, s_row = np.nonzero(edges.T == 1)
+    _, e_row = np.nonzero(edges.T == -1)
+    length = e_row - s_row
+    keep = length >= min_len
+    return s_row[keep], length[keep], s_col[keep]
+
+
+# ============================================================
+# DETECTORS
+# ============================================================
+
+def _spikes(values: np.ndarray, window: int, z_thr: float):
+    n_rows = values.shape[0]
+    if n_rows <= window + 2:
+        return []
+    change = np.diff(values, axis=0)                       # row i: values[i+1] - values[i]
+    s1, s2, n = _window_sums(change, window)               # row j: change[j : j+window]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = s1 / n
+        std = np.sqrt(np.maximum(s2 / n - mean * mean, 0.0))
+        std = np.fmax(std, _change_scale(change))          # a flat window doesn't make every move infinite
+        current = change[window:]                          # change right after each window
+        z = (current - mean[:-1]) / std[:-1]
+    z[(n[:-1] < window * MIN_FILL) | ~np.isfinite(z)] = np.nan
+    absz = np.abs(z)
+    rows, cols = _local_peaks(absz, absz >= z_thr, window // 2)
+    # change[window + r] happened on values row window + r + 1
+    return [(r + window + 1, c, absz[r, c] / z_thr, z[r, c], current[r, c]) for r, c in zip(rows, cols)]
+
+
+def _shifts(values: np.ndarray, window: int, t_thr: float):
+    n_rows = values.shape[0]
+    if n_rows < 2 * window + 1:
+        return []
+    s1, s2, n = _window_sums(values, window)               # row i: values[i : i+window]
+    before, after = slice(0, len(s1) - window), slice(window, len(s1))
+    with np.errstate(invalid="ignore", divide="ignore"):
+        m_before, m_after = s1[before] / n[before], s1[after] / n[after]
+        v_before = np.maximum(s2[before] / n[before] - m_before ** 2, 0.0)
+        v_after = np.maximum(s2[after] / n[after] - m_after ** 2, 0.0)
+        pooled = np.sqrt((v_before + v_after) / 2.0)
+        # Changes of i.i.d. noise spread sqrt(2) times the noise: floor at that noise level
+        scale = np.fmax(pooled, _change_scale(np.diff(values, axis=0)) / np.sqrt(2.0))
+        t = (m_after - m_before) / scale
+    sparse = (n[before] < window * MIN_FILL) | (n[after] < window * MIN_FILL)
+    t[sparse | ~np.isfinite(t)] = np.nan
+    abst = np.abs(t)
+    rows, cols = _local_peaks(abst, abst >= t_thr, window)
+    # Row r compares values[r : r+window] with values[r+window : r+2*window]
+    return [(r + window, c, abst[r, c] / t_thr, m_before[r, c], m_after[r, c]) for r, c in zip(rows, cols)]
+
+
+# ============================================================
+# SCAN
+# ============================================================
+
+def scan(frame: pd.DataFrame, columns: Optional[List[str]] = None,
+         spike_window: int = SPIKE_WINDOW, spike_z: float = SPIKE_Z,
+         shift_window: int = SHIFT_WINDOW, shift_t: float = SHIFT_T,
+         min_run: int = MIN_RUN, max_events: int = MAX_EVENTS) -> List[Event]:
+    """
+    Ranked events over the numeric columns of `frame` (DatetimeIndex, sorted),
+    e.g. LogPipeline.frame.
+    """
+    columns = columns or [c for c in frame.columns if pd.api.types.is_numeric_dtype(frame[c])]
+    if not columns or frame.empty:
+        return []
+    values = frame[columns].to_numpy(dtype=float)
+    dates = frame.index
+    events: List[Event] = []
+
+    for row, col, score, z, delta in _spikes(values, spike_window, spike_z):
+        events.append(Event(dates[row], columns[col], "spike", _severity(score),
+                            f"change {delta:+,.4g} (z = {z:+.1f})"))
+
+    for row, col, score, before, after in _shifts(values, shift_window, shift_t):
+        events.append(Event(dates[row], columns[col], "shift", _severity(score),
+                            f"mean {before:,.4g} → {after:,.4g}"))
+
+    # A run of zeros only matters if the column is usually non-zero
+    nonzero = np.isfinite(values) & (values != 0)
+    usually_set = nonzero.mean(axis=0) > 0.5
+    for row, length, col in zip(*_runs((values == 0) & usually_set, min_run)):
+        events.append(Event(dates[row], columns[col], "zero run", _severity(length / min_run),
+                            f"0 for {length} rows"))
+
+    ever_set = np.isfinite(values).any(axis=0)
+    for row, length, col in zip(*_runs(np.isnan(values) & ever_set, min_run)):
+        events.append(Event(dates[row], columns[col], "missing", _severity(length / min_run),
+                            f"no data for {length} rows"))
+
+    events.sort(key=lambda e: e.score, reverse=True)
+    return events[:max_events]
@@ -0,0 +1,215 @@
+import argparse
+import html
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Dict, List
+
+import matplotlib
+matplotlib.use("Agg")  # headless: must be selected before analytics imports pyplot
+from matplotlib.figure import Figure
+import matplotlib.dates as mdates
+
+sys.path.append(str(Path(__file__).parent))
+from analytics import CATEGORY_MAP, PAPER_THEME, load_pipeline, _format_value
+from data_logger import BASE_DIR, LOGS_DIR
+from derived_metrics import resource_columns
+from variable_registry import RESOURCES
+
+"""
+Supreme Ruler 2030 - Batch Reports
+- Renders every CATEGORY_MAP group and a price/stock chart per resource for
+  one or many logs, plus an index.html with the charts and the latest values.
+- Headless (Agg backend, no Tk window). Each log is rendered in its own worker
+  process, so a folder of campaigns spreads across every core.
+- Weekly/monthly/yearly charts read each log's rollup tables (<log>.rollups/),
+  brought up to date incrementally instead of resampling the whole log.
+- Usage:  python batch_report.py [log.csv | folder ...] [-o OUT] [--format png svg]
+          [--granularity auto|day|week|month|year] [--jobs N]
+"""
+
+REPORTS_DIR = BASE_DIR / "reports"
+COLORS = ['#004400', '#550000', '#0A1A3A', '#556B2F', '#B36B00', '#808080', '#AA8800', '#333366']
+FIGSIZE = (12, 5)
+
+
+def _slug(text: str) -> str:
+    return "".join(c if c.isalnum() else "_" for c in text).strip("_").lower()
+
+
+def _style_axes(ax, ylabel: str = "Value"):
+    theme = PAPER_THEME
+    ax.set_facecolor(theme["plot_bg"])
+    ax.grid(True, linestyle='--', linewidth=0.5, color=theme["grid_color"])
+    ax.set_ylabel(ylabel, color=theme["fg"])
+    ax.tick_params(colors=theme["fg"])
+    for spine in ax.spines.values():
+        spine.set_color(theme["frame_border"])
+    locator = mdates.AutoDateLocator()
+    ax.xaxis.set_major_locator(locator)
+    ax.xaxis.set_major_formatter(mdates.ConciseDateFormatter(locator))
+    if ax.get_legend_handles_labels()[0]:
+        ax.legend(loc="best", fontsize="small")
+
+
+def _save(fig: Figure, out_dir: Path, stem: str, formats: List[str], dpi: int) -> List[str]:
+    names = []
+    for fmt in formats:
+        name = f"{stem}.{fmt}"
+        fig.savefig(out_dir / name, dpi=dpi, facecolor=fig.get_facecolor())
+        names.append(name)
+    return names
+
+
+# ============================================================
+# PER-LOG RENDERING (runs in a worker process)
+# ============================================================
+
+def render_log(path: str, out_dir: str, formats: List[str], granularity: str = "auto", dpi: int = 120) -> Dict:
+    """Render every chart of one log into out_dir/<log name>/. Returns its summary for the index."""
+    t0 = time.perf_counter()
+    path = Path(path)
+    log_dir = Path(out_dir) / path.stem
+    log_dir.mkdir(parents=True, exist_ok=True)
+
+    _, pipeline, _ = load_pipeline(str(path))
+    level = pipeline.auto_granularity() if granularity == "auto" else granularity
+    view = pipeline.view("All", level)
+    dates = view["GameDate"]
+    daily = pipeline.view("All", "day")
+    last = daily.iloc[-1] if len(daily) else None
+    charts, latest = [], {}
+
+    for category, names in CATEGORY_MAP.items():
+        cols = [c for c in names if c != "GameDate" and c in view.columns and view[c].notna().any()]
+        if not cols:
+            continue
+        fig = Figure(figsize=FIGSIZE)
+        fig.patch.set_facecolor(PAPER_THEME["bg"])
+        ax = fig.add_subplot(111)
+        for i, col in enumerate(cols):
+            ax.plot(dates, view[col], label=col, color=COLORS[i % len(COLORS)], linewidth=1.3)
+        ax.set_title(f"{path.stem} • {category}", fontweight='bold', color=PAPER_THEME["accent2"])
+        _style_axes(ax)
+        fig.tight_layout()
+        charts.append((category, _save(fig, log_dir, _slug(category), formats, dpi)))
+        latest[category] = [(c, _format_value(c, float(last[c]))) for c in cols if c in daily.columns]
+
+    for res in RESOURCES:
+        cols = resource_columns(res)
+        if not any(c in view.columns for c in cols.values()):
+            continue
+        fig = Figure(figsize=(FIGSIZE[0], FIGSIZE[1] * 1.6))
+        fig.patch.set_facecolor(PAPER_THEME["bg"])
+        ax1, ax2 = fig.subplots(2, 1, sharex=True)
+        panels = ((ax1, ("cost", "price"), "Price / Cost"), (ax2, ("stock", "trades"), "Stock / Imports"))
+        for ax, keys, ylabel in panels:
+            for i, key in enumerate(keys):
+                if cols[key] in view.columns:
+                    ax.plot(dates, view[cols[key]], label=cols[key], color=COLORS[i + (0 if ax is ax2 else 2)],
+                            linewidth=1.3)
+            _style_axes(ax, ylabel)
+        fig.suptitle(f"{path.stem} • {res} — Resource Overview", fontweight='bold', color=PAPER_THEME["accent2"])
+        fig.tight_layout()
+        charts.append((f"Resource: {res}", _save(fig, log_dir, "resource_" + _slug(res), formats, dpi)))
+
+    return {
+        "name": path.stem,
+        "dir": log_dir.name,
+        "rows": len(pipeline.frame),
+        "first": dates.iloc[0].strftime("%Y-%m-%d") if len(view) else "",
+        "last": dates.iloc[-1].strftime("%Y-%m-%d") if len(view) else "",
+        "level": level,
+        "charts": charts,
+        "latest": latest,
+        "seconds": time.perf_counter() - t0,
+    }
+
+
+# ============================================================
+# INDEX PAGE
+# ============================================================
+
+def write_index(out_dir: Path, summaries: List[Dict]) -> Path:
+    esc = html.escape
+    parts = [
+        "<!DOCTYPE html><html><head><meta charset='utf-8'><title>SR2030 Reports</title>",
+        f"<style>body{{background:{PAPER_THEME['bg']};color:{PAPER_THEME['fg']};font-family:'Courier New',monospace;"
+        "margin:20px} h2{color:#004400;border-bottom:2px solid #555} img{width:100%;max-width:900px}"
+        " table{border-collapse:collapse;font-size:12px} td{padding:2px 8px;border-bottom:1px solid #B0A58F}"
+        " details{margin:6px 0} summary{cursor:pointer;font-weight:bold}</style></head><body>",
+        f"<h1>SR2030 Campaign Reports</h1><p>{len(summaries)} logs • generated {time.strftime('%Y-%m-%d %H:%M')}</p>",
+        "<ul>" + "".join(f"<li><a href='#{esc(_slug(s['name']))}'>{esc(s['name'])}</a> "
+                         f"({s['first']} → {s['last']}, {s['rows']} rows)</li>" for s in summaries) + "</ul>",
+    ]
+    for s in summaries:
+        parts.append(f"<h2 id='{esc(_slug(s['name']))}'>{esc(s['name'])}</h2>"
+                     f"<p>{s['first']} → {s['last']} • {s['rows']} rows • {s['level']} view</p>")
+        for category, values in s["latest"].items():
+            rows = "".join(f"<tr><td>{esc(c)}</td><td>{esc(v)}</td></tr>" for c, v in values)
+            parts.append(f"<details><summary>Latest • {esc(category)}</summary><table>{rows}</table></details>")
+        for title, files in s["charts"]:
+            links = " ".join(f"<a href='{esc(s['dir'])}/{esc(f)}'>{esc(f.rsplit('.', 1)[1])}</a>" for f in files)
+            parts.append(f"<h3>{esc(title)} <small>{links}</small></h3>"
+                         f"<img loading='lazy' src='{esc(s['dir'])}/{esc(files[0])}' alt='{esc(title)}'>")
+    parts.append("</body></html>")
+
+    index = out_dir / "index.html"
+    index.write_text("\n".join(parts), encoding="utf-8")
+    return index
+
+
+# ============================================================
+# CLI
+# ============================================================
+
+def _collect_logs(inputs: List[str]) -> List[Path]:
+    if not inputs:
+        return sorted(LOGS_DIR.glob("*.csv"))
+    logs = []
+    for item in map(Path, inputs):
+        logs.extend(sorted(item.glob("*.csv")) if item.is_dir() else [item])
+    return logs
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render PNG/SVG charts and an HTML summary for SR2030 logs")
+    parser.add_argument("logs", nargs="*", help="Log CSV files or folders (default: every log)")
+    parser.add_argument("-o", "--output", default=str(REPORTS_DIR), help="Output folder")
+    parser.add_argument("--format", nargs="+", default=["png"], choices=["png", "svg"])
+    parser.add_argument("--granularity", default="auto", choices=["auto", "day", "week", "month", "year"])
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1, help="Worker processes")
+    parser.add_argument("--dpi", type=int, default=120)
+    args = parser.parse_args(argv)
+
+    logs = _collect_logs(args.logs)
+    if not logs:
+        print("❌ No logs found")
+        return 1
+    out_dir = Path(args.output)
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    t0 = time.perf_counter()
+    summaries = []
+    with ProcessPoolExecutor(max_workers=max(1, min(args.jobs, len(logs)))) as pool:
+        futures = {pool.submit(render_log, str(p), str(out_dir), args.format, args.granularity, args.dpi): p
+                   for p in logs}
+        for future in as_completed(futures):
+            path = futures[future]
+            try:
+                summary = future.result()
+                summaries.append(summary)
+                print(f"📊 {path.name}: {len(summary['charts'])} charts in {summary['seconds']:.1f}s")
+            except Exception as e:
+                print(f"⚠️ {path.name} skipped: {e}")
+
+    summaries.sort(key=lambda s: s["name"])
+    index = write_index(out_dir, summaries)
+    print(f"✅ {len(summaries)}/{len(logs)} logs in {time.perf_counter() - t0:.1f}s → {index}")
+    return 0 if summaries else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
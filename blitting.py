@@ -0,0 +1,78 @@
+from typing import List
+
+"""
+Supreme Ruler 2030 - Chart Blitting
+- BlitManager keeps a snapshot of the static parts of a figure (axes, grid,
+  ticks, legend) and redraws only the animated artists on top of it.
+- Any full draw (resize, zoom, limit change) refreshes the snapshot through
+  the canvas draw_event, so callers just call update() after changing data.
+- Animated artists are skipped by savefig, so the figure's savefig (also used
+  by the toolbar) is wrapped to render them normally while saving.
+"""
+
+
+class BlitManager:
+    def __init__(self, canvas, artists=()):
+        self.canvas = canvas
+        self._background = None
+        self._saving = False
+        self._artists: List[object] = []
+        for artist in artists:
+            self.add_artist(artist)
+        self._cid = canvas.mpl_connect("draw_event", self._on_draw)
+
+        fig = canvas.figure
+        self._savefig = fig.savefig
+        fig.savefig = self._static_savefig
+
+    def add_artist(self, artist):
+        artist.set_animated(True)
+        self._artists.append(artist)
+
+    def disconnect(self):
+        """Stop tracking draws and hand the artists back to normal rendering."""
+        self.canvas.mpl_disconnect(self._cid)
+        for artist in self._artists:
+            artist.set_animated(False)
+        self._artists = []
+        self._background = None
+
+        fig = self.canvas.figure
+        if fig.__dict__.get("savefig") == self._static_savefig:
+            del fig.savefig
+
+    def _static_savefig(self, *args, **kwargs):
+        self._saving = True
+        for artist in self._artists:
+            artist.set_animated(False)
+        try:
+            return self._savefig(*args, **kwargs)
+        finally:
+            for artist in self._artists:
+                artist.set_animated(True)
+            self._saving = False
+            self._background = None  # the print renderer replaced the on-screen one
+            self.canvas.draw_idle()
+
+    def _on_draw(self, event):
+        if self._saving:
+            return
+        # Full draw just happened: grab the static background, then paint the animated artists
+        self._background = self.canvas.copy_from_bbox(self.canvas.figure.bbox)
+        self._draw_artists()
+
+    def _draw_artists(self):
+        fig = self.canvas.figure
+        for artist in self._artists:
+            if artist.get_visible():
+                fig.draw_artist(artist)
+
+    def update(self):
+        """Repaint only the animated artists (falls back to a full draw without a background)."""
+        if self._background is None:
+            self.canvas.draw()
+            return
+        self.canvas.restore_region(self._background)
+        self._draw_artists()
+        self.canvas.blit(self.canvas.figure.bbox)
+        self.canvas.flush_events()
@@ -0,0 +1,70 @@
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+from log_pipeline import LogPipeline
+
+"""
+Supreme Ruler 2030 - Campaign Comparison
+- Overlays the same metric from several logs (campaigns or nations).
+- Alignment is vectorized: every campaign's dates become integer day keys
+  (calendar days, or days since the campaign's first row), the union of keys
+  is the shared x-axis and each campaign is scattered into it with one
+  searchsorted call.
+- Works on LogPipeline views, so week/month/year comparisons read the cached
+  rollup tables of each log instead of resampling them.
+"""
+
+ALIGN_MODES = ("calendar", "days")
+MAX_CAMPAIGNS = 10
+# Nominal bucket length used to put "days since start" on a common grid
+BUCKET_DAYS = {"month": 30.44, "year": 365.25}
+
+
+def _day_keys(dates: pd.Series, mode: str, granularity: str = "day") -> np.ndarray:
+    stamps = dates.to_numpy(dtype="datetime64[D]")
+    days = stamps.astype(np.int64)
+    if mode != "days" or not len(days):
+        return days
+    if granularity in BUCKET_DAYS:
+        # Months/years have uneven lengths: count buckets, then scale to days
+        unit = "M" if granularity == "month" else "Y"
+        ordinal = stamps.astype(f"datetime64[{unit}]").astype(np.int64)
+        return np.round((ordinal - ordinal[0]) * BUCKET_DAYS[granularity]).astype(np.int64)
+    return days - days[0]
+
+
+def align_metric(pipelines: Dict[str, LogPipeline], metric: str, mode: str = "calendar",
+                 granularity: str = "day", year: str = "All") -> pd.DataFrame:
+    """
+    One column per campaign, one row per aligned x key (NaN where a campaign has
+    no row). The index is GameDate for "calendar" alignment, Day for "days".
+    """
+    labels, keys, values = [], [], []
+    for label, pipeline in pipelines.items():
+        view = pipeline.view(year, granularity)
+        if metric not in view.columns or view.empty:
+            continue
+        labels.append(label)
+        keys.append(_day_keys(view["GameDate"], mode, granularity))
+        values.append(view[metric].to_numpy(dtype=float))
+
+    if not labels:
+        return pd.DataFrame()
+
+    grid = np.unique(np.concatenate(keys))
+    out = np.full((len(grid), len(labels)), np.nan)
+    for j, (k, v) in enumerate(zip(keys, values)):
+        out[np.searchsorted(grid, k), j] = v
+
+    if mode == "calendar":
+        index = pd.DatetimeIndex(grid.astype("datetime64[D]"), name="GameDate")
+    else:
+        index = pd.Index(grid, name="Day")
+    return pd.DataFrame(out, index=index, columns=labels)
+
+
+def align_metrics(pipelines: Dict[str, LogPipeline], metrics: List[str], mode: str = "calendar",
+                  granularity: str = "day", year: str = "All") -> Dict[str, pd.DataFrame]:
+    return {m: align_metric(pipelines, m, mode, granularity, year) for m in metrics}
@@ -0,0 +1,98 @@
+from dataclasses import dataclass
+from typing import List, Tuple
+
+import numpy as np
+import pandas as pd
+
+"""
+Supreme Ruler 2030 - Correlation & Lead-Lag Matrix
+- Correlation of every pair of variables at lag 0 and at every lag up to
+  MAX_LAG rows of the chosen resolution (days, weeks, months, years), all
+  pairs at once.
+- Cross-correlations come from FFTs: the series are cut into SEGMENT-row
+  blocks, each block is correlated with the same block extended by max_lag
+  rows (exact for lags 0..max_lag), and the per-block cross-spectra of all
+  pairs are summed with one batched matrix product. Negative lags are the
+  transposed positive ones.
+- "changes" correlates row-over-row differences instead of levels, so two
+  series that merely both grow over the campaign don't look related.
+- Missing readings count as the column mean (0 after standardization).
+"""
+
+MAX_LAG = {"day": 90, "week": 26, "month": 12, "year": 3}
+SEGMENT = 256
+MIN_ROWS = 8
+
+
+@dataclass
+class LeadLag:
+    columns: List[str]
+    rows: int
+    max_lag: int
+    corr: np.ndarray   # (C, C) correlation at lag 0
+    peak: np.ndarray   # (C, C) correlation at the strongest lag
+    lag: np.ndarray    # (C, C) lag of `peak`; lag[i, j] > 0: column i leads column j
+
+    def top_pairs(self, count: int = 20, min_lag: int = 1) -> List[Tuple[str, str, int, float]]:
+        """(leader, follower, lag, r) of the strongest lagged relations."""
+        i, j = np.nonzero((self.lag >= min_lag) & np.isfinite(self.peak))
+        order = np.argsort(-np.abs(self.peak[i, j]))[:count]
+        return [(self.columns[i[k]], self.columns[j[k]], int(self.lag[i[k], j[k]]), float(self.peak[i[k], j[k]]))
+                for k in order]
+
+
+def _standardize(values: np.ndarray) -> np.ndarray:
+    with np.errstate(invalid="ignore", divide="ignore"):
+        z = (values - np.nanmean(values, axis=0)) / np.nanstd(values, axis=0)
+    z[~np.isfinite(z)] = 0.0  # missing readings and constant columns
+    return z
+
+
+def _cross_correlation(z: np.ndarray, max_lag: int) -> np.ndarray:
+    """(max_lag + 1, C, C) sums of z[t, i] * z[t + k, j] for k = 0..max_lag."""
+    n, width = z.shape
+    seg = max(SEGMENT, max_lag)
+    nfft = 1 << (seg + max_lag - 1).bit_length()
+    blocks = -(-n // seg)
+    padded = np.vstack([z, np.zeros((blocks * seg + max_lag - n, width))])
+
+    heads = padded[:blocks * seg].reshape(blocks, seg, width)
+    # Each block extended by max_lag rows: windows starting every `seg` rows (strided view)
+    tails = np.lib.stride_tricks.sliding_window_view(padded, seg + max_lag, axis=0)[::seg][:blocks]
+    fh = np.fft.rfft(heads, nfft, axis=1)                   # (blocks, freq, C)
+    ft = np.fft.rfft(tails, nfft, axis=2)                   # (blocks, C, freq)
+    # Sum over blocks of conj(fh_i) * ft_j for every pair: (freq, C, blocks) @ (freq, blocks, C)
+    cross = np.conj(fh).transpose(1, 2, 0) @ ft.transpose(2, 0, 1)
+    return np.fft.irfft(cross, nfft, axis=0)[:max_lag + 1]
+
+
+def lead_lag(frame: pd.DataFrame, columns: List[str], max_lag: int, changes: bool = False) -> LeadLag:
+    """Lag-0 and strongest-lag correlations between `columns` of `frame` (rows in time order)."""
+    columns = [c for c in columns if c in frame.columns]
+    values = frame[columns].to_numpy(dtype=float)
+    if changes:
+        values = np.diff(values, axis=0)
+    n = len(values)
+    max_lag = max(0, min(max_lag, n - MIN_ROWS))
+    width = len(columns)
+    if n < MIN_ROWS or not width:
+        empty = np.full((width, width), np.nan)
+        return LeadLag(columns, n, 0, empty, empty.copy(), np.zeros((width, width), dtype=int))
+
+    z = _standardize(values)
+    # Columns with no variation have no correlation with anything
+    flat = ~(z != 0).any(axis=0)
+    positive = _cross_correlation(z, max_lag)
+    negative = positive[:0:-1].transpose(0, 2, 1)           # lag -k of (i, j) = lag k of (j, i)
+    lags = np.arange(-max_lag, max_lag + 1)
+    xc = np.concatenate([negative, positive]) / (n - np.abs(lags))[:, None, None]
+    xc[:, flat, :] = np.nan
+    xc[:, :, flat] = np.nan
+
+    best = np.nanargmax(np.abs(np.where(np.isnan(xc), 0.0, xc)), axis=0)
+    peak = np.take_along_axis(xc, best[None], axis=0)[0]
+    lag = lags[best]
+    np.fill_diagonal(lag, 0)
+    corr = xc[max_lag].copy()
+    np.fill_diagonal(peak, np.diag(corr))
+    return LeadLag(columns, n, max_lag, corr, peak, lag)
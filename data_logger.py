@@ -4,29 +4,14 @@ from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
+from variable_registry import REGISTRY
+
 BASE_DIR = Path.home() / "Documents" / "SR2030_Logger"
 LOGS_DIR = BASE_DIR / "logs"
 LOGS_DIR.mkdir(parents=True, exist_ok=True)
 
-ALL_POSSIBLE_COLUMNS = [
-    "GameName", "Nation", "GameDate", "Population", "Domestic Approval", "Military Approval", 
-    "Literacy", "Credit Rating", "Treaty Integrity", "Subsidy Rate", "Tourism", "Treasury", 
-    "Bond Debt", "GDP/c", "Inflation", "Unemployment", "Research Efficiency", 
-    "Active Personnel", "Reserve Personnel", "Emigration", "Immigration", "Births", "Deaths",
-    "Agriculture", "Rubber", "Timber", "Petroleum", "Coal", "Metal Ore", "Uranium", 
-    "Electric Power", "Consumer Goods", "Industry Goods", "Military Goods",
-    "Agriculture Production Cost", "Rubber Production Cost", "Timber Production Cost", 
-    "Petroleum Production Cost", "Coal Production Cost", "Metal Ore Production Cost", 
-    "Uranium Production Cost", "Electric Power Production Cost", "Consumer Goods Production Cost", 
-    "Industry Goods Production Cost", "Military Goods Production Cost",
-    "Agriculture Market Price", "Rubber Market Price", "Timber Market Price", 
-    "Petroleum Market Price", "Coal Market Price", "Metal Ore Market Price", 
-    "Uranium Market Price", "Electric Power Market Price", "Consumer Goods Market Price", 
-    "Industry Goods Market Price", "Military Goods Market Price",
-    "Agriculture Trades", "Rubber Trades", "Timber Trades", "Petroleum Trades", 
-    "Coal Trades", "Metal Ore Trades", "Uranium Trades", "Electric Power Trades", 
-    "Consumer Goods Trades", "Industry Goods Trades", "Military Goods Trades",
-]
+# Column order for new log files: metadata first, then every registry variable
+ALL_POSSIBLE_COLUMNS = ["GameName", "Nation", "GameDate"] + REGISTRY.names()
 
 
 def _sanitize_filename(text: str) -> str:
@@ -65,6 +50,15 @@ def get_log_file_path(game_name: str, nation: str, use_timestamp: bool = False)
     return LOGS_DIR / filename
 
 
+def _read_header(file_path: Path) -> Optional[list]:
+    """Column names of an existing log (first line), or None."""
+    try:
+        with open(file_path, 'r', newline='', encoding='utf-8-sig') as f:
+            return next(csv.reader(f), None)
+    except Exception:
+        return None
+
+
 def log_to_csv(file_path: Path, data_dict: dict, game_date: str) -> bool:
     """Write data row to CSV"""
     if not data_dict:
@@ -73,6 +67,10 @@ def log_to_csv(file_path: Path, data_dict: dict, game_date: str) -> bool:
     file_path = Path(file_path)
     file_exists = file_path.exists() and file_path.stat().st_size > 0
 
+    # Append using the file's own header so logs created before a registry
+    # change keep their column layout (new variables are left out of old files)
+    fieldnames = (_read_header(file_path) if file_exists else None) or ALL_POSSIBLE_COLUMNS
+
     # Prepare data with correct mapping
     row_data = {key: data_dict.get(key) for key in ALL_POSSIBLE_COLUMNS}
     row_data['GameName'] = data_dict.get('game_name', data_dict.get('GameName'))
@@ -81,7 +79,7 @@ def log_to_csv(file_path: Path, data_dict: dict, game_date: str) -> bool:
 
     try:
         with open(file_path, mode='a', newline='', encoding='utf-8') as file:
-            writer = csv.DictWriter(file, fieldnames=ALL_POSSIBLE_COLUMNS, extrasaction='ignore')
+            writer = csv.DictWriter(file, fieldnames=fieldnames, extrasaction='ignore')
             if not file_exists:
                 writer.writeheader()
             writer.writerow(row_data)
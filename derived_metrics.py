@@ -0,0 +1,148 @@
+import re
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from variable_registry import RESOURCES
+
+"""
+Supreme Ruler 2030 - Derived Metrics
+- Numbers players care about that the game doesn't expose directly, declared
+  as formulas over logged columns:  "{Petroleum Market Price} - {Petroleum Production Cost}"
+- Each formula is compiled once into an expression over whole NumPy columns.
+- DerivedEngine.extend() adds the derived columns to a view; given the previous
+  version of the same view (before new rows arrived) it keeps the unchanged
+  prefix and only evaluates the new rows.
+- On weekly/monthly/yearly views the formulas are applied to the bucket means.
+"""
+
+_PLACEHOLDER = re.compile(r"\{([^{}]+)\}")
+
+
+def resource_columns(res_name: str) -> Dict[str, str]:
+    """Log column names of one resource."""
+    return {
+        "stock": res_name,
+        "cost": f"{res_name} Production Cost",
+        "price": f"{res_name} Market Price",
+        "trades": f"{res_name} Trades",
+    }
+
+
+# ============================================================
+# METRIC DEFINITION
+# ============================================================
+
+@dataclass(frozen=True)
+class DerivedMetric:
+    name: str
+    formula: str
+    category: str
+    format: Optional[str] = None  # "money", "percent", or None (plain number)
+    inputs: Tuple[str, ...] = field(init=False)
+    _code: object = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        inputs = tuple(dict.fromkeys(_PLACEHOLDER.findall(self.formula)))
+        expr = _PLACEHOLDER.sub(lambda m: f"_{inputs.index(m.group(1))}", self.formula)
+        object.__setattr__(self, "inputs", inputs)
+        object.__setattr__(self, "_code", compile(expr, f"<derived {self.name}>", "eval"))
+
+    def evaluate(self, frame: pd.DataFrame, start: int = 0) -> np.ndarray:
+        """Whole-column evaluation over frame rows [start:] (inf from x/0 becomes NaN)."""
+        env = {f"_{i}": frame[col].to_numpy(dtype=float)[start:] for i, col in enumerate(self.inputs)}
+        with np.errstate(all="ignore"):
+            out = np.asarray(eval(self._code, {"__builtins__": {}, "np": np}, env), dtype=float)
+        out[~np.isfinite(out)] = np.nan
+        return out
+
+
+def _default_metrics() -> List[DerivedMetric]:
+    metrics = []
+    for res in RESOURCES:
+        cols = resource_columns(res)
+        metrics.append(DerivedMetric(f"{res} Margin", f"{{{cols['price']}}} - {{{cols['cost']}}}",
+                                     "Derived - Resources", "money"))
+    for res in RESOURCES:
+        cols = resource_columns(res)
+        metrics.append(DerivedMetric(f"{res} Trade Value", f"{{{cols['trades']}}} * {{{cols['price']}}}",
+                                     "Derived - Resources", "money"))
+
+    metrics += [
+        DerivedMetric("Natural Growth", "{Births} - {Deaths}", "Derived - Society"),
+        DerivedMetric("Net Migration", "{Immigration} - {Emigration}", "Derived - Society"),
+        DerivedMetric("Population Change", "{Births} - {Deaths} + {Immigration} - {Emigration}",
+                      "Derived - Society"),
+        DerivedMetric("GDP", "{GDP/c} * {Population}", "Derived - Society", "money"),
+        DerivedMetric("Treasury per Capita", "{Treasury} / {Population}", "Derived - Society", "money"),
+        DerivedMetric("Debt per Capita", "{Bond Debt} / {Population}", "Derived - Society", "money"),
+        DerivedMetric("Personnel per 1000", "({Active Personnel} + {Reserve Personnel}) / {Population} * 1000",
+                      "Derived - Society"),
+    ]
+    return metrics
+
+
+DERIVED_METRICS: List[DerivedMetric] = _default_metrics()
+
+
+def derived_categories(metrics: List[DerivedMetric] = DERIVED_METRICS) -> Dict[str, List[str]]:
+    cats: Dict[str, List[str]] = {}
+    for m in metrics:
+        cats.setdefault(m.category, []).append(m.name)
+    return cats
+
+
+def derived_with_format(fmt: str, metrics: List[DerivedMetric] = DERIVED_METRICS) -> set:
+    return {m.name for m in metrics if m.format == fmt}
+
+
+# ============================================================
+# ENGINE
+# ============================================================
+
+class DerivedEngine:
+    def __init__(self, metrics: Optional[List[DerivedMetric]] = None):
+        self.metrics = metrics if metrics is not None else DERIVED_METRICS
+
+    def available(self, columns) -> List[DerivedMetric]:
+        """Metrics whose inputs are all present."""
+        present = set(columns)
+        return [m for m in self.metrics if present.issuperset(m.inputs)]
+
+    def names(self, columns) -> List[str]:
+        return [m.name for m in self.available(columns)]
+
+    @staticmethod
+    def _reusable_rows(frame: pd.DataFrame, previous: Optional[pd.DataFrame]) -> int:
+        """
+        Rows of `previous` still valid for `frame`: everything but its last row
+        (an open weekly/monthly bucket may have changed), provided the dates agree.
+        """
+        if previous is None or len(previous) < 2 or len(frame) < len(previous):
+            return 0
+        keep = len(previous) - 1
+        dates, old = frame["GameDate"].to_numpy(), previous["GameDate"].to_numpy()
+        if dates[0] != old[0] or dates[keep - 1] != old[keep - 1]:
+            return 0
+        return keep
+
+    def extend(self, frame: pd.DataFrame, previous: Optional[pd.DataFrame] = None) -> pd.DataFrame:
+        """
+        `frame` plus one column per available derived metric. `previous` is the
+        same view before rows were appended: its values are reused for the
+        unchanged prefix so only the new rows are evaluated.
+        """
+        keep = self._reusable_rows(frame, previous)
+        derived = {}
+        for m in self.available(frame.columns):
+            if keep and m.name in previous.columns:
+                head = previous[m.name].to_numpy(dtype=float)[:keep]
+                derived[m.name] = np.concatenate([head, m.evaluate(frame, keep)])
+            else:
+                derived[m.name] = m.evaluate(frame)
+        if not derived:
+            return frame
+        frame = frame.drop(columns=[c for c in derived if c in frame.columns])
+        return pd.concat([frame, pd.DataFrame(derived, index=frame.index)], axis=1)
@@ -0,0 +1,242 @@
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional
+
+import numpy as np
+import matplotlib.dates as mdates
+
+"""
+Supreme Ruler 2030 - Viewport Downsampling
+- LTTB (Largest-Triangle-Three-Buckets) and min/max-per-bucket reducers.
+- ViewportDownsampler keeps the full series of each line and re-reduces only
+  the visible x-range whenever the axis is panned, zoomed or resized, so a
+  line never holds more points than the axis has pixels.
+- Markers and per-point value labels are only drawn when few raw points are
+  visible, keeping redraws bounded regardless of campaign length.
+- Live charts patch the tail in place (update_tail): series buffers grow
+  geometrically and only the new points are appended to the drawn line.
+"""
+
+# Raw visible points at or below which markers / value labels are drawn
+MARKER_THRESHOLD = 400
+LABEL_THRESHOLD = 60
+
+
+# ============================================================
+# REDUCERS (return indices into the input arrays)
+# ============================================================
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """Largest-Triangle-Three-Buckets: keeps the visually significant points."""
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.intp)
+    out = np.empty(n_out, dtype=np.intp)
+    out[0], out[-1] = 0, n - 1
+
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        if hi <= lo:
+            hi = lo + 1
+        nlo = hi
+        nhi = edges[i + 2] if i + 2 < len(edges) else n
+        if nhi <= nlo:
+            nhi = nlo + 1
+        avg_x = x[nlo:nhi].mean()
+        avg_y = y[nlo:nhi].mean()
+
+        xs, ys = x[lo:hi], y[lo:hi]
+        area = np.abs((x[a] - avg_x) * (ys - y[a]) - (x[a] - xs) * (avg_y - y[a]))
+        a = lo + int(np.argmax(area))
+        out[i + 1] = a
+    return out
+
+
+def minmax_indices(y: np.ndarray, buckets: int) -> np.ndarray:
+    """Min and max of each bucket, in order: spikes survive the reduction."""
+    n = len(y)
+    if n <= buckets * 2:
+        return np.arange(n)
+    size = n // buckets
+    trimmed = size * buckets
+    yb = y[:trimmed].reshape(buckets, size)
+    base = np.arange(buckets) * size
+    i_min = base + np.argmin(np.where(np.isnan(yb), np.inf, yb), axis=1)
+    i_max = base + np.argmax(np.where(np.isnan(yb), -np.inf, yb), axis=1)
+    tail = np.arange(trimmed, n)
+    return np.unique(np.concatenate([i_min, i_max, tail]))
+
+
+def reduce_indices(x: np.ndarray, y: np.ndarray, n_out: int, method: str = "lttb") -> np.ndarray:
+    if method == "minmax":
+        return minmax_indices(y, max(1, n_out // 2))
+    return lttb_indices(x, y, n_out)
+
+
+# ============================================================
+# VIEWPORT-AWARE LINES
+# ============================================================
+
+def _to_float_x(x) -> np.ndarray:
+    x = np.asarray(x)
+    if np.issubdtype(x.dtype, np.datetime64):
+        x = mdates.date2num(x)
+    return np.asarray(x, dtype=float)
+
+
+@dataclass
+class _Series:
+    line: object
+    buf_x: np.ndarray                 # matplotlib date numbers (float days), capacity >= n
+    buf_y: np.ndarray
+    n: int
+    marker: str
+    label_fmt: Optional[Callable[[float], str]]
+    text_kwargs: dict
+    texts: List[object] = field(default_factory=list)
+
+    @property
+    def x(self) -> np.ndarray:
+        return self.buf_x[:self.n]
+
+    @property
+    def y(self) -> np.ndarray:
+        return self.buf_y[:self.n]
+
+    def replace_from(self, cut: int, x: np.ndarray, y: np.ndarray):
+        """Drop points from `cut` on and append (x, y); amortized O(len(x))."""
+        need = cut + len(x)
+        if need > len(self.buf_x):
+            cap = max(need, 2 * len(self.buf_x), 64)
+            self.buf_x = np.resize(self.buf_x, cap)
+            self.buf_y = np.resize(self.buf_y, cap)
+        self.buf_x[cut:need] = x
+        self.buf_y[cut:need] = y
+        self.n = need
+
+
+class ViewportDownsampler:
+    """
+    Attach to an axes, then `add()` each plotted line with its full data.
+    The line's data is replaced by a reduction of the visible range on every
+    x-limit change.
+    """
+
+    def __init__(self, ax, method: str = "lttb", points_per_px: float = 1.0,
+                 marker_threshold: int = MARKER_THRESHOLD, label_threshold: int = LABEL_THRESHOLD):
+        self.ax = ax
+        self.method = method
+        self.points_per_px = points_per_px
+        self.marker_threshold = marker_threshold
+        self.label_threshold = label_threshold
+        self.series: List[_Series] = []
+        self._last_key = None
+
+        # Shared-x siblings (twinx, sharex subplots) change limits without emitting
+        # on each other, so listen on all of them
+        for other in ax.get_shared_x_axes().get_siblings(ax):
+            other.callbacks.connect("xlim_changed", lambda _ax: self.refresh())
+        self._resize_cid = ax.figure.canvas.mpl_connect("resize_event", lambda _e: self.refresh(force=True))
+
+    def disconnect(self):
+        """Stop listening to canvas resizes (axes callbacks die with ax.clear())."""
+        self.ax.figure.canvas.mpl_disconnect(self._resize_cid)
+
+    def add(self, line, x, y, label_fmt: Optional[Callable[[float], str]] = None, **text_kwargs):
+        x = _to_float_x(x)
+        y = np.asarray(y, dtype=float)
+
+        keep = np.isfinite(x) & np.isfinite(y)
+        x, y = x[keep], y[keep]
+        s = _Series(line, x, y, len(x), line.get_marker(), label_fmt, text_kwargs)
+        self.series.append(s)
+        self._apply(s, 0, len(s.x))
+        # set_data() doesn't touch dataLim: recompute it from the full-range reduction
+        self.ax.relim()
+        self.ax.autoscale_view()
+        return line
+
+    def set_series(self, line, x, y):
+        """Swap the full data behind `line` (e.g. another aggregation level) and redraw the visible range."""
+        s = next((s for s in self.series if s.line is line), None)
+        if s is None:
+            return
+        x = _to_float_x(x)
+        y = np.asarray(y, dtype=float)
+        keep = np.isfinite(x) & np.isfinite(y)
+        s.replace_from(0, x[keep], y[keep])
+        self.refresh(force=True)
+
+    def update_tail(self, line, x, y) -> bool:
+        """
+        Replace the points of `line` from x[0] onward with (x, y), e.g. the
+        re-aggregated trailing buckets of a live log. Only the new points are
+        reduced/appended, so the cost does not depend on the series length.
+        Returns False if the line needs a full redraw (labels or markers changed).
+        """
+        s = next((s for s in self.series if s.line is line), None)
+        x = _to_float_x(x)
+        y = np.asarray(y, dtype=float)
+        keep = np.isfinite(x) & np.isfinite(y)
+        x, y = x[keep], y[keep]
+        if s is None or not len(x):
+            return True
+
+        s.replace_from(int(np.searchsorted(s.x, x[0], side="left")), x, y)
+
+        lx = np.asarray(line.get_xdata(), dtype=float)
+        ly = np.asarray(line.get_ydata(), dtype=float)
+        cut = int(np.searchsorted(lx, x[0], side="left"))
+        line.set_data(np.concatenate([lx[:cut], x]), np.concatenate([ly[:cut], y]))
+
+        # Appended points are not reduced: re-reduce once they double the budget
+        if len(line.get_xdata()) > 2 * self._budget():
+            self.refresh(force=True)
+            return False
+        return not s.texts
+
+    def _budget(self) -> int:
+        width_px = self.ax.bbox.width if self.ax.bbox.width > 1 else 800
+        return max(200, int(width_px * self.points_per_px))
+
+    def refresh(self, force: bool = False):
+        if not self.series:
+            return
+        x0, x1 = self.ax.get_xlim()
+        key = (x0, x1, self._budget())
+        if key == self._last_key and not force:
+            return
+        self._last_key = key
+
+        for s in self.series:
+            lo = max(0, int(np.searchsorted(s.x, x0, side="left")) - 1)
+            hi = min(len(s.x), int(np.searchsorted(s.x, x1, side="right")) + 1)
+            self._apply(s, lo, hi)
+
+    def _apply(self, s: _Series, lo: int, hi: int):
+        xs, ys = s.x[lo:hi], s.y[lo:hi]
+        visible = len(xs)
+        budget = self._budget()
+
+        if visible > budget:
+            idx = reduce_indices(xs, ys, budget, self.method)
+            xs, ys = xs[idx], ys[idx]
+        s.line.set_data(xs, ys)
+        s.line.set_marker(s.marker if visible <= self.marker_threshold else "None")
+
+        for t in s.texts:
+            t.remove()
+        s.texts = []
+        if s.label_fmt and visible <= self.label_threshold:
+            for x, y in zip(xs, ys):
+                s.texts.append(self.ax.text(x, y, s.label_fmt(y), clip_on=True, **s.text_kwargs))
+        self.sync_visibility()
+
+    def sync_visibility(self):
+        """Labels follow their line's visibility (call after toggling lines)."""
+        for s in self.series:
+            vis = s.line.get_visible()
+            for t in s.texts:
+                t.set_visible(vis)
@@ -0,0 +1,362 @@
+import sys
+import json
+import time
+import queue
+import logging
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from memory_reader import MemoryReader, PROCESS_NAME
+from variable_registry import REGISTRY, ReadPlan
+
+"""
+Supreme Ruler 2030 - High-Rate Intraday Capture
+- Samples a few selected variables at 100-500 Hz, ignoring the day signature.
+- Samples go into preallocated NumPy chunk buffers; full chunks are handed to a
+  background flusher that writes them as compressed .npz files, then recycled.
+- Uses its own MemoryReader (own process handle) and threads, so the daily
+  logging sessions are never blocked.
+"""
+
+logger = logging.getLogger(__name__)
+
+BASE_DIR = Path.home() / "Documents" / "SR2030_Logger"
+CAPTURE_DIR = BASE_DIR / "logs" / "intraday"
+
+DEFAULT_VARIABLES = [
+    "Treasury",
+    "Agriculture", "Petroleum", "Consumer Goods", "Industry Goods", "Military Goods",
+    "Agriculture Trades", "Petroleum Trades", "Consumer Goods Trades",
+]
+
+MIN_RATE_HZ = 1.0
+MAX_RATE_HZ = 1000.0
+REATTACH_AFTER = 50        # consecutive failed reads (load screen) before re-attaching
+REATTACH_INTERVAL = 1.0    # seconds between re-attach attempts
+
+
+# ============================================================
+# READ PLANS
+# ============================================================
+
+class _PlanLayout:
+    """Registry read plan for one base pointer, decoding straight into a capture row."""
+
+    def __init__(self, plan: ReadPlan, columns: Dict[str, int]):
+        self.plan = plan
+        self.blocks = [(block, np.array([columns[n] for n in block.all_names()], dtype=np.intp))
+                       for block in plan.blocks]
+        self.all_columns = np.concatenate([cols for _, cols in self.blocks])
+
+    def read_into(self, read_block, base_addr: int, row: np.ndarray) -> bool:
+        ok = True
+        for block, cols in self.blocks:
+            raw = read_block(base_addr + block.start, block.size)
+            if raw is None:
+                row[cols] = np.nan
+                ok = False
+            else:
+                row[cols] = [value for _, value in block.decode(raw)]
+        return ok
+
+
+def _build_layouts(variables: List[str]) -> Tuple[Optional[_PlanLayout], Optional[_PlanLayout]]:
+    unknown = [name for name in variables if name not in REGISTRY.by_name]
+    if unknown:
+        raise ValueError(f"Unknown variable: {', '.join(unknown)}")
+
+    columns = {name: i for i, name in enumerate(variables, start=1)}  # column 0 is the timestamp
+    layouts = []
+    for base in ("nation", "market"):
+        plan = REGISTRY.read_plan(base, variables)
+        layouts.append(_PlanLayout(plan, columns) if plan else None)
+    return layouts[0], layouts[1]
+
+
+# ============================================================
+# CAPTURE
+# ============================================================
+
+class IntradayCapture:
+    """
+    High-rate sampler. Usage:
+        cap = IntradayCapture(["Treasury", "Petroleum"], rate_hz=250)
+        cap.start(); ...; cap.stop()
+    Output: CAPTURE_DIR/<label>_<timestamp>/capture.json + chunk_00000.npz ...
+    Each chunk holds `data` with shape (n, 1 + len(variables)); column 0 is
+    seconds since capture start.
+    """
+
+    def __init__(self,
+                 variables: List[str],
+                 rate_hz: float = 200.0,
+                 chunk_seconds: float = 5.0,
+                 game_version: str = "FastTrack",
+                 pid: Optional[int] = None,
+                 label: str = "capture",
+                 spare_buffers: int = 4):
+        if not variables:
+            raise ValueError("Select at least one variable to capture.")
+        self.variables = list(variables)
+        self.rate_hz = min(MAX_RATE_HZ, max(MIN_RATE_HZ, float(rate_hz)))
+        self.period = 1.0 / self.rate_hz
+        self.chunk_len = max(1, int(self.rate_hz * chunk_seconds))
+        self.width = 1 + len(self.variables)
+
+        self.reader = MemoryReader(PROCESS_NAME, game_version, pid=pid)
+        self.nation_layout, self.market_layout = _build_layouts(self.variables)
+
+        safe_label = "".join(c for c in label if c.isalnum() or c in ("-", "_")) or "capture"
+        self.out_dir = CAPTURE_DIR / f"{safe_label}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+
+        # Preallocated buffer pool (chunk buffers are recycled by the flusher)
+        self._free: "queue.Queue[np.ndarray]" = queue.Queue()
+        for _ in range(spare_buffers):
+            self._free.put(np.empty((self.chunk_len, self.width), dtype=np.float64))
+        self._full: "queue.Queue[Optional[Tuple[int, np.ndarray, int]]]" = queue.Queue()
+
+        self._stop = threading.Event()
+        self._sampler: Optional[threading.Thread] = None
+        self._flusher: Optional[threading.Thread] = None
+
+        # Stats
+        self.samples = 0
+        self.failed_reads = 0
+        self.late_ticks = 0
+        self.chunks_written = 0
+        self.extra_buffers = 0
+        self.started_at = 0.0
+        self.error: Optional[str] = None
+
+    # ---------------- PUBLIC API ----------------
+
+    def start(self):
+        if not self.reader.attach() or not self.reader.final_base_ptr:
+            raise RuntimeError("Could not attach to the game process.")
+
+        self.out_dir.mkdir(parents=True, exist_ok=True)
+        meta = {
+            "variables": self.variables,
+            "rate_hz": self.rate_hz,
+            "chunk_len": self.chunk_len,
+            "game_version": self.reader.game_version,
+            "pid": self.reader.pid,
+            "started": datetime.now().isoformat(),
+        }
+        with open(self.out_dir / "capture.json", "w", encoding="utf-8") as f:
+            json.dump(meta, f, indent=2)
+
+        self._stop.clear()
+        self._flusher = threading.Thread(target=self._flush_loop, name="capture-flusher", daemon=True)
+        self._sampler = threading.Thread(target=self._sample_loop, name="capture-sampler", daemon=True)
+        self._flusher.start()
+        self._sampler.start()
+        logger.info(f"⏱ Intraday capture started: {len(self.variables)} vars @ {self.rate_hz:.0f} Hz → {self.out_dir}")
+
+    def stop(self):
+        self._stop.set()
+        if self._sampler:
+            self._sampler.join(timeout=5.0)
+        if self._flusher:
+            self._flusher.join(timeout=30.0)
+        self._write_summary()
+        logger.info(f"⏱ Intraday capture stopped: {self.samples} samples, {self.chunks_written} chunks.")
+
+    def is_running(self) -> bool:
+        return self._sampler is not None and self._sampler.is_alive()
+
+    @property
+    def achieved_hz(self) -> float:
+        elapsed = time.perf_counter() - self.started_at if self.started_at else 0.0
+        return self.samples / elapsed if elapsed > 0 else 0.0
+
+    def stats(self) -> dict:
+        return {
+            "samples": self.samples,
+            "achieved_hz": round(self.achieved_hz, 1),
+            "late_ticks": self.late_ticks,
+            "failed_reads": self.failed_reads,
+            "chunks_written": self.chunks_written,
+            "extra_buffers": self.extra_buffers,
+            "pending_chunks": self._full.qsize(),
+        }
+
+    # ---------------- SAMPLER ----------------
+
+    def _take_buffer(self) -> np.ndarray:
+        try:
+            return self._free.get_nowait()
+        except queue.Empty:
+            # Flusher fell behind: grow the pool rather than drop samples
+            self.extra_buffers += 1
+            return np.empty((self.chunk_len, self.width), dtype=np.float64)
+
+    def _read_row(self, row: np.ndarray, market_base: Optional[int]) -> bool:
+        reader = self.reader
+        if self.nation_layout:
+            if not self.nation_layout.read_into(reader.read_block, reader.final_base_ptr, row):
+                return False
+        if self.market_layout:
+            if market_base:
+                self.market_layout.read_into(reader.read_block, market_base, row)
+            else:
+                row[self.market_layout.all_columns] = np.nan
+        return True
+
+    def _sample_loop(self):
+        high_res = _begin_high_res_timer()
+        try:
+            buf = self._take_buffer()
+            n = 0
+            chunk_idx = 0
+            market_base = self.reader.resolve_market_base() if self.market_layout else None
+
+            self.started_at = time.perf_counter()
+            next_t = self.started_at
+            perf = time.perf_counter
+            misses = 0
+            last_attach = self.started_at
+
+            while not self._stop.is_set():
+                # Plain sleep: the 1 ms timer resolution keeps jitter under a millisecond
+                # without spinning a core (and holding the GIL) every tick
+                remaining = next_t - perf()
+                if remaining > 0:
+                    time.sleep(remaining)
+
+                now = perf()
+                row = buf[n]
+                row[0] = now - self.started_at
+                if self._read_row(row, market_base):
+                    n += 1
+                    self.samples += 1
+                    misses = 0
+                else:
+                    self.failed_reads += 1
+                    misses += 1
+                    if not self.reader.is_active():
+                        self.error = "Lost the game process."
+                        break
+                    # Load screens fail every read: re-attach now and then, not every tick
+                    if misses >= REATTACH_AFTER and now - last_attach >= REATTACH_INTERVAL:
+                        last_attach = now
+                        if not self.reader.attach():
+                            self.error = "Lost the game process."
+                            break
+                        if self.market_layout:
+                            market_base = self.reader.resolve_market_base()
+
+                if n == self.chunk_len:
+                    self._full.put((chunk_idx, buf, n))
+                    chunk_idx += 1
+                    buf = self._take_buffer()
+                    n = 0
+                    if self.market_layout:
+                        market_base = self.reader.resolve_market_base()
+
+                next_t += self.period
+                if perf() - next_t > self.period:
+                    # More than one tick behind: don't burst to catch up, just re-anchor
+                    self.late_ticks += 1
+                    next_t = perf()
+
+            if n:
+                self._full.put((chunk_idx, buf, n))
+        except Exception as e:
+            self.error = str(e)
+            logger.error(f"Intraday capture sampler failed: {e}")
+        finally:
+            _end_high_res_timer(high_res)
+            self._full.put(None)  # flusher sentinel
+
+    # ---------------- FLUSHER ----------------
+
+    def _flush_loop(self):
+        while True:
+            item = self._full.get()
+            if item is None:
+                break
+            chunk_idx, buf, n = item
+            try:
+                np.savez_compressed(self.out_dir / f"chunk_{chunk_idx:05d}.npz", data=buf[:n])
+                self.chunks_written += 1
+            except Exception as e:
+                self.error = str(e)
+                logger.error(f"Intraday capture flush failed: {e}")
+            finally:
+                self._free.put(buf)
+
+    def _write_summary(self):
+        meta_path = self.out_dir / "capture.json"
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            meta["stopped"] = datetime.now().isoformat()
+            meta["stats"] = self.stats()
+            if self.error:
+                meta["error"] = self.error
+            with open(meta_path, "w", encoding="utf-8") as f:
+                json.dump(meta, f, indent=2)
+        except Exception as e:
+            logger.error(f"Could not update capture summary: {e}")
+
+
+# ============================================================
+# WINDOWS TIMER RESOLUTION
+# ============================================================
+
+def _begin_high_res_timer() -> bool:
+    """Ask Windows for 1 ms timer resolution (default ~15.6 ms breaks 100+ Hz sleeps)."""
+    if sys.platform != "win32":
+        return False
+    try:
+        import ctypes
+        return ctypes.windll.winmm.timeBeginPeriod(1) == 0
+    except Exception:
+        return False
+
+
+def _end_high_res_timer(active: bool):
+    if not active:
+        return
+    try:
+        import ctypes
+        ctypes.windll.winmm.timeEndPeriod(1)
+    except Exception:
+        pass
+
+
+# ============================================================
+# LOADING (used by the analytics viewer)
+# ============================================================
+
+def list_captures() -> List[Path]:
+    """Capture folders, newest first."""
+    if not CAPTURE_DIR.exists():
+        return []
+    dirs = [d for d in CAPTURE_DIR.iterdir() if (d / "capture.json").exists()]
+    return sorted(dirs, key=lambda d: d.stat().st_mtime, reverse=True)
+
+
+def load_capture(capture_dir: Path) -> Tuple[dict, np.ndarray, Dict[str, np.ndarray]]:
+    """
+    Load a capture folder.
+    Returns (meta, t_seconds, {variable: values}).
+    """
+    capture_dir = Path(capture_dir)
+    with open(capture_dir / "capture.json", "r", encoding="utf-8") as f:
+        meta = json.load(f)
+
+    chunks = []
+    for chunk_path in sorted(capture_dir.glob("chunk_*.npz")):
+        with np.load(chunk_path) as npz:
+            chunks.append(npz["data"])
+
+    width = 1 + len(meta["variables"])
+    data = np.concatenate(chunks) if chunks else np.empty((0, width))
+    series = {name: data[:, i + 1] for i, name in enumerate(meta["variables"])}
+    return meta, data[:, 0], series
@@ -7,12 +7,14 @@ No sockets, no firewall warnings, no antivirus suspicion.
 Files used:
 - sr2030_analyzer.lock    : PID file indicating analyzer is running
 - sr2030_analyzer_cmd.json : Command mailbox (overlay writes, analyzer reads)
+- sr2030_alerts.json       : Recent live alerts (launcher writes, overlay reads)
 """
 
 import os
 import json
 import time
 import atexit
+import threading
 from pathlib import Path
 from typing import Callable, Optional
 from datetime import datetime
@@ -25,6 +27,7 @@ from datetime import datetime
 IPC_DIR = Path(os.environ.get('TEMP', os.environ.get('TMP', '/tmp')))
 LOCK_FILE = IPC_DIR / "sr2030_analyzer.lock"
 COMMAND_FILE = IPC_DIR / "sr2030_analyzer_cmd.json"
+ALERTS_FILE = IPC_DIR / "sr2030_alerts.json"
 
 # Polling interval for analyzer (ms)
 POLL_INTERVAL_MS = 300
@@ -32,6 +35,12 @@ POLL_INTERVAL_MS = 300
 # Command timeout (seconds) - ignore stale commands
 COMMAND_TIMEOUT = 10.0
 
+# Number of alerts kept in the alerts file
+ALERT_HISTORY = 20
+
+# Sampler threads of several sessions publish at once: one read-append-write at a time
+_alerts_lock = threading.Lock()
+
 
 # =============================================================================
 # UTILITY FUNCTIONS
@@ -244,6 +253,27 @@ class IPCClient:
         })
 
 
+# =============================================================================
+# ALERTS (Launcher -> Overlay)
+# =============================================================================
+
+def publish_alert(message: str, source: str = "") -> bool:
+    """Append an alert to the shared alerts file (keeps the last ALERT_HISTORY)."""
+    with _alerts_lock:
+        data = _read_json_safe(ALERTS_FILE) or {}
+        alerts = data.get('alerts', [])
+        alerts.append({'message': message, 'source': source, 'timestamp': time.time()})
+        return _write_json_safe(ALERTS_FILE, {'alerts': alerts[-ALERT_HISTORY:]})
+
+
+def read_alerts(since: float = 0.0) -> list:
+    """Alerts newer than `since` (unix time), oldest first."""
+    data = _read_json_safe(ALERTS_FILE)
+    if not data:
+        return []
+    return [a for a in data.get('alerts', []) if a.get('timestamp', 0) > since]
+
+
 # =============================================================================
 # CONVENIENCE FUNCTIONS
 # =============================================================================
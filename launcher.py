@@ -8,24 +8,24 @@ import sys
 import threading
 import logging
 import time
-import csv
 import atexit
-from datetime import datetime, timedelta
+from datetime import datetime
 from pathlib import Path
 
 # ---- External Dependencies ----
 # Optional but strongly recommended:
 #   pip install Pillow
-try:
-    from PIL import Image, ImageTk
-    HAS_PIL = True
-except ImportError:
-    HAS_PIL = False
+# Imported when the background is drawn, like the other heavy modules below.
 
 # ---- Local modules ----
+# Only what the window needs to appear. Analytics (pandas, matplotlib),
+# intraday capture and the alert compiler are imported on first use:
+# python scheduling.py importtime   shows what a cold start costs.
 from memory_reader import MemoryReader
-from data_logger import log_to_csv, get_log_file_path, get_existing_logs
-from analytics import show_simple_analytics
+from variable_registry import REGISTRY
+from logging_session import SESSIONS, LoggingSession, find_game_pids
+from scheduling import PROFILES, DEFAULT_PROFILE, CpuMonitor, apply_profile, run_benchmark
+from ipc_bridge import publish_alert
 
 # ---- Constants ----
 PROCESS_NAME = "SupremeRuler2030.exe"
@@ -55,17 +55,16 @@ logger = logging.getLogger(__name__)
 logging.getLogger("pymem").setLevel(logging.WARNING)
 
 # ---- Global state ----
-logging_active = False
-logging_started = False
-stop_event = threading.Event()
 overlay_process = None
-current_csv_path = None
 
 techtree_process = None
 
-# Shared config between UI and worker thread
+# Shared config between UI and logging sessions
 live_config = {}
 
+# UI hook for live alerts (set by App; called from sampler threads)
+alert_listener = None
+
 # ============================================================
 # CONFIG MANAGEMENT
 # ============================================================
@@ -86,6 +85,8 @@ def load_config():
         "nation": "",
         "enable_overlay": True,
         "enable_logger": True,
+        "scheduling_profile": DEFAULT_PROFILE,  # "performance" (HIGH priority) or "game_friendly"
+        "alert_rules": [],  # e.g. "Treasury < 0", "Military Approval drops 5% in 7 days"
     }
 
     if CONFIG_PATH.exists():
@@ -116,14 +117,20 @@ def save_config(config: dict):
 # HELPER FUNCTIONS
 # ============================================================
 
-def set_high_priority():
-    """Raise this process to high priority to reduce throttling when minimized."""
-    try:
-        p = psutil.Process(os.getpid())
-        p.nice(psutil.HIGH_PRIORITY_CLASS)
-        logger.info("Process priority set to HIGH.")
-    except Exception as e:
-        logger.warning(f"Could not set high priority: {e}")
+def _helper_pids() -> list[int]:
+    """PIDs of the overlay / tech tree processes started by the launcher."""
+    return [p.pid for p in (overlay_process, techtree_process) if p and p.poll() is None]
+
+
+def apply_scheduling_profile():
+    """
+    Apply the configured scheduling profile to the launcher and its helpers.
+    'performance' raises priority (legacy behaviour), 'game_friendly' lowers it and
+    pins the suite to cores the game isn't saturating. Blocks ~0.5s to sample core
+    load, so call it off the UI thread.
+    """
+    profile = live_config.get("scheduling_profile", DEFAULT_PROFILE)
+    return apply_profile(profile, extra_pids=_helper_pids())
 
 
 def is_game_running() -> bool:
@@ -145,27 +152,6 @@ def launch_game_steam(app_id: str) -> bool:
         return False
 
 
-def day_signature(sample: dict) -> str:
-    """
-    Day signature with tight thresholds.
-    Treasury grouped by 100K, Population grouped by 50.
-    Detects even small daily changes to prevent skipped days.
-    """
-    t = sample.get("Treasury")
-    p = sample.get("Population")
-
-    if t is None or p is None:
-        return "N/A"
-
-    try:
-        t_stable = int(float(t) // 100_000)   # treasury step → 100K (was 5M)
-        p_stable = int(float(p) // 50)        # population step → 50 (was 2K)
-        return f"T:{t_stable}_P:{p_stable}"
-    except Exception:
-        return "N/A"
-
-
-
 def get_last_date_from_csv(file_path: Path) -> str | None:
     """
     Inspect the last non-empty line of the CSV and try to parse the game date.
@@ -195,29 +181,6 @@ def get_last_date_from_csv(file_path: Path) -> str | None:
         return None
 
 
-def should_save(mode: str, current_date: str, last_saved_date: str | None) -> bool:
-    """
-    Decide whether to write a new row depending on the chosen save granularity.
-    Modes: Daily, Weekly, Monthly.
-    """
-    if not last_saved_date:
-        return True
-
-    try:
-        d_curr = datetime.strptime(current_date, "%Y-%m-%d")
-        d_last = datetime.strptime(last_saved_date, "%Y-%m-%d")
-
-        if mode == "Daily":
-            return d_curr > d_last
-        elif mode == "Weekly":
-            return (d_curr.isocalendar()[1], d_curr.year) != (d_last.isocalendar()[1], d_last.year)
-        elif mode == "Monthly":
-            return (d_curr.month, d_curr.year) != (d_last.month, d_last.year)
-        return False
-    except Exception:
-        # If parsing fails, err on the side of saving.
-        return True
-
 # ============================================================
 # OVERLAY MANAGEMENT
 # ============================================================
@@ -423,104 +386,46 @@ def kill_techtree():
 atexit.register(kill_techtree)
 
 # ============================================================
-# LOGGING THREAD
+# LOGGING SESSIONS
 # ============================================================
 
-def logging_worker(initial_config: dict, app_instance):
+def start_logging_session(game_name: str, nation: str, start_date: str, pid: int | None = None,
+                          **hooks) -> LoggingSession:
     """
-    Main logging loop running in a separate thread.
-    - Attaches once to the game process.
-    - Polls memory at a configurable interval.
-    - Detects day changes via a signature.
-    - Writes periodic snapshots to CSV.
+    Create and register a logging session on the shared sampler pool.
+    Settings (polling interval, save mode) are read live from `live_config`.
+    `hooks` (on_date_change, on_row_saved, on_stopped) are set before the session is scheduled.
     """
-    global logging_active, stop_event, current_csv_path, live_config
-
-    set_high_priority()
-
-    logging_active = True
-    stop_event.clear()
-
-    current_conf = live_config.copy()
-
-    game_name = current_conf.get("game_name", "").strip()
-    nation = current_conf.get("nation", "").strip()
-    current_date_str = current_conf.get("current_date", "2030-01-01")
-
-    try:
-        current_date_obj = datetime.strptime(current_date_str, "%Y-%m-%d")
-    except ValueError:
-        current_date_obj = datetime(2030, 1, 1)
-
-    csv_path = get_log_file_path(game_name, nation, use_timestamp=False)
-    current_csv_path = csv_path
-
-    last_sig = None
-    last_saved_date = None
-
-    reader = MemoryReader(PROCESS_NAME, current_conf.get("game_version", "FastTrack"))
-    if not reader.attach():
-        logger.info("Waiting for game process to attach...")
-
-    logger.info("🚀 Logger started.")
-    logger.info(f"📅 Start Date: {current_date_str}")
-
-    while not stop_event.is_set():
-        poll_interval = float(live_config.get("polling_interval", 1.0))
-        save_mode = live_config.get("save_mode", "Daily")
-
-        if not is_game_running():
-            logger.info("⚠️ Game process not found anymore. Stopping logger.")
-            break
-
-        data = reader.read_snapshot()
-
-        if data and data.get("Treasury") is not None:
-            sig = day_signature(data)
-
-            # First sample: just initialize the reference signature.
-            if last_sig is None:
-                last_sig = sig
-                time.sleep(poll_interval)
-                continue
-
-            # New day detected
-            if sig != last_sig:
-                current_date_obj += timedelta(days=1)
-                current_date_str = current_date_obj.strftime("%Y-%m-%d")
-
-                # Update UI in the main thread
-                app_instance.root.after(0, lambda d=current_date_str: app_instance.date_var.set(d))
-                live_config["current_date"] = current_date_str
-
-                # Only save when required by the selected mode
-                if should_save(save_mode, current_date_str, last_saved_date):
-                    payload = data.copy()
-                    payload["game_name"] = game_name
-                    payload["nation"] = nation
-
-                    if log_to_csv(csv_path, payload, current_date_str):
-                        last_saved_date = current_date_str
-                        app_instance.root.after(
-                            0,
-                            lambda d=current_date_str: app_instance.update_last_saved(d),
-                        )
-                    else:
-                        logger.error(f"❌ Failed to save row for day {current_date_str}")
-
-                last_sig = sig
-
-        time.sleep(poll_interval)
-
-    logger.info("🛑 Logger stopped.")
-
-    # Persist final date back into config.
-    live_config["current_date"] = current_date_str
-    save_config(live_config)
-
-    logging_active = False
-    current_csv_path = None
-    app_instance.root.after(0, app_instance.on_logger_stopped)
+    threading.Thread(target=apply_scheduling_profile, daemon=True).start()
+
+    session = LoggingSession(
+        game_name=game_name,
+        nation=nation,
+        start_date=start_date,
+        game_version=live_config.get("game_version", "FastTrack"),
+        pid=pid,
+        config_getter=lambda: live_config,
+        alert_rules=live_config.get("alert_rules", []),
+        **hooks,
+    )
+    session.on_alert = _dispatch_alert
+    return SESSIONS.start_session(session)
+
+
+def _dispatch_alert(session: LoggingSession, alert):
+    """Sampler thread: forward an alert to the overlay (IPC file) and the launcher UI."""
+    publish_alert(alert.message, source=session.label)
+    if alert_listener:
+        alert_listener(session, alert)
+
+
+def _first_free_game_pid() -> int | None:
+    """Pick the oldest game instance that no running session is attached to."""
+    used = {s.pid for s in SESSIONS.sessions() if s.pid}
+    for pid in find_game_pids():
+        if pid not in used:
+            return pid
+    return None
 
 # ============================================================
 # SETTINGS DIALOG
@@ -533,7 +438,7 @@ class SettingsDialog:
         self.config = config
         self.dialog = tk.Toplevel(parent)
         self.dialog.title("Ruler Intelligence Suite – Settings")
-        self.dialog.geometry("500x530")
+        self.dialog.geometry("500x600")
         self.dialog.transient(parent)
         self.dialog.grab_set()
 
@@ -648,6 +553,26 @@ class SettingsDialog:
         ttk.Entry(spotting_frame, textvariable=spotting_var, width=40).pack(side="left", fill="x", expand=True)
         ttk.Button(spotting_frame, text="Browse...", command=lambda: self.browse_spotting(spotting_var)).pack(side="left", padx=(10, 0))
 
+        # Scheduling profile
+        ttk.Label(
+            main,
+            text="Scheduling Profile:",
+            font=("Courier New", 10, "bold"),
+        ).grid(row=15, column=0, sticky="w", pady=(15, 5))
+        ttk.Label(
+            main,
+            text="game_friendly = low priority, off the game's busy core.",
+            font=("Courier New", 8),
+            foreground="gray",
+        ).grid(row=16, column=0, columnspan=2, sticky="w", padx=20)
+        profile_var = tk.StringVar(value=config.get("scheduling_profile", DEFAULT_PROFILE))
+        ttk.Combobox(
+            main,
+            textvariable=profile_var,
+            values=list(PROFILES),
+            state="readonly",
+            width=15,
+        ).grid(row=17, column=0, sticky="w", padx=20)
 
         def save():
             config["save_mode"] = mode_var.get()
@@ -656,7 +581,11 @@ class SettingsDialog:
             config["default_unit_path"] = unit_var.get()
             config["default_ttrx_path"] = ttrx_var.get()
             config["default_spotting_path"] = spotting_var.get()
+            profile_changed = config.get("scheduling_profile") != profile_var.get()
+            config["scheduling_profile"] = profile_var.get()
             save_config(config)
+            if profile_changed:
+                threading.Thread(target=apply_scheduling_profile, daemon=True).start()
             messagebox.showinfo("Saved", "Configuration updated.")
             self.dialog.destroy()
 
@@ -697,6 +626,318 @@ class SettingsDialog:
             self.config["default_spotting_path"] = filepath
             save_config(self.config)
 
+# ============================================================
+# SESSIONS DIALOG
+# ============================================================
+
+class SessionsDialog:
+    """
+    Lists every running logging session with its throughput stats and lets the
+    user attach extra sessions to other game instances (e.g. vanilla vs mod).
+    """
+
+    REFRESH_MS = 1000
+
+    def __init__(self, parent, config):
+        self.config = config
+        self.dialog = tk.Toplevel(parent)
+        self.dialog.title("Ruler Intelligence Suite – Sessions")
+        self.dialog.geometry("760x420")
+        self.dialog.transient(parent)
+
+        main = ttk.Frame(self.dialog, padding=10)
+        main.pack(fill=tk.BOTH, expand=True)
+
+        # Running sessions
+        cols = ("id", "pid", "target", "date", "rows", "rate", "read", "file")
+        headers = ("#", "PID", "Nation / Operation", "Game Date", "Rows", "Samples/s", "Avg Read", "File")
+        widths = (30, 60, 170, 90, 50, 75, 70, 180)
+
+        self.tree = ttk.Treeview(main, columns=cols, show="headings", height=8)
+        for c, h, w in zip(cols, headers, widths):
+            self.tree.heading(c, text=h)
+            self.tree.column(c, width=w, anchor="center")
+        self.tree.pack(fill=tk.BOTH, expand=True)
+
+        btns = ttk.Frame(main)
+        btns.pack(fill=tk.X, pady=(5, 10))
+        ttk.Button(btns, text="STOP SELECTED", command=self._stop_selected).pack(side=tk.RIGHT)
+        ttk.Button(btns, text="INTRADAY CAPTURE", command=self._open_capture).pack(side=tk.RIGHT, padx=5)
+
+        # New session form
+        form = ttk.LabelFrame(main, text=" NEW SESSION ", padding=10)
+        form.pack(fill=tk.X)
+
+        ttk.Label(form, text="Game PID:").grid(row=0, column=0, sticky="w")
+        self.pid_var = tk.StringVar()
+        self.pid_combo = ttk.Combobox(form, textvariable=self.pid_var, state="readonly", width=12)
+        self.pid_combo.grid(row=0, column=1, sticky="w", padx=5)
+        ttk.Button(form, text="Rescan", command=self._refresh_pids).grid(row=0, column=2, padx=5)
+
+        ttk.Label(form, text="Operation:").grid(row=1, column=0, sticky="w", pady=3)
+        self.game_var = tk.StringVar()
+        ttk.Entry(form, textvariable=self.game_var, width=22).grid(row=1, column=1, columnspan=2, sticky="w", padx=5)
+
+        ttk.Label(form, text="Nation:").grid(row=2, column=0, sticky="w", pady=3)
+        self.nation_var = tk.StringVar()
+        ttk.Entry(form, textvariable=self.nation_var, width=22).grid(row=2, column=1, columnspan=2, sticky="w", padx=5)
+
+        ttk.Label(form, text="Date (YYYY-MM-DD):").grid(row=3, column=0, sticky="w", pady=3)
+        self.date_var = tk.StringVar(value=live_config.get("start_date", "2030-01-01"))
+        ttk.Entry(form, textvariable=self.date_var, width=12).grid(row=3, column=1, sticky="w", padx=5)
+
+        ttk.Button(form, text="[ ENGAGE ]", command=self._start).grid(row=3, column=3, padx=10)
+
+        self._refresh_pids()
+        self._refresh()
+
+    def _refresh_pids(self):
+        used = {s.pid for s in SESSIONS.sessions() if s.pid}
+        free = [str(pid) for pid in find_game_pids() if pid not in used]
+        self.pid_combo["values"] = free
+        self.pid_var.set(free[0] if free else "")
+
+    def _refresh(self):
+        if not self.dialog.winfo_exists():
+            return
+        self.tree.delete(*self.tree.get_children())
+        for s in SESSIONS.sessions():
+            st = s.stats
+            self.tree.insert("", "end", iid=str(s.session_id), values=(
+                s.session_id,
+                s.pid or "auto",
+                " / ".join(p for p in (s.nation, s.game_name) if p) or "-",
+                s.current_date_str,
+                st.rows_written,
+                f"{st.samples_per_sec:.2f}",
+                f"{st.avg_read_ms:.2f} ms",
+                s.csv_path.name,
+            ))
+        self.dialog.after(self.REFRESH_MS, self._refresh)
+
+    def _stop_selected(self):
+        for iid in self.tree.selection():
+            SESSIONS.stop_session(int(iid))
+
+    def _open_capture(self):
+        pid = None
+        sel = self.tree.selection()
+        if sel:
+            session = SESSIONS.get(int(sel[0]))
+            pid = session.pid if session else None
+        CaptureDialog(self.dialog, self.config, pid=pid)
+
+    def _start(self):
+        if not self.pid_var.get():
+            messagebox.showerror("Input Error", "No free game process to attach to.", parent=self.dialog)
+            return
+        try:
+            datetime.strptime(self.date_var.get(), "%Y-%m-%d")
+        except ValueError:
+            messagebox.showerror("Format Error", "Date must be YYYY-MM-DD.", parent=self.dialog)
+            return
+        try:
+            start_logging_session(
+                self.game_var.get(),
+                self.nation_var.get(),
+                self.date_var.get(),
+                pid=int(self.pid_var.get()),
+            )
+        except ValueError as e:
+            messagebox.showerror("Session Error", str(e), parent=self.dialog)
+            return
+        self._refresh_pids()
+
+# ============================================================
+# ALERT RULES DIALOG
+# ============================================================
+
+class AlertRulesDialog:
+    """Edit live alert rules (one per line). Saved rules are applied to running sessions."""
+
+    HELP = (
+        "One rule per line, '#' for comments. Examples:\n"
+        "  Treasury < 0\n"
+        "  Military Approval drops 5% in 7 days\n"
+        "  Petroleum below 30 days of consumption\n"
+        "  [Resources - Stock] below 15 days of consumption"
+    )
+
+    def __init__(self, parent, config):
+        self.config = config
+        self.dialog = tk.Toplevel(parent)
+        self.dialog.title("Ruler Intelligence Suite – Alerts")
+        self.dialog.geometry("520x420")
+        self.dialog.transient(parent)
+
+        main = ttk.Frame(self.dialog, padding=10)
+        main.pack(fill=tk.BOTH, expand=True)
+
+        ttk.Label(main, text=self.HELP, font=("Courier New", 8), foreground="#888").pack(anchor="w", pady=(0, 8))
+
+        self.text = tk.Text(main, height=12, font=("Consolas", 10))
+        self.text.insert("1.0", "\n".join(self.config.get("alert_rules", [])))
+        self.text.pack(fill=tk.BOTH, expand=True)
+
+        ttk.Button(main, text="SAVE & APPLY", command=self._save).pack(anchor="e", pady=(8, 0))
+
+    def _save(self):
+        lines = [l.rstrip() for l in self.text.get("1.0", tk.END).splitlines() if l.strip()]
+        from alerts import compile_rules
+
+        _, errors = compile_rules(lines)
+        if errors:
+            messagebox.showerror("Alert Rules", "\n".join(errors), parent=self.dialog)
+            return
+
+        self.config["alert_rules"] = lines
+        save_config(self.config)
+        for session in SESSIONS.sessions():
+            session.set_alert_rules(lines)
+        self.dialog.destroy()
+
+# ============================================================
+# INTRADAY CAPTURE DIALOG
+# ============================================================
+
+class CaptureDialog:
+    """
+    Starts/stops a high-rate intraday capture on one game instance.
+    Runs independently of the daily sessions (own reader, own threads).
+    """
+
+    REFRESH_MS = 500
+
+    def __init__(self, parent, config, pid=None):
+        self.config = config
+        self.capture = None
+
+        self.dialog = tk.Toplevel(parent)
+        self.dialog.title("Ruler Intelligence Suite – Intraday Capture")
+        self.dialog.geometry("420x460")
+        self.dialog.transient(parent)
+        self.dialog.protocol("WM_DELETE_WINDOW", self._close)
+
+        main = ttk.Frame(self.dialog, padding=10)
+        main.pack(fill=tk.BOTH, expand=True)
+
+        from intraday_capture import DEFAULT_VARIABLES
+
+        ttk.Label(main, text="Variables:").pack(anchor="w")
+        self.var_list = tk.Listbox(main, selectmode=tk.MULTIPLE, height=12, exportselection=False)
+        for name in REGISTRY.names():
+            self.var_list.insert(tk.END, name)
+            if name in DEFAULT_VARIABLES:
+                self.var_list.selection_set(tk.END)
+        self.var_list.pack(fill=tk.BOTH, expand=True)
+
+        form = ttk.Frame(main)
+        form.pack(fill=tk.X, pady=8)
+
+        ttk.Label(form, text="Game PID:").grid(row=0, column=0, sticky="w")
+        pids = [str(p) for p in find_game_pids()]
+        self.pid_var = tk.StringVar(value=str(pid) if pid else (pids[0] if pids else ""))
+        ttk.Combobox(form, textvariable=self.pid_var, values=pids, state="readonly", width=12).grid(
+            row=0, column=1, sticky="w", padx=5)
+
+        ttk.Label(form, text="Rate (Hz):").grid(row=1, column=0, sticky="w", pady=3)
+        self.rate_var = tk.StringVar(value=str(self.config.get("capture_rate_hz", 200)))
+        ttk.Combobox(form, textvariable=self.rate_var, values=["100", "200", "250", "500"], width=12).grid(
+            row=1, column=1, sticky="w", padx=5)
+
+        ttk.Label(form, text="Label:").grid(row=2, column=0, sticky="w", pady=3)
+        self.label_var = tk.StringVar(value=self.config.get("nation", "") or "capture")
+        ttk.Entry(form, textvariable=self.label_var, width=22).grid(row=2, column=1, sticky="w", padx=5)
+
+        self.status = ttk.Label(main, text="Idle.", foreground="#888")
+        self.status.pack(anchor="w")
+
+        self.btn = ttk.Button(main, text="[ START CAPTURE ]", command=self._toggle)
+        self.btn.pack(anchor="e", pady=(8, 0))
+
+    def _toggle(self):
+        if self.capture:
+            self._stop()
+            return
+
+        variables = [self.var_list.get(i) for i in self.var_list.curselection()]
+        try:
+            rate = float(self.rate_var.get())
+        except ValueError:
+            messagebox.showerror("Input Error", "Rate must be a number.", parent=self.dialog)
+            return
+        pid = int(self.pid_var.get()) if self.pid_var.get() else None
+
+        from intraday_capture import IntradayCapture
+
+        try:
+            capture = IntradayCapture(
+                variables,
+                rate_hz=rate,
+                game_version=live_config.get("game_version", "FastTrack"),
+                pid=pid,
+                label=self.label_var.get(),
+            )
+            capture.start()
+        except (ValueError, RuntimeError) as e:
+            messagebox.showerror("Capture Error", str(e), parent=self.dialog)
+            return
+
+        self.config["capture_rate_hz"] = capture.rate_hz
+        save_config(self.config)
+        self.capture = capture
+        self.btn.config(text="[ STOP CAPTURE ]")
+        self.var_list.config(state="disabled")
+        self._refresh()
+
+    def _stop(self, close: bool = False):
+        """Stop and flush on a worker thread (joins can take seconds); `close` destroys the dialog after."""
+        capture, self.capture = self.capture, None
+        self.btn.config(text="Flushing...", state="disabled")
+
+        def worker():
+            capture.stop()
+            try:
+                self.dialog.after(0, lambda: self._on_stopped(capture, close))
+            except (tk.TclError, RuntimeError):
+                pass  # Dialog already destroyed
+
+        threading.Thread(target=worker, daemon=True).start()
+
+    def _on_stopped(self, capture, close: bool = False):
+        if not self.dialog.winfo_exists():
+            return
+        if close:
+            self.dialog.destroy()
+            return
+        st = capture.stats()
+        msg = f"Saved {st['samples']} samples in {st['chunks_written']} chunks → {capture.out_dir.name}"
+        if capture.error:
+            msg += f" ({capture.error})"
+        self.status.config(text=msg, foreground="#888")
+        self.btn.config(text="[ START CAPTURE ]", state="normal")
+        self.var_list.config(state="normal")
+
+    def _refresh(self):
+        if not self.capture or not self.dialog.winfo_exists():
+            return
+        if not self.capture.is_running():
+            self._stop()
+            return
+        st = self.capture.stats()
+        self.status.config(
+            text=(f"● {st['samples']} samples | {st['achieved_hz']:.0f} Hz | "
+                  f"late {st['late_ticks']} | chunks {st['chunks_written']} (+{st['pending_chunks']} pending)"),
+            foreground="#00ff41",
+        )
+        self.dialog.after(self.REFRESH_MS, self._refresh)
+
+    def _close(self):
+        if self.capture:
+            self._stop(close=True)
+            return
+        self.dialog.destroy()
+
 # ============================================================
 # MAIN APP
 # ============================================================
@@ -704,6 +945,8 @@ class SettingsDialog:
 class App:
     """Main Tkinter application for the Ruler Intelligence Suite."""
 
+    CPU_MONITOR_INTERVAL = 5.0  # seconds between suite/game CPU samples
+
     def __init__(self, root: tk.Tk):
         self.root = root
         self.root.title("Ruler Intelligence Suite | Strategic Analysis Directorate. V 1.0 By Mooning")
@@ -714,6 +957,11 @@ class App:
         self.config = load_config()
         self.is_monitoring = False
         self.game_running = False
+        self.primary_session: LoggingSession | None = None  # session bound to the main form
+        self.benchmark_running = False
+
+        global alert_listener
+        alert_listener = self._on_alert
         self.bg_image_ref = None  # keep a reference to avoid GC
 
         self.date_var = tk.StringVar(value=self.config.get("current_date", "2030-01-01"))
@@ -806,14 +1054,17 @@ class App:
 
     def _add_background(self):
         """Place the paper background or fallback to plain color."""
-        if HAS_PIL and BACKGROUND_IMAGE_PATH.exists():
+        if BACKGROUND_IMAGE_PATH.exists():
             try:
+                from PIL import Image, ImageTk
                 raw_img = Image.open(BACKGROUND_IMAGE_PATH)
                 raw_img = raw_img.resize((600, 800), Image.Resampling.LANCZOS)
                 self.bg_image_ref = ImageTk.PhotoImage(raw_img)
 
                 bg_label = tk.Label(self.root, image=self.bg_image_ref)
                 bg_label.place(x=0, y=0, relwidth=1, relheight=1)
+            except ImportError:
+                self.root.configure(bg="#E3DAC9")
             except Exception as e:
                 logger.error(f"Failed to load background image: {e}")
                 self.root.configure(bg="#E3DAC9")
@@ -881,6 +1132,22 @@ class App:
         )
         self.status_log.grid(row=0, column=1, padx=15)
 
+        self.status_cpu = ttk.Label(
+            status_frame,
+            text="CPU: -",
+            foreground="#555555",
+            font=("Courier New", 8),
+        )
+        self.status_cpu.grid(row=1, column=0, columnspan=2, pady=(4, 0))
+
+        self.status_alert = ttk.Label(
+            status_frame,
+            text="",
+            foreground="#FF3030",
+            font=("Courier New", 8, "bold"),
+        )
+        self.status_alert.grid(row=2, column=0, columnspan=2)
+
         # Launch button
         self.launch_btn = ttk.Button(
             container,
@@ -976,6 +1243,7 @@ class App:
         ttk.Checkbutton(row1, text="Overlay", variable=self.overlay_var).pack(side=tk.LEFT, padx=5)
         ttk.Checkbutton(row1, text="Tech Tree", variable=self.techtree_var).pack(side=tk.LEFT, padx=5)
         ttk.Button(row1, text="CONFIG", command=self._open_settings).pack(side=tk.RIGHT, padx=5)
+        ttk.Button(row1, text="BENCHMARK", command=self._run_benchmark).pack(side=tk.RIGHT, padx=5)
 
         # Row 2: Action buttons
         row2 = ttk.Frame(self.logger_frame)
@@ -983,11 +1251,13 @@ class App:
         
         ttk.Button(row2, text="TECH TREE", command=self._launch_techtree).pack(side=tk.LEFT, padx=5)
         ttk.Button(row2, text="ARCHIVES", command=lambda: os.startfile(str(LOGS_DIR))).pack(side=tk.LEFT, padx=5)
+        ttk.Button(row2, text="SESSIONS", command=self._open_sessions).pack(side=tk.LEFT, padx=5)
+        ttk.Button(row2, text="ALERTS", command=self._open_alerts).pack(side=tk.LEFT, padx=5)
 
         # Analytics button - prominent position
         style = ttk.Style()
         style.configure("Analytics.TButton", foreground="#004400", background="#AACCBB")
-        ttk.Button(row2, text="INTEL ANALYSIS", style="Analytics.TButton", command=show_simple_analytics).pack(side=tk.RIGHT, padx=5)
+        ttk.Button(row2, text="INTEL ANALYSIS", style="Analytics.TButton", command=self._open_analytics).pack(side=tk.RIGHT, padx=5)
 
     # ---------------- UI EVENTS / LOGIC BINDINGS ----------------
 
@@ -1042,7 +1312,11 @@ class App:
         if self.techtree_var.get():
             launch_techtree(self.config)
 
+        # Helpers exist now: apply the profile to them as well
+        threading.Thread(target=apply_scheduling_profile, daemon=True).start()
+
         threading.Thread(target=self._monitor_game_exit, daemon=True).start()
+        threading.Thread(target=self._monitor_cpu, daemon=True).start()
 
     def _monitor_game_exit(self):
         """Monitor the game process until it closes."""
@@ -1050,6 +1324,90 @@ class App:
             time.sleep(2)
         self.root.after(0, self._on_game_exit)
 
+    def _monitor_cpu(self):
+        """Sample suite vs game CPU share while the game runs and flag contention."""
+        pids = find_game_pids()
+        monitor = CpuMonitor(game_pid=pids[0] if pids else None, helper_pids=_helper_pids)
+        monitor.sample()  # prime counters
+        was_slowing = False
+
+        while self.game_running:
+            time.sleep(self.CPU_MONITOR_INTERVAL)
+            report = monitor.sample()
+
+            text = f"CPU: suite {report.suite_share:.1f}% | game {report.game_share:.1f}% of machine"
+            color = "#8B0000" if report.slowing_game else "#555555"
+            self.root.after(0, lambda t=text, c=color: self.status_cpu.config(text=t, foreground=c))
+
+            if report.slowing_game and not was_slowing:
+                logger.warning(f"⚠️ {report.verdict}")
+            was_slowing = report.slowing_game
+
+        self.root.after(0, lambda: self.status_cpu.config(text="CPU: -", foreground="#555555"))
+
+    def _run_benchmark(self):
+        """Measure game days/second with the suite active vs idle (sessions paused, overlay suspended)."""
+        pids = find_game_pids()
+        if not pids:
+            messagebox.showerror("Benchmark", "Game process not found.")
+            return
+        if self.benchmark_running:
+            return
+        if not messagebox.askyesno(
+            "Benchmark",
+            "Run the game unpaused at a constant speed.\n"
+            "The benchmark takes about 2 minutes and briefly pauses logging and the overlay.\n\nStart?",
+        ):
+            return
+
+        self.benchmark_running = True
+        threading.Thread(target=self._benchmark_worker, args=(pids[0],), daemon=True).start()
+
+    def _benchmark_worker(self, game_pid: int):
+        reader = MemoryReader(game_version=live_config.get("game_version", "FastTrack"), pid=game_pid)
+        suspended = []
+
+        def suspend_suite():
+            SESSIONS.pause_all()
+            for pid in _helper_pids():
+                try:
+                    proc = psutil.Process(pid)
+                    proc.suspend()
+                    suspended.append(proc)
+                except psutil.Error:
+                    pass
+
+        def resume_suite():
+            while suspended:
+                try:
+                    suspended.pop().resume()
+                except psutil.Error:
+                    pass
+            SESSIONS.resume_all()
+
+        try:
+            if not reader.attach():
+                raise RuntimeError("Could not attach to the game process.")
+            result = run_benchmark(
+                reader, suspend_suite, resume_suite,
+                profile=live_config.get("scheduling_profile", DEFAULT_PROFILE),
+                stop=lambda: not self.game_running,
+            )
+            msg = (
+                f"Profile: {result.profile}\n"
+                f"Suite active: {result.days_per_sec_active:.3f} days/s ({result.days_active} days)\n"
+                f"Suite idle:   {result.days_per_sec_idle:.3f} days/s ({result.days_idle} days)\n"
+                f"Slowdown: {result.slowdown_pct:.1f}%"
+            )
+            logger.info("Benchmark: " + msg.replace("\n", " | "))
+            self.root.after(0, lambda: messagebox.showinfo("Benchmark", msg))
+        except Exception as e:
+            logger.error(f"Benchmark failed: {e}")
+            self.root.after(0, lambda: messagebox.showerror("Benchmark", f"Benchmark failed:\n{e}"))
+        finally:
+            resume_suite()
+            self.benchmark_running = False
+
     def _on_game_exit(self):
         """Clean up UI state once the game is no longer running."""
         self.game_running = False
@@ -1057,9 +1415,8 @@ class App:
         self.launch_btn.config(state="normal", text="[ INITIATE SEQUENCE (STEAM) ]")
         self.is_monitoring = False
 
-        if logging_active:
-            global stop_event
-            stop_event.set()
+        if SESSIONS.sessions():
+            SESSIONS.stop_all("game process exited")
             self.status_log.config(text="LINK: TERMINATED", foreground="#8B0000")
 
         # Lock fields again
@@ -1102,10 +1459,8 @@ class App:
             messagebox.showwarning("Data Error", "Unable to read date from dossier.")
 
     def _toggle_logging(self):
-        """Start/stop the background logging thread."""
-        global logging_started
-
-        if not logging_active:
+        """Start/stop the primary logging session."""
+        if self.primary_session is None:
             # We are about to start logging
             if not self.date_var.get().strip():
                 messagebox.showerror("Input Error", "Date parameter required.")
@@ -1121,22 +1476,28 @@ class App:
             self.config["nation"] = self.nation_var.get().strip()
             save_config(self.config)
 
-            csv_path = get_log_file_path(
-                self.config["game_name"], self.config["nation"], use_timestamp=False
-            )
-            self.csv_preview.config(text=f"FILE: {csv_path.name}", foreground="#006400")
+            try:
+                session = start_logging_session(
+                    self.config["game_name"],
+                    self.config["nation"],
+                    self.config["current_date"],
+                    pid=_first_free_game_pid(),
+                    on_date_change=self._on_primary_date_change,
+                    on_row_saved=lambda s, d: self.root.after(0, lambda: self.update_last_saved(d)),
+                    on_stopped=self._on_primary_stopped,
+                )
+            except ValueError as e:
+                messagebox.showerror("Session Error", str(e))
+                return
 
+            self.primary_session = session
+
+            self.csv_preview.config(text=f"FILE: {session.csv_path.name}", foreground="#006400")
             self.status_log.config(text="LINK: ESTABLISHED", foreground="#006400")
             self.log_btn.config(text="[ ABORT MONITORING ]")
-
-            logging_started = True
-            threading.Thread(
-                target=logging_worker, args=(self.config, self), daemon=True
-            ).start()
         else:
             # Request stop
-            global stop_event
-            stop_event.set()
+            SESSIONS.stop_session(self.primary_session.session_id)
             self.log_btn.config(text="[ ENGAGE MONITORING ]")
 
     def _update_info_live(self):
@@ -1152,18 +1513,52 @@ class App:
         except ValueError:
             messagebox.showerror("Error", "Invalid Date Format. Use YYYY-MM-DD.")
 
+    def _open_sessions(self):
+        SessionsDialog(self.root, self.config)
+
+    def _open_alerts(self):
+        AlertRulesDialog(self.root, self.config)
+
+    def _open_analytics(self):
+        # First click pays for pandas/matplotlib instead of every launcher start
+        if "analytics" not in sys.modules:
+            self.root.config(cursor="watch")
+            self.root.update_idletasks()
+        try:
+            from analytics import show_simple_analytics
+        finally:
+            self.root.config(cursor="")
+        show_simple_analytics()
+
     # ---------------- UI CALLBACKS FROM WORKER ----------------
 
+    def _on_primary_date_change(self, session: LoggingSession, date: str):
+        """Sampler thread: keep config and date field in sync with the primary session."""
+        live_config["current_date"] = date
+        self.root.after(0, lambda: self.date_var.set(date))
+
+    def _on_alert(self, session: LoggingSession, alert):
+        """Sampler thread: show the latest alert under the status row."""
+        text = f"⚠ {alert.message}"
+        if len(SESSIONS.sessions()) > 1:
+            text = f"{session.label}: {text}"
+        self.root.after(0, lambda: (self.status_alert.config(text=text), self.root.bell()))
+
+    def _on_primary_stopped(self, session: LoggingSession):
+        """Scheduler thread: persist final date back into config."""
+        self.config["current_date"] = session.current_date_str
+        save_config(self.config)
+        self.root.after(0, self.on_logger_stopped)
+
     def update_last_saved(self, date: str):
-        """Called from the logger thread (via .after) when a new row is written."""
+        """Called from the sampler pool (via .after) when a new row is written."""
         self.last_saved_var.set(date)
 
     def on_logger_stopped(self):
         """Reset UI bits when logging has been stopped."""
         self.status_log.config(text="LINK: OFFLINE", foreground="#555555")
         self.log_btn.config(text="[ ENGAGE MONITORING ]")
-        global logging_started
-        logging_started = False
+        self.primary_session = None
 
 def kill_overlay():
     global overlay_process
@@ -0,0 +1,348 @@
+import os
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from rollups import RollupIndex
+from derived_metrics import DerivedEngine
+from forecasting import Forecaster
+from correlation import LeadLag, MAX_LAG, lead_lag
+
+"""
+Supreme Ruler 2030 - Log View Pipeline
+- Built once per loaded log: a numeric frame on a sorted DatetimeIndex.
+- Year filtering is an index slice, resampling runs once per
+  (year, granularity) and the result is memoized, so toggling metrics or
+  reopening charts never re-copies or re-resamples the log.
+- Views are shared: treat returned frames as read-only.
+- Weekly/monthly/yearly views come from the log's precomputed rollup tables
+  when available (a few hundred rows instead of a resample of every day),
+  except a single year's weekly view (weeks cross New Year); "auto" picks the coarsest level that still fills the visible span.
+- Every view carries the derived metrics (derived_metrics.py) whose inputs
+  are in the log; after an append only the new rows are evaluated.
+- forecast() fits every numeric column once on first use (forecasting.py);
+  rows appended afterwards are folded into the fit as they arrive.
+- Correlation / lead-lag matrices (correlation.py) are memoized per
+  (year, granularity, series) until new rows arrive.
+- Live mode: LogTailer returns only the bytes appended to a log since the
+  last poll and LogPipeline.append() takes the parsed rows without copying
+  the whole frame; tail_view() re-aggregates just the trailing buckets.
+"""
+
+GRANULARITY_RULES = {"week": "W", "month": "MS", "year": "YS"}
+MAX_CACHED_VIEWS = 16
+# Raw rows kept for incremental re-aggregation (covers a full yearly bucket of daily rows)
+RECENT_ROWS = 400
+# "auto" granularity: coarsest level giving at least this many points over the span
+AUTO_MIN_POINTS = 200
+LEVEL_DAYS = (("year", 365.25), ("month", 30.44), ("week", 7.0))
+
+
+# ============================================================
+# LOG TAILER
+# ============================================================
+
+class LogTailer:
+    """
+    Follows a CSV that is only ever appended to. `offset` is the byte position
+    right after the last complete line already parsed; `header` and `encoding`
+    describe how to parse the returned lines.
+    """
+
+    def __init__(self, path: str, offset: int, header: Optional[List[str]] = None,
+                 encoding: str = "utf-8"):
+        self.path = path
+        self.offset = offset
+        self.header = header
+        self.encoding = encoding
+
+    def poll(self) -> Optional[bytes]:
+        """
+        Complete lines appended since the last call (None if nothing new).
+        A trailing partial line stays in the file until the writer finishes it.
+        Raises EOFError if the file shrank (rewritten or replaced).
+        """
+        try:
+            size = os.path.getsize(self.path)
+        except OSError:
+            return None
+        if size < self.offset:
+            raise EOFError(f"{self.path} was truncated")
+        if size == self.offset:
+            return None
+
+        with open(self.path, "rb") as f:
+            f.seek(self.offset)
+            data = f.read(size - self.offset)
+
+        end = data.rfind(b"\n") + 1
+        if end == 0:
+            return None
+        self.offset += end
+        return data[:end]
+
+
+def _normalize_granularity(granularity: str) -> str:
+    return granularity if granularity in GRANULARITY_RULES else "day"
+
+
+def _bucket_start(ts, granularity: str) -> pd.Timestamp:
+    """First day of the resample bucket holding `ts` ("W" bins run Monday-Sunday)."""
+    ts = pd.Timestamp(ts).normalize()
+    if granularity == "week":
+        return ts - pd.Timedelta(days=ts.dayofweek)
+    if granularity == "month":
+        return ts.replace(day=1)
+    if granularity == "year":
+        return ts.replace(month=1, day=1)
+    return ts
+
+
+class LogPipeline:
+    def __init__(self, df: pd.DataFrame, log_key: Optional[str] = None,
+                 rollups: Optional[RollupIndex] = None):
+        """`df` is a frame from prepare_dataframe (GameDate + GameDate_str + metrics)."""
+        self.log_key = log_key
+        self.rollups = rollups
+
+        numeric, date_str = self._to_numeric(df)
+
+        self._frame = numeric
+        self._date_str = date_str
+        self._pending: List[Tuple[pd.DataFrame, Optional[np.ndarray]]] = []
+        self._recent = numeric.iloc[-RECENT_ROWS:]
+        self._views: "OrderedDict[Tuple[str, str], pd.DataFrame]" = OrderedDict()
+        # Views dropped by append(), kept until rebuilt so derived columns are only extended
+        self._stale_views: Dict[Tuple[str, str], pd.DataFrame] = {}
+        self.derived = DerivedEngine()
+        self._forecaster: Optional[Forecaster] = None
+        self._lead_lags: Dict[tuple, LeadLag] = {}
+
+    @staticmethod
+    def _to_numeric(df: pd.DataFrame, columns=None) -> Tuple[pd.DataFrame, Optional[np.ndarray]]:
+        numeric = df.select_dtypes(include="number")
+        if columns is not None:
+            numeric = numeric.reindex(columns=columns)
+        numeric.index = pd.DatetimeIndex(df["GameDate"], name="GameDate")
+        date_str = df["GameDate_str"].to_numpy() if "GameDate_str" in df.columns else None
+        return LogPipeline._sorted(numeric, date_str)
+
+    @staticmethod
+    def _sorted(numeric: pd.DataFrame, date_str: Optional[np.ndarray]) -> Tuple[pd.DataFrame, Optional[np.ndarray]]:
+        """Rows in date order (stable: rows of the same day keep their log order)."""
+        if not numeric.index.is_monotonic_increasing:
+            order = np.argsort(numeric.index.values, kind="stable")
+            numeric = numeric.iloc[order]
+            if date_str is not None:
+                date_str = date_str[order]
+        return numeric, date_str
+
+    def last_date(self) -> Optional[pd.Timestamp]:
+        """Date of the newest row, pending live rows included."""
+        last = self._pending[-1][0] if self._pending else self._frame
+        return last.index[-1] if len(last) else None
+
+    @property
+    def frame(self) -> pd.DataFrame:
+        """Full numeric frame; rows appended in live mode are merged on first access."""
+        if self._pending:
+            parts = [self._frame] + [p[0] for p in self._pending]
+            strs = [self._date_str] + [p[1] for p in self._pending]
+            self._frame = pd.concat(parts)
+            self._date_str = None if any(s is None for s in strs) else np.concatenate(strs)
+            self._pending = []
+        return self._frame
+
+    # ---------------- LIVE APPEND ----------------
+
+    def append(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Add rows parsed from the tail of the log (a prepare_dataframe frame).
+        Cost scales with the new rows: the full frame is merged lazily and only
+        cached views covering the new dates are dropped.
+        """
+        numeric, date_str = self._to_numeric(df, columns=self._frame.columns)
+        if numeric.empty:
+            return numeric
+
+        last = self.last_date()
+        if last is not None and numeric.index[0] <= last:
+            # Dates went back (an earlier save reloaded into the same log): merge and re-sort now
+            self._merge_out_of_order(numeric, date_str)
+            return numeric
+
+        self._pending.append((numeric, date_str))
+        if self._forecaster is not None:
+            self._forecaster.update(numeric)
+        self._lead_lags.clear()
+        self._recent = pd.concat([self._recent, numeric]).iloc[-RECENT_ROWS:]
+
+        touched = {"All"} | {str(y) for y in numeric.index.year.unique()}
+        for key in [k for k in self._views if k[0] in touched]:
+            self._stale_views[key] = self._views.pop(key)
+        return numeric
+
+    def _merge_out_of_order(self, numeric: pd.DataFrame, date_str: Optional[np.ndarray]):
+        frame = self.frame  # merges pending rows
+        strs = None if self._date_str is None or date_str is None else np.concatenate([self._date_str, date_str])
+        self._frame, self._date_str = self._sorted(pd.concat([frame, numeric]), strs)
+        self._recent = self._frame.iloc[-RECENT_ROWS:]
+        # Every view may now hold rows out of place: rebuild them all, derived columns included
+        self._views.clear()
+        self._stale_views.clear()
+        self._lead_lags.clear()
+        if self._forecaster is not None:
+            self._forecaster.stale = True
+
+    def tail_view(self, since, year: str = "All", granularity: str = "day") -> pd.DataFrame:
+        """
+        Rows of view(year, granularity) from the bucket containing `since` onward,
+        computed from the recent rows only. Used to patch live charts in place.
+        """
+        year, granularity = str(year), _normalize_granularity(granularity)
+        frame = self._recent
+        if year != "All":
+            frame = frame[frame.index.year == int(year)]
+
+        rule = GRANULARITY_RULES.get(granularity)
+        if rule:
+            # Resample from the start of the bucket holding `since` so it is complete
+            frame = frame.loc[_bucket_start(since, granularity):].resample(rule).mean()
+        else:
+            frame = frame.loc[pd.Timestamp(since):]
+
+        out = frame.reset_index()
+        out["GameDate_str"] = out["GameDate"].dt.strftime("%Y-%m-%d")
+        return self.derived.extend(out)
+
+    # ---------------- QUERIES ----------------
+
+    @property
+    def columns(self) -> List[str]:
+        """Numeric log columns followed by the derived metrics they allow."""
+        base = list(self.frame.columns)
+        return base + self.derived.names(base)
+
+    def years(self) -> List[int]:
+        return sorted(self.frame.index.year.unique())
+
+    def _year_bounds(self, year: str) -> Tuple[int, int]:
+        if year == "All":
+            return 0, len(self.frame)
+        return self.frame.index.slice_locs(f"{year}-01-01", f"{year}-12-31 23:59:59.999")
+
+    def auto_granularity(self, year: str = "All", span_days: Optional[float] = None) -> str:
+        """Coarsest level with at least AUTO_MIN_POINTS buckets over the span (default: the year range)."""
+        if span_days is None:
+            lo, hi = self._year_bounds(str(year))
+            if hi - lo < 2:
+                return "day"
+            index = self.frame.index
+            span_days = (index[hi - 1] - index[lo]).days
+        for level, days in LEVEL_DAYS:
+            if span_days / days >= AUTO_MIN_POINTS:
+                return level
+        return "day"
+
+    def _rollup_frame(self, level: str) -> Optional[pd.DataFrame]:
+        """Mean columns of a rollup level on a DatetimeIndex (None if unavailable)."""
+        if self.rollups is None:
+            return None
+        try:
+            self.rollups.update()  # catch up with rows appended since the load
+            if self.rollups.stale:
+                return None  # out of order, waiting for the owner to rebuild
+            parts = []
+            path = self.rollups.level_path(level)
+            if path.exists():
+                parts.append(pd.read_csv(path))
+            extra = self.rollups.extra_rows(level)
+            if extra:
+                parts.append(pd.DataFrame(extra, columns=self.rollups.header))
+        except Exception as e:
+            print(f"⚠️ Rollups unavailable for {self.log_key}: {e}")
+            return None
+        if not parts:
+            return None
+
+        table = pd.concat(parts, ignore_index=True)
+        table["GameDate"] = pd.to_datetime(table["GameDate"], format="%Y-%m-%d")
+        # A bucket written twice (replayed after a crash) keeps its latest row
+        table = table.drop_duplicates("GameDate", keep="last").sort_values("GameDate")
+        frame = table.set_index("GameDate").reindex(columns=self._frame.columns)
+        # Only registry variables are rolled up: resample the log's other columns
+        missing = [c for c in self._frame.columns if c not in set(self.rollups.columns)]
+        if missing:
+            rule = GRANULARITY_RULES[level]
+            frame[missing] = self.frame[missing].resample(rule).mean().reindex(frame.index)
+        # Means of integer columns stay float, as resample().mean() returns them
+        dtypes = {c: np.float64 if t.kind in "iub" else t for c, t in self._frame.dtypes.items()}
+        return frame.astype(dtypes, copy=False)
+
+    def view(self, year: str = "All", granularity: str = "day") -> pd.DataFrame:
+        """Frame with GameDate, GameDate_str and every numeric column (memoized)."""
+        key = (str(year), _normalize_granularity(granularity))
+        cached = self._views.get(key)
+        if cached is not None:
+            self._views.move_to_end(key)
+            return cached
+
+        rule = GRANULARITY_RULES.get(key[1])
+        # Weeks straddle New Year: a year's weekly view is resampled from that year's days
+        use_rollups = rule and not (key[1] == "week" and key[0] != "All")
+        rolled = self._rollup_frame(key[1]) if use_rollups else None
+        if rolled is not None:
+            if key[0] != "All":
+                rolled = rolled[rolled.index.year == int(key[0])]
+            out = rolled.reset_index()
+            out["GameDate_str"] = out["GameDate"].dt.strftime("%Y-%m-%d")
+            return self._remember(key, out)
+
+        lo, hi = self._year_bounds(key[0])
+        frame = self.frame.iloc[lo:hi]
+
+        if rule:
+            frame = frame.resample(rule).mean()
+            out = frame.reset_index()
+            out["GameDate_str"] = out["GameDate"].dt.strftime("%Y-%m-%d")
+        else:
+            out = frame.reset_index()
+            if self._date_str is not None:
+                out["GameDate_str"] = self._date_str[lo:hi]
+            else:
+                out["GameDate_str"] = out["GameDate"].dt.strftime("%Y-%m-%d")
+        return self._remember(key, out)
+
+    def _remember(self, key: Tuple[str, str], out: pd.DataFrame) -> pd.DataFrame:
+        out = self.derived.extend(out, self._stale_views.pop(key, None))
+        self._views[key] = out
+        if len(self._views) > MAX_CACHED_VIEWS:
+            self._views.popitem(last=False)
+        return out
+
+    def forecast(self, columns: List[str], model: str = "linear",
+                 horizon: int = 90) -> Dict[str, pd.DataFrame]:
+        """Projections of logged columns past the last row (see Forecaster.forecast)."""
+        fc = self._forecaster
+        if fc is None or fc.stale:
+            fc = self._forecaster = Forecaster(self._frame.columns)
+            fc.update(self.frame)
+        return fc.forecast(model, horizon, columns)
+
+    def lead_lag(self, columns: List[str], year: str = "All", granularity: str = "day",
+                 changes: bool = False) -> LeadLag:
+        """Correlation and lead-lag matrix of `columns` on view(year, granularity) (memoized)."""
+        key = (str(year), _normalize_granularity(granularity), changes, tuple(columns))
+        cached = self._lead_lags.get(key)
+        if cached is None:
+            cached = self._lead_lags[key] = lead_lag(self.view(key[0], key[1]), list(columns),
+                                                     MAX_LAG[key[1]], changes)
+        return cached
+
+    def invalidate(self):
+        self._views.clear()
+        self._stale_views.clear()
+        self._lead_lags.clear()
+        self._forecaster = None
@@ -0,0 +1,481 @@
+import logging
+import threading
+import time
+import itertools
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional
+
+import psutil
+
+from memory_reader import MemoryReader, PROCESS_NAME
+from data_logger import log_to_csv, get_log_file_path
+
+if TYPE_CHECKING:
+    from alerts import Alert
+
+"""
+Supreme Ruler 2030 - Logging Sessions
+- One LoggingSession per game process: own reader, PID, output log and stats.
+- alerts and rollups (NumPy) are imported when the first session starts, so
+  importing this module keeps the launcher's cold start light.
+- Sessions don't own threads. A single SessionManager scheduler hands due
+  sessions to a shared sampler pool, so two side-by-side game instances
+  (e.g. vanilla vs mod) can be logged from the same launcher.
+"""
+
+logger = logging.getLogger(__name__)
+
+ROLLUP_REBUILD_SECONDS = 300.0  # min time between rollup rebuilds while the log is out of order
+
+
+# ============================================================
+# DAY DETECTION HELPERS
+# ============================================================
+
+def day_signature(sample: dict) -> str:
+    """
+    Day signature with tight thresholds.
+    Treasury grouped by 100K, Population grouped by 50.
+    Detects even small daily changes to prevent skipped days.
+    """
+    t = sample.get("Treasury")
+    p = sample.get("Population")
+
+    if t is None or p is None:
+        return "N/A"
+
+    try:
+        t_stable = int(float(t) // 100_000)   # treasury step → 100K (was 5M)
+        p_stable = int(float(p) // 50)        # population step → 50 (was 2K)
+        return f"T:{t_stable}_P:{p_stable}"
+    except Exception:
+        return "N/A"
+
+
+def should_save(mode: str, current_date: str, last_saved_date: str | None) -> bool:
+    """
+    Decide whether to write a new row depending on the chosen save granularity.
+    Modes: Daily, Weekly, Monthly.
+    """
+    if not last_saved_date:
+        return True
+
+    try:
+        d_curr = datetime.strptime(current_date, "%Y-%m-%d")
+        d_last = datetime.strptime(last_saved_date, "%Y-%m-%d")
+
+        if mode == "Daily":
+            return d_curr > d_last
+        elif mode == "Weekly":
+            return (d_curr.isocalendar()[1], d_curr.year) != (d_last.isocalendar()[1], d_last.year)
+        elif mode == "Monthly":
+            return (d_curr.month, d_curr.year) != (d_last.month, d_last.year)
+        return False
+    except Exception:
+        # If parsing fails, err on the side of saving.
+        return True
+
+
+def find_game_pids(process_name: str = PROCESS_NAME) -> List[int]:
+    """Return the PIDs of every running game instance (oldest first)."""
+    pids = []
+    try:
+        for p in psutil.process_iter(['name', 'create_time']):
+            if (p.info.get('name') or '').lower() == process_name.lower():
+                pids.append((p.info.get('create_time') or 0.0, p.pid))
+    except Exception:
+        return []
+    return [pid for _, pid in sorted(pids)]
+
+
+# ============================================================
+# SESSION
+# ============================================================
+
+@dataclass
+class SessionStats:
+    """Per-session throughput counters (updated only by the sampler running the session)."""
+    started_at: float = field(default_factory=time.monotonic)
+    samples: int = 0
+    failed_reads: int = 0
+    days_detected: int = 0
+    rows_written: int = 0
+    total_read_time: float = 0.0
+    last_read_ms: float = 0.0
+
+    @property
+    def uptime(self) -> float:
+        return max(1e-9, time.monotonic() - self.started_at)
+
+    @property
+    def samples_per_sec(self) -> float:
+        return self.samples / self.uptime
+
+    @property
+    def rows_per_min(self) -> float:
+        return self.rows_written * 60.0 / self.uptime
+
+    @property
+    def avg_read_ms(self) -> float:
+        return (self.total_read_time / self.samples * 1000.0) if self.samples else 0.0
+
+    def as_dict(self) -> dict:
+        return {
+            "samples": self.samples,
+            "failed_reads": self.failed_reads,
+            "days_detected": self.days_detected,
+            "rows_written": self.rows_written,
+            "samples_per_sec": round(self.samples_per_sec, 2),
+            "rows_per_min": round(self.rows_per_min, 2),
+            "avg_read_ms": round(self.avg_read_ms, 3),
+            "last_read_ms": round(self.last_read_ms, 3),
+        }
+
+
+class LoggingSession:
+    """
+    State of one logging target: reader, PID, output CSV, date tracking and stats.
+    The sampling step (`sample`) is called by the SessionManager pool, never concurrently
+    for the same session.
+    """
+
+    _ids = itertools.count(1)
+
+    def __init__(self,
+                 game_name: str,
+                 nation: str,
+                 start_date: str,
+                 game_version: str = "FastTrack",
+                 pid: Optional[int] = None,
+                 csv_path: Optional[Path] = None,
+                 config_getter: Optional[Callable[[], dict]] = None,
+                 alert_rules: Optional[List[str]] = None,
+                 on_date_change: Optional[Callable[["LoggingSession", str], None]] = None,
+                 on_row_saved: Optional[Callable[["LoggingSession", str], None]] = None,
+                 on_stopped: Optional[Callable[["LoggingSession"], None]] = None):
+        self.session_id = next(self._ids)
+        self.game_name = game_name.strip()
+        self.nation = nation.strip()
+        self.pid = pid
+        self.csv_path = Path(csv_path) if csv_path else get_log_file_path(self.game_name, self.nation, use_timestamp=False)
+
+        # Live settings (polling interval / save mode) are re-read every tick so
+        # the Settings dialog keeps working while sessions run.
+        self._config_getter = config_getter or (lambda: {})
+
+        try:
+            self.current_date = datetime.strptime(start_date, "%Y-%m-%d")
+        except ValueError:
+            self.current_date = datetime(2030, 1, 1)
+
+        self.reader = MemoryReader(PROCESS_NAME, game_version, pid=pid)
+        self.last_sig: Optional[str] = None
+        self.last_saved_date: Optional[str] = None
+
+        self.stats = SessionStats()
+        self.stop_reason: Optional[str] = None
+
+        from alerts import AlertEngine
+        from rollups import RollupIndex
+
+        # Live alert rules, evaluated on every snapshot
+        self.alerts = AlertEngine(alert_rules or [])
+
+        # Weekly/monthly/yearly rollups next to the log, folded as rows are written
+        # (the session owns the rollup files while it runs: see start_session)
+        self.rollups = RollupIndex(self.csv_path)
+        self._rollup_rebuild_due = 0.0
+
+        # UI hooks (called from sampler threads - marshal to the UI thread yourself).
+        # Pass them here: a session can stop on its first tick, before start_session returns.
+        self.on_date_change = on_date_change
+        self.on_row_saved = on_row_saved
+        self.on_stopped = on_stopped
+        self.on_alert: Optional[Callable[["LoggingSession", "Alert"], None]] = None
+
+        # Scheduler bookkeeping
+        self._stop_event = threading.Event()
+        self._in_flight = False
+        self.next_due = 0.0
+
+    # ---------------- PROPERTIES ----------------
+
+    @property
+    def current_date_str(self) -> str:
+        return self.current_date.strftime("%Y-%m-%d")
+
+    @property
+    def poll_interval(self) -> float:
+        try:
+            return max(0.05, float(self._config_getter().get("polling_interval", 1.0)))
+        except (TypeError, ValueError):
+            return 1.0
+
+    @property
+    def save_mode(self) -> str:
+        return self._config_getter().get("save_mode", "Daily")
+
+    @property
+    def label(self) -> str:
+        name = " / ".join(p for p in (self.nation, self.game_name) if p) or self.csv_path.stem
+        return f"#{self.session_id} {name}"
+
+    def is_stopping(self) -> bool:
+        return self._stop_event.is_set()
+
+    def stop(self, reason: str = "stopped by user"):
+        if not self._stop_event.is_set():
+            self.stop_reason = reason
+            self._stop_event.set()
+
+    # ---------------- SAMPLING ----------------
+
+    def is_target_alive(self) -> bool:
+        if self.pid:
+            return psutil.pid_exists(self.pid)
+        return bool(find_game_pids())
+
+    def set_alert_rules(self, rules: List[str]):
+        """Recompile the alert rules (the daily window starts over)."""
+        from alerts import AlertEngine
+
+        self.alerts = AlertEngine(rules)
+
+    def _check_alerts(self, data: dict, new_day: bool):
+        if not self.alerts:
+            return
+        for alert in self.alerts.evaluate(data, self.current_date_str, new_day):
+            logger.info(f"🚨 [{self.label}] ALERT: {alert.message}")
+            if self.on_alert:
+                self.on_alert(self, alert)
+
+    def _update_rollups(self, final: bool = False):
+        try:
+            # Open buckets are persisted when a bucket closes and on stop; a crash
+            # just replays the rows written since then. Out-of-order rows (older
+            # save reloaded) mark the index stale: rebuild it at most every
+            # ROLLUP_REBUILD_SECONDS and when the session ends.
+            stale = self.rollups.stale
+            rebuild = final or (stale and time.monotonic() >= self._rollup_rebuild_due)
+            self.rollups.update(save=False, rebuild=rebuild)
+            if rebuild and stale:
+                self._rollup_rebuild_due = time.monotonic() + ROLLUP_REBUILD_SECONDS
+            if final and self.rollups.offset and self.rollups.owner:
+                self.rollups.save()
+        except Exception as e:
+            logger.warning(f"[{self.label}] Rollup update failed: {e}")
+
+    def sample(self) -> bool:
+        """
+        One polling step: read, detect day change, write row if needed.
+        Returns False when the session should end (target process gone).
+        """
+        if not self.is_target_alive():
+            logger.info(f"⚠️ [{self.label}] Game process not found anymore. Stopping session.")
+            self.stop("game process exited")
+            return False
+
+        t0 = time.perf_counter()
+        data = self.reader.read_snapshot()
+        elapsed = time.perf_counter() - t0
+
+        self.stats.samples += 1
+        self.stats.total_read_time += elapsed
+        self.stats.last_read_ms = elapsed * 1000.0
+
+        if not data or data.get("Treasury") is None:
+            self.stats.failed_reads += 1
+            return True
+
+        sig = day_signature(data)
+
+        # First sample: just initialize the reference signature.
+        if self.last_sig is None:
+            self.last_sig = sig
+            self._check_alerts(data, new_day=True)
+            return True
+
+        if sig == self.last_sig:
+            self._check_alerts(data, new_day=False)
+            return True
+
+        # New day detected
+        self.current_date += timedelta(days=1)
+        date_str = self.current_date_str
+        self.stats.days_detected += 1
+        if self.on_date_change:
+            self.on_date_change(self, date_str)
+        self._check_alerts(data, new_day=True)
+
+        if should_save(self.save_mode, date_str, self.last_saved_date):
+            payload = data.copy()
+            payload["game_name"] = self.game_name
+            payload["nation"] = self.nation
+
+            if log_to_csv(self.csv_path, payload, date_str):
+                self.last_saved_date = date_str
+                self.stats.rows_written += 1
+                self._update_rollups()
+                if self.on_row_saved:
+                    self.on_row_saved(self, date_str)
+            else:
+                logger.error(f"❌ [{self.label}] Failed to save row for day {date_str}")
+
+        self.last_sig = sig
+        return True
+
+
+# ============================================================
+# SESSION MANAGER (shared sampler pool)
+# ============================================================
+
+class SessionManager:
+    """
+    Runs any number of LoggingSessions on one scheduler thread plus a small
+    shared worker pool. The scheduler only decides *when* a session is due;
+    the actual memory reads and CSV writes happen in the pool.
+    """
+
+    def __init__(self, max_workers: int = 4):
+        self.max_workers = max_workers
+        self._sessions: Dict[int, LoggingSession] = {}
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._paused = threading.Event()
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._scheduler: Optional[threading.Thread] = None
+
+    # ---------------- PUBLIC API ----------------
+
+    def start_session(self, session: LoggingSession) -> LoggingSession:
+        """Register a session and make sure the scheduler is running."""
+        with self._lock:
+            for other in self._sessions.values():
+                if Path(other.csv_path) == Path(session.csv_path):
+                    raise ValueError(f"Log {session.csv_path.name} is already used by session {other.label}")
+                if session.pid and other.pid == session.pid:
+                    raise ValueError(f"Process {session.pid} is already logged by session {other.label}")
+
+            if not session.reader.attach():
+                logger.info(f"[{session.label}] Waiting for game process to attach...")
+
+            session.next_due = time.monotonic()
+            session.rollups.acquire()
+            self._sessions[session.session_id] = session
+            self._ensure_running()
+
+        logger.info(f"🚀 [{session.label}] Logger started (PID: {session.pid or 'auto'}, file: {session.csv_path.name}).")
+        logger.info(f"📅 [{session.label}] Start Date: {session.current_date_str}")
+        self._wake.set()
+        return session
+
+    def stop_session(self, session_id: int, reason: str = "stopped by user"):
+        with self._lock:
+            session = self._sessions.get(session_id)
+        if session:
+            session.stop(reason)
+            self._wake.set()
+
+    def stop_all(self, reason: str = "stopped by user"):
+        for session in self.sessions():
+            session.stop(reason)
+        self._wake.set()
+
+    def pause_all(self):
+        """Stop issuing reads (sessions stay registered). Used by the scheduling benchmark."""
+        self._paused.set()
+
+    def resume_all(self):
+        self._paused.clear()
+        self._wake.set()
+
+    def is_paused(self) -> bool:
+        return self._paused.is_set()
+
+    def sessions(self) -> List[LoggingSession]:
+        with self._lock:
+            return list(self._sessions.values())
+
+    def get(self, session_id: int) -> Optional[LoggingSession]:
+        with self._lock:
+            return self._sessions.get(session_id)
+
+    def active_paths(self) -> List[Path]:
+        """CSV files currently being written by a running session."""
+        return [s.csv_path for s in self.sessions() if not s.is_stopping()]
+
+    def stats(self) -> Dict[int, dict]:
+        return {s.session_id: s.stats.as_dict() for s in self.sessions()}
+
+    # ---------------- SCHEDULER ----------------
+
+    def _ensure_running(self):
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="sampler")
+        if self._scheduler is None or not self._scheduler.is_alive():
+            self._scheduler = threading.Thread(target=self._run, name="session-scheduler", daemon=True)
+            self._scheduler.start()
+
+    def _run(self):
+        while True:
+            # Clear before scanning: a set() from a task finishing mid-scan must cut the next wait short
+            self._wake.clear()
+            now = time.monotonic()
+            next_wake = now + 1.0
+
+            for session in self.sessions():
+                if session.is_stopping():
+                    if not session._in_flight:
+                        self._finalize(session)
+                    continue
+
+                if session._in_flight or self._paused.is_set():
+                    continue
+
+                if session.next_due <= now:
+                    session._in_flight = True
+                    self._pool.submit(self._sample_task, session)
+                else:
+                    next_wake = min(next_wake, session.next_due)
+
+            with self._lock:
+                if not self._sessions:
+                    self._scheduler = None
+                    return
+
+            self._wake.wait(timeout=max(0.0, next_wake - time.monotonic()))
+
+    def _sample_task(self, session: LoggingSession):
+        try:
+            if not session.sample():
+                session.stop(session.stop_reason or "target lost")
+        except Exception as e:
+            logger.error(f"[{session.label}] Sampling error: {e}")
+        finally:
+            session.next_due = time.monotonic() + session.poll_interval
+            session._in_flight = False
+            self._wake.set()
+
+    def _finalize(self, session: LoggingSession):
+        with self._lock:
+            if self._sessions.pop(session.session_id, None) is None:
+                return
+        session._update_rollups(final=True)
+        session.rollups.release()
+        stats = session.stats
+        logger.info(
+            f"🛑 [{session.label}] Logger stopped ({session.stop_reason}). "
+            f"{stats.rows_written} rows, {stats.samples_per_sec:.2f} samples/s, avg read {stats.avg_read_ms:.2f} ms."
+        )
+        if session.on_stopped:
+            try:
+                session.on_stopped(session)
+            except Exception as e:
+                logger.error(f"[{session.label}] on_stopped callback failed: {e}")
+
+
+# Shared manager used by the launcher (and by analytics to find live logs)
+SESSIONS = SessionManager()
@@ -4,10 +4,14 @@ import struct
 import logging
 from typing import List, Tuple, Dict, Optional
 
+from variable_registry import REGISTRY
+
 """
-Supreme Ruler 2030 - Memory Reader v2.1 (PERSISTENT)
+Supreme Ruler 2030 - Memory Reader v2.2 (PERSISTENT + BLOCK READS)
 - Switched to persistent connection to avoid handle open/close overhead.
 - Much faster, prevents skipping days when the game runs at high speed.
+- Snapshots use compiled read plans from the variable registry: one
+  ReadProcessMemory call per block instead of one per variable.
 """
 
 PROCESS_NAME = "SupremeRuler2030.exe"
@@ -25,46 +29,13 @@ VERSIONS = {
     },
 }
 
-# Variable offsets mapping
-VARIABLES: List[Tuple[str, int, str]] = [
-    ("Population", 0x14B48, "float"), ("Domestic Approval", 0x14B04, "float"),
-    ("Military Approval", 0x14B08, "float"), ("Credit Rating", 0x14B18, "float"),
-    ("Literacy", 0x14B20, "float"), ("Treaty Integrity", 0x14AF4, "float"),
-    ("Tourism", 0x14B1C, "float"), ("Subsidy Rate", 0x14B08, "float"),
-    ("Treasury", 0x14B88, "double"), ("Bond Debt", 0x14B98, "float"),
-    ("GDP/c", 0x14C50, "float"), ("Inflation", 0x14C60, "float"),
-    ("Unemployment", 0x14B68, "float"), ("Research Efficiency", 0x14CEC, "float"),
-    ("Active Personnel", 0x14B60, "float"), ("Reserve Personnel", 0x14B64, "float"),
-    ("Emigration", 0x14B70, "float"), ("Immigration", 0x14B6C, "float"),
-    ("Births", 0x14B74, "float"), ("Deaths", 0x14B78, "float"),
-    ("Agriculture", 0x14DA4, "float"), ("Rubber", 0x14EF4, "float"),
-    ("Timber", 0x15044, "float"), ("Petroleum", 0x15194, "float"),
-    ("Coal", 0x152E4, "float"), ("Metal Ore", 0x15434, "float"),
-    ("Uranium", 0x15584, "float"), ("Electric Power", 0x156D4, "float"),
-    ("Consumer Goods", 0x15824, "float"), ("Industry Goods", 0x15974, "float"),
-    ("Military Goods", 0x15AC4, "float"),
-    ("Agriculture Production Cost", 0x14DFC, "float"), ("Rubber Production Cost", 0x14F4C, "float"),
-    ("Timber Production Cost", 0x1509C, "float"), ("Petroleum Production Cost", 0x151EC, "float"),
-    ("Coal Production Cost", 0x1533C, "float"), ("Metal Ore Production Cost", 0x1548C, "float"),
-    ("Uranium Production Cost", 0x155DC, "float"), ("Electric Power Production Cost", 0x1572C, "float"),
-    ("Consumer Goods Production Cost", 0x1587C, "float"), ("Industry Goods Production Cost", 0x159CC, "float"),
-    ("Military Goods Production Cost", 0x15B1C, "float"),
-    ("Agriculture Trades", 0x14E00, "float"), ("Rubber Trades", 0x14F50, "float"),
-    ("Timber Trades", 0x150A0, "float"), ("Petroleum Trades", 0x151F0, "float"),
-    ("Coal Trades", 0x15340, "float"), ("Metal Ore Trades", 0x15490, "float"),
-    ("Uranium Trades", 0x155E0, "float"), ("Electric Power Trades", 0x15730, "float"),
-    ("Consumer Goods Trades", 0x15880, "float"), ("Industry Goods Trades", 0x159D0, "float"),
-    ("Military Goods Trades", 0x15B20, "float"),
-]
-
-MARKET_PRICES: List[Tuple[str, int, str]] = [
-    ("Agriculture Market Price", 0x074, "float"), ("Rubber Market Price", 0x0F8, "float"),
-    ("Timber Market Price", 0x17C, "float"), ("Petroleum Market Price", 0x200, "float"),
-    ("Coal Market Price", 0x284, "float"), ("Metal Ore Market Price", 0x308, "float"),
-    ("Uranium Market Price", 0x38C, "float"), ("Electric Power Market Price", 0x410, "float"),
-    ("Consumer Goods Market Price", 0x494, "float"), ("Industry Goods Market Price", 0x518, "float"),
-    ("Military Goods Market Price", 0x59C, "float"),
-]
+# Variable offsets come from the registry (built-ins + user variables.json)
+VARIABLES: List[Tuple[str, int, str]] = [(v.name, v.offset, v.type) for v in REGISTRY.for_base("nation")]
+MARKET_PRICES: List[Tuple[str, int, str]] = [(v.name, v.offset, v.type) for v in REGISTRY.for_base("market")]
+
+# Compiled once: adjacent fields merged into a few block reads
+NATION_PLAN = REGISTRY.read_plan("nation")
+MARKET_PLAN = REGISTRY.read_plan("market")
 
 class MemoryReader:
     """
@@ -72,9 +43,11 @@ class MemoryReader:
     Keeps the process handle open to maximize read speed and minimize CPU overhead.
     """
 
-    def __init__(self, process_name: str = PROCESS_NAME, game_version: str = "FastTrack"):
+    def __init__(self, process_name: str = PROCESS_NAME, game_version: str = "FastTrack",
+                 pid: Optional[int] = None):
         self.process_name = process_name
         self.game_version = game_version
+        self.pid = pid  # When set, attach to this exact instance instead of the first match by name
         self.pm: Optional[pymem.Pymem] = None
         self.base_address: Optional[int] = None
         self.version_data = None
@@ -83,7 +56,11 @@ class MemoryReader:
     def attach(self) -> bool:
         """Attempts to attach to the process and resolve base pointers."""
         try:
-            self.pm = pymem.Pymem(self.process_name)
+            if self.pid:
+                self.pm = pymem.Pymem()
+                self.pm.open_process_from_id(self.pid)
+            else:
+                self.pm = pymem.Pymem(self.process_name)
             mod = pymem.process.module_from_name(self.pm.process_handle, self.process_name)
             self.base_address = mod.lpBaseOfDll
             
@@ -128,6 +105,20 @@ class MemoryReader:
         except:
             return None
 
+    def read_block(self, addr: int, size: int) -> Optional[bytes]:
+        """Read `size` raw bytes in a single ReadProcessMemory call."""
+        try:
+            return self.pm.read_bytes(addr, size)
+        except:
+            return None
+
+    def resolve_market_base(self) -> Optional[int]:
+        """Address of the market price table (it lives behind its own pointer)."""
+        try:
+            return self.pm.read_uint(self.base_address + self.version_data["market_offset"]) or None
+        except:
+            return None
+
     def is_active(self) -> bool:
         return self.pm is not None
 
@@ -150,19 +141,13 @@ class MemoryReader:
         
         try:
             # 1. Main variables
-            for name, offset, type_ in VARIABLES:
-                val = self.read_primitive(self.final_base_ptr + offset, type_)
-                results[name] = val
+            NATION_PLAN.read(self.read_block, self.final_base_ptr, results)
 
             # 2. Market prices (these live at a different offset)
-            try:
-                market_base = self.pm.read_uint(self.base_address + self.version_data["market_offset"])
+            if MARKET_PLAN:
+                market_base = self.resolve_market_base()
                 if market_base:
-                    for name, offset, type_ in MARKET_PRICES:
-                        val = self.read_primitive(market_base + offset, type_)
-                        results[name] = val
-            except:
-                pass # Market prices are optional/less critical
+                    MARKET_PLAN.read(self.read_block, market_base, results)  # Optional/less critical
 
             # sanity check: if Treasury is None, the read likely failed entirely
             if results.get("Treasury") is None:
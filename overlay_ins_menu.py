@@ -14,11 +14,12 @@ from PyQt5.QtWidgets import QWidget, QApplication
 
 # IPC Bridge for communication with Tech Analyzer
 try:
-    from ipc_bridge import IPCClient, wait_for_server
+    from ipc_bridge import IPCClient, wait_for_server, read_alerts
     IPC_AVAILABLE = True
 except ImportError:
     IPCClient = None
     wait_for_server = None
+    read_alerts = None
     IPC_AVAILABLE = False
     print("[System] WARNING: ipc_bridge.py not found. Tech Analyzer integration limited.")
 
@@ -37,9 +38,10 @@ except ImportError:
     pymem = None
     print("[Memory] WARNING: pymem is not installed. Selected unit reading is disabled.")
 
-from unit_parser import parse_default_unit, Unit, load_range_database
+from unit_parser import Unit, UnitTable
+from unit_cache import load_unit_table, find_spotting, find_range_database
+from unit_index import UnitIndex
 from tech_parser import load_tech_file
-from spotting_parser import load_spotting_file
 from painters import draw_unit_list, draw_comparison_table
 from events import handle_mouse_press, handle_wheel
 
@@ -105,6 +107,10 @@ class OverlayINS(QWidget):
     # Selected Technology Offset
     SELECTED_TECH_OFFSET = 0x17676D8
 
+    # Live alert banner
+    ALERT_POLL_S = 1.0
+    ALERT_BANNER_S = 60.0
+
     def __init__(self, 
                  default_unit_path: str | None = None, 
                  default_ttrx_path: str | None = None,
@@ -130,7 +136,11 @@ class OverlayINS(QWidget):
         self.techimpact_drag_offset = 0
 
         # Data Containers
+        self.spotting_path: str | None = None
+        self.range_database_path: str | None = None
+        self.unit_table = UnitTable.from_records([])
         self.units: list[Unit] = []
+        self.unit_index = UnitIndex(self.unit_table, self.units)  # ID / class / region lookups
         self.filtered_units: list[Unit] = []
         self.tech_unlocks: dict[int, list[Unit]] = {}
 
@@ -142,6 +152,7 @@ class OverlayINS(QWidget):
         # Tech data (from DEFAULT.TTRX)
         self.tech_light: dict[int, dict] = {}
         self.tech_full: dict[int, dict] = {}
+        self.tech_version: int = 0  # bumped on reload: keys the tech effect cache
 
         # Active techs for B/C/D columns
         self.active_techs: dict[str, set[int]] = {
@@ -218,6 +229,11 @@ class OverlayINS(QWidget):
         self.alt_t_cooldown_ms = 1000  # Minimum ms between Alt+T triggers
         self.alt_t_last_trigger = 0    # Timestamp of last successful trigger
 
+        # Live alerts from the launcher (polled from the IPC alerts file)
+        self.alerts: list[dict] = []
+        self.alert_last_seen = time.time()
+        self.alert_next_poll = 0.0
+
         # Memory Handlers
         self.pm = None
         self.base_addr = None
@@ -226,16 +242,14 @@ class OverlayINS(QWidget):
         # Initialization Routine
         self.init_window()
         
-        # 1. Load Range Database FIRST (so parser can use it)
+        # 1. Locate Range Database and Spotting Data (inputs of the unit cache)
         self.load_range_database(range_database_path)
-        
-        # 2. Load Spotting Data SECOND (so units can use it)
         self.load_spotting(default_spotting_path)
         
-        # 3. Load Units
+        # 2. Load Units (compiled cache, re-parsed only when an input changed)
         self.load_units(default_unit_path)
         
-        # 4. Load Techs
+        # 3. Load Techs
         self.load_techs(default_ttrx_path)
         
         # Calculate tech dependencies
@@ -346,10 +360,7 @@ class OverlayINS(QWidget):
         uid = self._read_selected_unit_raw()
         if uid is None:
             return None
-        for u in self.units:
-            if u.id == uid:
-                return u
-        return None
+        return self.unit_index.get(uid)
 
     # ------------------------------------------------------------ 
     # MAIN LOOP
@@ -390,7 +401,10 @@ class OverlayINS(QWidget):
         except Exception as e:
             print(f"[Overlay] Alt+T check error: {e}")
 
-        # 3. Update Selected Unit (Column B) from in-game selection
+        # 3. Poll live alerts (cheap file read, once per ALERT_POLL_S)
+        self._poll_alerts()
+
+        # 4. Update Selected Unit (Column B) from in-game selection
         # Skip if: menu hidden, locked, or user made manual selection in overlay
         if self.menu_visible and not self.lock_b and not self.manual_selection_b:
             u = self._read_selected_unit_obj()
@@ -403,6 +417,23 @@ class OverlayINS(QWidget):
                     self.active_techs["b"] = set(u.tech_ids) if hasattr(u, 'tech_ids') else set()
                     self.update()
 
+    def _poll_alerts(self):
+        if read_alerts is None:
+            return
+        now = time.time()
+        if now < self.alert_next_poll:
+            return
+        self.alert_next_poll = now + self.ALERT_POLL_S
+
+        new = read_alerts(self.alert_last_seen)
+        if new:
+            self.alert_last_seen = new[-1]["timestamp"]
+            self.alerts = (self.alerts + new)[-5:]
+            for a in new:
+                print(f"[Overlay] ALERT: {a['message']}")
+            if self.menu_visible:
+                self.update()
+
     # ------------------------------------------------------------- 
     # INITIALIZATION & LOADING
     # ------------------------------------------------------------- 
@@ -421,37 +452,14 @@ class OverlayINS(QWidget):
         self.hide()
 
     def load_spotting(self, default_spotting_path: str | None):
-        paths = []
-        if default_spotting_path:
-            paths.append(Path(default_spotting_path))
-        
-        # Standard Steam path
-        paths.append(Path(r"C:\Program Files (x86)\Steam\steamapps\common\Supreme Ruler 2030\Maps\DATA\Spotting.csv"))
-        # Local fallback
-        paths.append(Path(__file__).with_name("Spotting.csv"))
-
-        for p in paths:
-            if p and p.exists():
-                load_spotting_file(str(p))
-                return
-        
-        print("[Spotting] WARNING: Spotting.csv not found. Radar ranges will be 0.")
+        """Locate Spotting.csv (read by the unit cache when it rebuilds)."""
+        self.spotting_path = find_spotting(default_spotting_path)
+        if not self.spotting_path:
+            print("[Spotting] WARNING: Spotting.csv not found. Radar ranges will be 0.")
 
     def load_range_database(self, range_database_path: str | None):
-        """Load unit range stats database from CSV (silent if not found)"""
-        paths = []
-        if range_database_path:
-            paths.append(Path(range_database_path))
-        
-        # Same directory as overlay script/exe
-        paths.append(Path(__file__).parent / "unit_rangestats_database.csv")
-        # Current working directory
-        paths.append(Path.cwd() / "unit_rangestats_database.csv")
-        
-        for p in paths:
-            if p and p.exists():
-                load_range_database(str(p))
-                return
+        """Locate the unit range stats database CSV (silent if not found)"""
+        self.range_database_path = find_range_database(range_database_path)
 
     def load_units(self, default_unit_path: str | None):
         paths = [
@@ -462,7 +470,9 @@ class OverlayINS(QWidget):
         for p in paths:
             if p and p.exists():
                 try:
-                    self.units = parse_default_unit(str(p))
+                    self.unit_table = load_unit_table(str(p), self.spotting_path, self.range_database_path)
+                    self.units = self.unit_table.rows()
+                    self.unit_index = UnitIndex(self.unit_table, self.units)
                     print(f"[Units] Loaded {len(self.units)} units from {p}")
                     return
                 except Exception as e:
@@ -480,6 +490,7 @@ class OverlayINS(QWidget):
             if p and p.exists():
                 try:
                     self.tech_light, self.tech_full = load_tech_file(str(p))
+                    self.tech_version += 1  # old cache entries age out of the LRU
                     print(f"[Tech] Loaded {len(self.tech_light)} techs from {p}")
                     return
                 except Exception as e:
@@ -490,33 +501,10 @@ class OverlayINS(QWidget):
     # --------------------------------------------------------------- 
     # FILTERING
     # --------------------------------------------------------------- 
-    def _unit_category(self, u: Unit) -> str:
-        c = u.class_num
-        if 0 <= c <= 6:
-            return "land"
-        if 7 <= c <= 14:
-            return "air"
-        if 15 <= c <= 20:
-            return "naval"
-        return "unknown"
-
     def update_filter(self):
-        q = self.search_query.strip().lower()
-        cat = self.selected_category
-        res: list[Unit] = []
-        
-        if not q and cat == "all":
-            self.filtered_units = list(self.units)
-            self.unit_scroll_offset = 0
-            return
-
-        for u in self.units:
-            if cat != "all" and self._unit_category(u) != cat:
-                continue
-            if q and not u.matches(q):
-                continue
-            res.append(u)
-        self.filtered_units = res
+        # Ranked rows from the search index; a longer query narrows the last result
+        rows = self.unit_index.search.filter(self.search_query, self.selected_category)
+        self.filtered_units = [self.units[i] for i in rows.tolist()]
         self.unit_scroll_offset = 0
 
     # -------------------------------------------------------------- 
@@ -867,6 +855,19 @@ class OverlayINS(QWidget):
             f"ID:{rid} | B:{sync_txt} | L={lock_txt} | [L]ock [R]eset",
         )
 
+        # Alert banner (above the panel, recent alerts only)
+        recent = [a for a in self.alerts if time.time() - a["timestamp"] < self.ALERT_BANNER_S]
+        if recent:
+            banner = QRect(px, py - 26, panel_w, 22)
+            p.setBrush(QColor(150, 30, 30, 230))
+            p.setPen(Qt.NoPen)
+            p.drawRect(banner)
+            p.setPen(Qt.white)
+            p.setFont(QFont("Consolas", 9, QFont.Bold))
+            extra = f"  (+{len(recent) - 1} more)" if len(recent) > 1 else ""
+            p.drawText(banner.adjusted(8, 0, -8, 0), Qt.AlignVCenter | Qt.AlignLeft,
+                       f"ALERT: {recent[-1]['message']}{extra}")
+
         # Search bar (Units)
         self.search_rect = QRect(px + 10, py + 30, panel_w - 50, 26)
         p.setBrush(QColor(10, 10, 10))
@@ -929,10 +930,7 @@ class OverlayINS(QWidget):
     # HELPERS
     # -------------------------------------------------------------
     def _get_unit_by_id(self, uid: int):
-        for u in self.units:
-            if u.id == uid:
-                return u
-        return None
+        return self.unit_index.get(uid)
     
     def select_unit_b_manual(self, unit):
         """
@@ -2,7 +2,7 @@ from typing import TYPE_CHECKING
 from PyQt5.QtCore import QRect, Qt
 from PyQt5.QtGui import QColor, QFont, QPainter
 
-from tech_effects import apply_techs_to_unit
+from tech_effects import apply_techs_cached
 from tech_effects import EFFECT_MAP, BOOL_EFFECT_MAP, GLOBAL_EFFECT_MAP
 
 if TYPE_CHECKING:
@@ -277,10 +277,10 @@ def _draw_compare_stats_table(
         return (txt, has_def)
 
 
-    # Apply tech modifiers
-    ub = apply_techs_to_unit(ov.selected_unit_b, ov.active_techs["b"], ov.tech_light)
-    uc = apply_techs_to_unit(ov.selected_unit_c, ov.active_techs["c"], ov.tech_light)
-    ud = apply_techs_to_unit(ov.selected_unit_d, ov.active_techs["d"], ov.tech_light)
+    # Apply tech modifiers (memoized: repaints reuse the last results)
+    ub = apply_techs_cached(ov.selected_unit_b, ov.active_techs["b"], ov.tech_light, ov.tech_version)
+    uc = apply_techs_cached(ov.selected_unit_c, ov.active_techs["c"], ov.tech_light, ov.tech_version)
+    ud = apply_techs_cached(ov.selected_unit_d, ov.active_techs["d"], ov.tech_light, ov.tech_version)
 
     rows = [
 
@@ -0,0 +1,423 @@
+import csv
+import json
+import logging
+import os
+import sys
+import uuid
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from variable_registry import REGISTRY
+from data_logger import LOGS_DIR
+
+"""
+Supreme Ruler 2030 - Log Rollups
+- Weekly, monthly and yearly tables (mean / min / max / last of every
+  variable) kept next to each log in `<log>.rollups/`.
+- Updated incrementally: only the bytes appended to the log since the last
+  update are parsed and folded into the open buckets. A bucket is written to
+  its CSV once a later bucket starts; open buckets live in state.json.
+- A date going backwards (older save reloaded) or a rewritten log triggers a
+  full rebuild from the sorted log. The logger marks the index stale and
+  rebuilds it now and then (and when the session stops), not on every row.
+- One writer at a time: a logging session owns the files (writer.lock) while
+  it runs. Any other index (analytics, indexer) only reads them then, and
+  folds the log rows newer than the saved state in memory.
+- Offline indexer:  python rollups.py [log.csv ...]   (default: every log)
+"""
+
+logger = logging.getLogger(__name__)
+
+ROLLUP_LEVELS = ("week", "month", "year")
+STATS = ("min", "max", "last")  # the mean keeps the plain column name
+STATE_FILE = "state.json"
+STATE_VERSION = 1
+LOCK_FILE = "writer.lock"
+
+
+def rollup_dir(log_path) -> Path:
+    return Path(log_path).with_suffix(".rollups")
+
+
+def bucket_label(day: date, level: str) -> date:
+    """Bucket label matching pandas resample: W -> closing Sunday, MS/YS -> first day."""
+    if level == "week":
+        return day + timedelta(days=6 - day.weekday())
+    if level == "month":
+        return day.replace(day=1)
+    return day.replace(month=1, day=1)
+
+
+def stat_column(col: str, stat: str) -> str:
+    return f"{col}_{stat}"
+
+
+def _pid_alive(pid) -> bool:
+    try:
+        import psutil
+    except ImportError:
+        return True  # can't tell: respect the lock
+    try:
+        return psutil.pid_exists(int(pid))
+    except (TypeError, ValueError):
+        return False
+
+
+# ============================================================
+# OPEN BUCKET ACCUMULATOR
+# ============================================================
+
+class _Bucket:
+    __slots__ = ("label", "rows", "count", "sum", "min", "max", "last")
+
+    def __init__(self, label: date, width: int):
+        self.label = label
+        self.rows = 0
+        self.count = np.zeros(width, dtype=np.int64)
+        self.sum = np.zeros(width)
+        self.min = np.full(width, np.inf)
+        self.max = np.full(width, -np.inf)
+        self.last = np.full(width, np.nan)
+
+    def add(self, values: np.ndarray):
+        ok = ~np.isnan(values)
+        self.rows += 1
+        self.count += ok
+        self.sum[ok] += values[ok]
+        np.fmin(self.min, values, out=self.min)
+        np.fmax(self.max, values, out=self.max)
+        self.last[ok] = values[ok]
+
+    def row(self) -> list:
+        empty = self.count == 0
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = np.where(empty, np.nan, self.sum / self.count)
+        lo = np.where(empty, np.nan, self.min)
+        hi = np.where(empty, np.nan, self.max)
+        out = [self.label.isoformat(), self.rows]
+        for i in range(len(mean)):
+            out.extend((mean[i], lo[i], hi[i], self.last[i]))
+        return out
+
+    def to_state(self) -> dict:
+        return {
+            "label": self.label.isoformat(), "rows": self.rows,
+            "count": self.count.tolist(), "sum": self.sum.tolist(),
+            "min": self.min.tolist(), "max": self.max.tolist(), "last": self.last.tolist(),
+        }
+
+    @classmethod
+    def from_state(cls, state: dict) -> "_Bucket":
+        b = cls(date.fromisoformat(state["label"]), len(state["count"]))
+        b.rows = state["rows"]
+        b.count = np.array(state["count"], dtype=np.int64)
+        for name in ("sum", "min", "max", "last"):
+            setattr(b, name, np.array(state[name], dtype=float))
+        return b
+
+
+# ============================================================
+# ROLLUP INDEX
+# ============================================================
+
+class RollupIndex:
+    """
+    Rollup tables of one log. `update()` catches up with the log; readers use
+    `columns`, `level_path()` and `open_rows()` (the still-open buckets).
+    """
+
+    def __init__(self, log_path):
+        self.log_path = Path(log_path)
+        self.dir = rollup_dir(log_path)
+        self._token = uuid.uuid4().hex
+        self.owner = False
+        self._reset()
+        self._load_state()
+
+    def _reset(self):
+        self._log_header: List[str] = []
+        self.columns: List[str] = []
+        self._positions: List[int] = []
+        self._date_pos: Optional[int] = None
+        self.offset = 0
+        self.last_date: Optional[date] = None
+        self.open: Dict[str, _Bucket] = {}
+        # Read-only mode: buckets closed since the owner's last save, not in the level CSVs
+        self.unsaved: Dict[str, List[list]] = {}
+        self.stale = False
+
+    # ---------------- PERSISTENCE ----------------
+
+    @property
+    def header(self) -> List[str]:
+        cols = ["GameDate", "Rows"]
+        for col in self.columns:
+            cols.append(col)
+            cols.extend(stat_column(col, s) for s in STATS)
+        return cols
+
+    def level_path(self, level: str) -> Path:
+        return self.dir / f"{level}.csv"
+
+    def _load_state(self):
+        path = self.dir / STATE_FILE
+        if not path.exists():
+            return
+        try:
+            state = json.loads(path.read_text(encoding="utf-8"))
+            if state.get("version") != STATE_VERSION:
+                return
+            self._set_columns(state["log_header"])
+            self.offset = int(state["offset"])
+            self.last_date = date.fromisoformat(state["last_date"]) if state.get("last_date") else None
+            self.stale = bool(state.get("stale", False))
+            self.open = {lvl: _Bucket.from_state(b) for lvl, b in state.get("open", {}).items()}
+        except Exception as e:
+            logger.warning(f"Rollup state of {self.log_path.name} unreadable, rebuilding: {e}")
+            self._reset()
+
+    def save(self):
+        self.dir.mkdir(parents=True, exist_ok=True)
+        state = {
+            "version": STATE_VERSION,
+            "log_header": self._log_header,
+            "offset": self.offset,
+            "last_date": self.last_date.isoformat() if self.last_date else None,
+            "stale": self.stale,
+            "open": {lvl: b.to_state() for lvl, b in self.open.items()},
+        }
+        tmp = self.dir / (STATE_FILE + ".tmp")
+        tmp.write_text(json.dumps(state), encoding="utf-8")
+        os.replace(tmp, self.dir / STATE_FILE)
+
+    def _set_columns(self, log_header: List[str]):
+        self._log_header = log_header
+        names = [h.strip() for h in log_header]
+        known = set(REGISTRY.names())
+        self.columns = [n for n in names if n in known]
+        self._positions = [names.index(n) for n in self.columns]
+        self._date_pos = names.index("GameDate") if "GameDate" in names else None
+
+    # ---------------- WRITER LOCK ----------------
+
+    def _lock(self) -> Optional[dict]:
+        try:
+            return json.loads((self.dir / LOCK_FILE).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+    def locked_by_other(self) -> bool:
+        """Another live index (e.g. the logger of a running session) owns the files."""
+        lock = self._lock()
+        if not lock or lock.get("token") == self._token:
+            return False
+        return _pid_alive(lock.get("pid"))
+
+    def acquire(self) -> bool:
+        """Become the only writer of the rollup files until release()."""
+        if self.locked_by_other():
+            logger.warning(f"Rollups of {self.log_path.name} are owned by another process: read-only")
+            return False
+        self.dir.mkdir(parents=True, exist_ok=True)
+        tmp = self.dir / (LOCK_FILE + ".tmp")
+        tmp.write_text(json.dumps({"pid": os.getpid(), "token": self._token}), encoding="utf-8")
+        os.replace(tmp, self.dir / LOCK_FILE)
+        self.owner = True
+        return True
+
+    def release(self):
+        if self.owner:
+            self.owner = False
+            lock = self._lock()
+            if lock and lock.get("token") == self._token:
+                (self.dir / LOCK_FILE).unlink(missing_ok=True)
+
+    # ---------------- UPDATE ----------------
+
+    def update(self, save: bool = True, rebuild: bool = True) -> int:
+        """
+        Fold rows appended to the log since the last update. Returns the number
+        of rows processed. Closed buckets are always written (and the state with
+        them); `save=False` defers saving the open buckets to a later save().
+        With `rebuild=False` (logger hot path) out-of-order rows only mark the
+        index stale instead of re-reading the whole log on every new row.
+        While another process owns the files, nothing is written: see _follow().
+        """
+        if not self.owner and self.locked_by_other():
+            return self._follow()
+        try:
+            size = self.log_path.stat().st_size
+        except OSError:
+            return 0
+        if self.offset == 0 or size < self.offset:
+            return self.rebuild()  # never indexed or rewritten: one full pass
+        if self.stale:
+            return self.rebuild() if rebuild else 0
+        if size == self.offset:
+            return 0
+
+        with open(self.log_path, "rb") as f:
+            f.seek(self.offset)
+            data = f.read(size - self.offset)
+        end = data.rfind(b"\n") + 1
+        if end == 0:
+            return 0
+
+        rows = list(self._parse(data[:end].decode("utf-8", errors="replace").splitlines()))
+        prev = self.last_date
+        for day, _ in rows:
+            if prev and day < prev:
+                return self.rebuild() if rebuild else self._mark_stale()
+            prev = day
+
+        closed = self._fold(rows)
+        self.offset += end
+        if closed or save:
+            self.save()
+        return len(rows)
+
+    def _follow(self) -> int:
+        """
+        Read-only catch-up: the owner's saved state plus the log rows written
+        after it, folded in memory (closed buckets go to `unsaved`). A stale or
+        rewritten log is left to the owner; `stale` tells readers to fall back.
+        """
+        self._reset()
+        self._load_state()
+        try:
+            size = self.log_path.stat().st_size
+        except OSError:
+            return 0
+        if self.offset == 0 or size < self.offset:
+            self.stale = True
+        if self.stale or size == self.offset:
+            return 0
+
+        with open(self.log_path, "rb") as f:
+            f.seek(self.offset)
+            data = f.read(size - self.offset)
+        end = data.rfind(b"\n") + 1
+        rows = list(self._parse(data[:end].decode("utf-8", errors="replace").splitlines()))
+        prev = self.last_date
+        for day, _ in rows:
+            if prev and day < prev:
+                self.stale = True
+                return 0
+            prev = day
+        self._fold(rows, write=False)
+        self.offset += end
+        return len(rows)
+
+    def _mark_stale(self) -> int:
+        if not self.stale:
+            self.stale = True
+            self.save()
+        return 0
+
+    def rebuild(self) -> int:
+        """Recompute every table from the whole log (sorted by date)."""
+        if not self.owner and self.locked_by_other():
+            return self._follow()
+        self._reset()
+        for level in ROLLUP_LEVELS:
+            self.level_path(level).unlink(missing_ok=True)
+        try:
+            with open(self.log_path, "rb") as f:
+                data = f.read()
+        except OSError:
+            return 0
+        end = data.rfind(b"\n") + 1
+        lines = data[:end].decode("utf-8-sig", errors="replace").splitlines()
+        if not lines:
+            return 0
+
+        self._set_columns(next(csv.reader(lines[:1])))
+        rows = sorted(self._parse(lines[1:]), key=lambda r: r[0])
+        self._fold(rows)
+        self.offset = end
+        self.save()
+        return len(rows)
+
+    def _parse(self, lines: List[str]):
+        if self._date_pos is None:
+            return
+        for fields in csv.reader(lines):
+            try:
+                day = datetime.strptime(fields[self._date_pos], "%Y-%m-%d").date()
+            except (ValueError, IndexError):
+                continue
+            values = np.full(len(self._positions), np.nan)
+            for i, pos in enumerate(self._positions):
+                if pos < len(fields) and fields[pos]:
+                    try:
+                        values[i] = float(fields[pos])
+                    except ValueError:
+                        pass
+            yield day, values
+
+    def _fold(self, rows, write: bool = True) -> bool:
+        """Add rows (date order) to the open buckets; append buckets that close (to `unsaved` if not `write`)."""
+        finished: Dict[str, list] = {lvl: [] for lvl in ROLLUP_LEVELS}
+        width = len(self.columns)
+        for day, values in rows:
+            for level in ROLLUP_LEVELS:
+                label = bucket_label(day, level)
+                bucket = self.open.get(level)
+                if bucket is None or bucket.label != label:
+                    if bucket is not None:
+                        finished[level].append(bucket.row())
+                    bucket = self.open[level] = _Bucket(label, width)
+                bucket.add(values)
+            self.last_date = day
+
+        closed = False
+        for level, out in finished.items():
+            if out:
+                if write:
+                    self._append_rows(level, out)
+                else:
+                    self.unsaved.setdefault(level, []).extend(out)
+                closed = True
+        return closed
+
+    def _append_rows(self, level: str, rows: List[list]):
+        self.dir.mkdir(parents=True, exist_ok=True)
+        path = self.level_path(level)
+        new_file = not path.exists() or path.stat().st_size == 0
+        with open(path, "a", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            if new_file:
+                writer.writerow(self.header)
+            writer.writerows(rows)
+
+    def open_rows(self) -> Dict[str, list]:
+        """Current (not yet closed) bucket of each level, as CSV-style rows."""
+        return {lvl: b.row() for lvl, b in self.open.items()}
+
+    def extra_rows(self, level: str) -> List[list]:
+        """Rows of a level that are not in its CSV: unsaved closed buckets, then the open one."""
+        rows = list(self.unsaved.get(level, []))
+        if level in self.open:
+            rows.append(self.open[level].row())
+        return rows
+
+
+def index_logs(paths: Optional[List[Path]] = None) -> Dict[str, int]:
+    """Bring the rollups of the given logs (default: every log) up to date."""
+    paths = paths or sorted(LOGS_DIR.glob("*.csv"))
+    done = {}
+    for path in paths:
+        try:
+            done[Path(path).name] = RollupIndex(path).update()
+        except Exception as e:
+            logger.error(f"Rollups for {Path(path).name} failed: {e}")
+    return done
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    for name, rows in index_logs([Path(p) for p in sys.argv[1:]]).items():
+        print(f"📚 {name}: {rows} new rows indexed")
@@ -0,0 +1,390 @@
+import os
+import csv
+import sys
+import time
+import logging
+import subprocess
+from dataclasses import dataclass, asdict
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Iterable, List, Optional, Tuple
+
+import psutil
+
+"""
+Supreme Ruler 2030 - Scheduling Profiles
+- "performance":   legacy behaviour, suite runs at HIGH priority on every core.
+- "game_friendly": suite runs BELOW NORMAL and is pinned to the cores the game
+                   is not saturating, so the simulation thread keeps its core.
+Also provides a CPU share monitor (suite vs game), a days/second benchmark
+that compares game speed with the suite active versus idle, and a cold-start
+import profile:  python scheduling.py importtime [module]
+"""
+
+logger = logging.getLogger(__name__)
+
+PROFILES = ("performance", "game_friendly")
+DEFAULT_PROFILE = "performance"
+
+BASE_DIR = Path.home() / "Documents" / "SR2030_Logger"
+BENCHMARK_LOG_PATH = BASE_DIR / "benchmarks.csv"
+
+# A core above this load is considered busy (the game's simulation thread lives there)
+SATURATED_CORE_PCT = 80.0
+
+
+# ============================================================
+# PRIORITY / AFFINITY
+# ============================================================
+
+def _priority_value(profile: str):
+    """Map a profile to a psutil nice value (Windows priority class or POSIX niceness)."""
+    if profile == "game_friendly":
+        return getattr(psutil, "BELOW_NORMAL_PRIORITY_CLASS", 10)
+    return getattr(psutil, "HIGH_PRIORITY_CLASS", -5)
+
+
+def pick_free_cores(sample_interval: float = 0.5) -> List[int]:
+    """
+    Return the cores the game is not saturating, least loaded first.
+    The busiest core is always excluded (that's where the simulation thread runs),
+    but at least one core is always returned.
+    """
+    try:
+        loads = psutil.cpu_percent(interval=sample_interval, percpu=True)
+    except Exception:
+        return []
+    if len(loads) <= 1:
+        return list(range(len(loads)))
+
+    ranked = sorted(range(len(loads)), key=lambda i: loads[i])
+    busiest = ranked[-1]
+    free = [i for i in ranked if i != busiest and loads[i] < SATURATED_CORE_PCT]
+    return free or [ranked[0]]
+
+
+def _apply_to_process(proc: psutil.Process, profile: str, cores: Optional[List[int]]):
+    try:
+        proc.nice(_priority_value(profile))
+    except Exception as e:
+        logger.warning(f"Could not set priority for PID {proc.pid}: {e}")
+
+    if not hasattr(proc, "cpu_affinity"):
+        return
+    try:
+        if cores:
+            proc.cpu_affinity(cores)
+        else:
+            proc.cpu_affinity([])  # empty list = all cores
+    except Exception as e:
+        logger.warning(f"Could not set CPU affinity for PID {proc.pid}: {e}")
+
+
+def apply_profile(profile: str, extra_pids: Iterable[int] = ()) -> List[int]:
+    """
+    Apply a scheduling profile to this process and to helper processes
+    (overlay, tech tree). Returns the cores the suite was pinned to
+    (empty list = unrestricted).
+    """
+    if profile not in PROFILES:
+        profile = DEFAULT_PROFILE
+
+    cores = pick_free_cores() if profile == "game_friendly" else []
+
+    targets = [psutil.Process(os.getpid())]
+    for pid in extra_pids:
+        try:
+            targets.append(psutil.Process(pid))
+        except psutil.Error:
+            continue
+
+    for proc in targets:
+        _apply_to_process(proc, profile, cores)
+
+    if cores:
+        logger.info(f"Scheduling profile '{profile}': below-normal priority, pinned to cores {cores}.")
+    else:
+        logger.info(f"Scheduling profile '{profile}': priority set, all cores.")
+    return cores
+
+
+# ============================================================
+# CPU SHARE MONITOR
+# ============================================================
+
+@dataclass
+class CpuReport:
+    suite_pct: float          # % of one core used by launcher + helpers
+    game_pct: float           # % of one core used by the game (can exceed 100 on multi-thread)
+    suite_share: float        # suite share of total machine capacity (0-100)
+    game_share: float         # game share of total machine capacity (0-100)
+    busiest_core_pct: float
+    overlaps_busy_core: bool  # suite allowed to run on a saturated core
+    slowing_game: bool
+    verdict: str
+
+
+class CpuMonitor:
+    """
+    Samples the CPU use of the suite (this process + helpers) and of the game.
+    Call `sample()` periodically; the first call only primes psutil's counters.
+    """
+
+    # Suite usage (in % of one core) above which it can steal time from a saturated game core
+    SUITE_CONTENTION_PCT = 5.0
+
+    def __init__(self, game_pid: Optional[int] = None, helper_pids: Callable[[], Iterable[int]] = lambda: ()):
+        self.game_pid = game_pid
+        self.helper_pids = helper_pids
+        self._procs = {}
+        self.cpu_count = psutil.cpu_count() or 1
+
+    def _proc(self, pid: int) -> Optional[psutil.Process]:
+        proc = self._procs.get(pid)
+        if proc is None:
+            try:
+                proc = psutil.Process(pid)
+                proc.cpu_percent(None)  # prime
+            except psutil.Error:
+                return None
+            self._procs[pid] = proc
+        return proc
+
+    def _cpu(self, pid: int) -> float:
+        proc = self._proc(pid)
+        if proc is None:
+            return 0.0
+        try:
+            return proc.cpu_percent(None)
+        except psutil.Error:
+            self._procs.pop(pid, None)
+            return 0.0
+
+    def sample(self) -> CpuReport:
+        suite_pids = [os.getpid(), *self.helper_pids()]
+        suite_pct = sum(self._cpu(pid) for pid in suite_pids)
+        game_pct = self._cpu(self.game_pid) if self.game_pid else 0.0
+
+        try:
+            loads = psutil.cpu_percent(None, percpu=True)
+        except Exception:
+            loads = []
+        busiest = max(range(len(loads)), key=lambda i: loads[i]) if loads else None
+        busiest_pct = loads[busiest] if loads else 0.0
+
+        overlaps = False
+        if busiest is not None:
+            try:
+                affinity = psutil.Process(os.getpid()).cpu_affinity()
+                overlaps = busiest in affinity
+            except Exception:
+                overlaps = True
+
+        game_bound = busiest_pct >= SATURATED_CORE_PCT and game_pct >= SATURATED_CORE_PCT
+        slowing = game_bound and overlaps and suite_pct >= self.SUITE_CONTENTION_PCT
+
+        if slowing:
+            verdict = (f"Game is CPU-bound on core {busiest} and the suite ({suite_pct:.1f}%) "
+                       f"shares it - consider the 'game_friendly' profile.")
+        elif game_bound:
+            verdict = "Game is CPU-bound but the suite stays off its core."
+        else:
+            verdict = "OK - game is not CPU-bound."
+
+        return CpuReport(
+            suite_pct=round(suite_pct, 1),
+            game_pct=round(game_pct, 1),
+            suite_share=round(suite_pct / self.cpu_count, 2),
+            game_share=round(game_pct / self.cpu_count, 2),
+            busiest_core_pct=round(busiest_pct, 1),
+            overlaps_busy_core=overlaps,
+            slowing_game=slowing,
+            verdict=verdict,
+        )
+
+
+# ============================================================
+# BENCHMARK (game days/second, suite active vs idle)
+# ============================================================
+
+@dataclass
+class BenchmarkResult:
+    timestamp: str
+    profile: str
+    phase_seconds: float
+    rounds: int
+    days_active: int
+    days_idle: int
+    days_per_sec_active: float
+    days_per_sec_idle: float
+    slowdown_pct: float
+
+
+def _count_days(reader, duration: float, probe_interval: float, stop: Callable[[], bool]) -> Tuple[int, float]:
+    """
+    Count day-signature changes seen by a lightweight probe during `duration`
+    seconds. Returns (days, seconds actually probed): less when stopped early.
+    """
+    from logging_session import day_signature
+
+    days = 0
+    last_sig = None
+    start = time.monotonic()
+    end = start + duration
+    while time.monotonic() < end and not stop():
+        data = reader.read_snapshot()
+        if data:
+            sig = day_signature(data)
+            if last_sig is not None and sig != last_sig:
+                days += 1
+            last_sig = sig
+        time.sleep(probe_interval)
+    return days, min(time.monotonic(), end) - start
+
+
+def run_benchmark(reader,
+                  suspend_suite: Callable[[], None],
+                  resume_suite: Callable[[], None],
+                  profile: str = DEFAULT_PROFILE,
+                  phase_seconds: float = 30.0,
+                  rounds: int = 2,
+                  probe_interval: float = 0.1,
+                  stop: Callable[[], bool] = lambda: False) -> BenchmarkResult:
+    """
+    Alternate "active" (suite running normally) and "idle" (sessions paused,
+    overlay suspended) phases while a probe counts in-game days. Alternating
+    phases cancels out slow drifts in game speed. Result is appended to
+    benchmarks.csv unless `stop` ended it early. Rates use the time each phase
+    actually ran.
+    """
+    days_active = days_idle = 0
+    secs_active = secs_idle = 0.0
+
+    for _ in range(rounds):
+        if stop():
+            break
+        days, secs = _count_days(reader, phase_seconds, probe_interval, stop)
+        days_active += days
+        secs_active += secs
+
+        suspend_suite()
+        try:
+            days, secs = _count_days(reader, phase_seconds, probe_interval, stop)
+            days_idle += days
+            secs_idle += secs
+        finally:
+            resume_suite()
+
+    dps_active = days_active / secs_active if secs_active > 0 else 0.0
+    dps_idle = days_idle / secs_idle if secs_idle > 0 else 0.0
+    slowdown = (1.0 - dps_active / dps_idle) * 100.0 if dps_idle > 0 else 0.0
+
+    result = BenchmarkResult(
+        timestamp=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        profile=profile,
+        phase_seconds=phase_seconds,
+        rounds=rounds,
+        days_active=days_active,
+        days_idle=days_idle,
+        days_per_sec_active=round(dps_active, 4),
+        days_per_sec_idle=round(dps_idle, 4),
+        slowdown_pct=round(slowdown, 2),
+    )
+    if stop():
+        logger.info("Benchmark stopped early: not recorded in benchmarks.csv")
+    else:
+        _append_benchmark(result)
+    return result
+
+
+def _append_benchmark(result: BenchmarkResult):
+    row = asdict(result)
+    try:
+        BENCHMARK_LOG_PATH.parent.mkdir(parents=True, exist_ok=True)
+        exists = BENCHMARK_LOG_PATH.exists() and BENCHMARK_LOG_PATH.stat().st_size > 0
+        with open(BENCHMARK_LOG_PATH, "a", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=list(row.keys()))
+            if not exists:
+                writer.writeheader()
+            writer.writerow(row)
+    except Exception as e:
+        logger.error(f"Could not write benchmark log: {e}")
+
+
+# ============================================================
+# IMPORT-TIME PROFILE (launcher cold start)
+# ============================================================
+
+IMPORT_LOG_PATH = BASE_DIR / "import_times.csv"
+
+
+@dataclass
+class ImportTiming:
+    module: str
+    self_ms: float
+    cumulative_ms: float
+    depth: int  # 0 = the profiled module, 1 = what it imports directly, ...
+
+
+def profile_imports(module: str = "launcher", top: int = 12) -> Tuple[float, List[ImportTiming]]:
+    """
+    Import `module` in a fresh interpreter with `-X importtime` and return
+    (total ms, its direct imports by cumulative time, slowest first).
+    The total is appended to import_times.csv to track cold start over time.
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=Path(__file__).parent, capture_output=True, text=True, timeout=120,
+    )
+    timings = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # column header
+        name = fields[2][1:]
+        depth = (len(name) - len(name.lstrip())) // 2
+        timings.append(ImportTiming(name.strip(), int(fields[0]) / 1000, int(fields[1]) / 1000, depth))
+
+    root = next((t for t in reversed(timings) if t.module == module and t.depth == 0), None)
+    if root is None:
+        raise RuntimeError(f"import {module} failed:\n{proc.stderr.strip()[-1000:]}")
+
+    # Entries are printed children first: the direct imports are the depth-1 rows of the last top-level block
+    start = max((i for i, t in enumerate(timings) if t.depth == 0 and t is not root), default=-1) + 1
+    direct = [t for t in timings[start:] if t.depth == 1]
+    direct.sort(key=lambda t: t.cumulative_ms, reverse=True)
+    _append_import_profile(module, root.cumulative_ms, direct[:3])
+    return root.cumulative_ms, direct[:top]
+
+
+def _append_import_profile(module: str, total_ms: float, heaviest: List[ImportTiming]):
+    row = {
+        "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "module": module,
+        "total_ms": round(total_ms, 1),
+        "heaviest": "; ".join(f"{t.module}={t.cumulative_ms:.0f}ms" for t in heaviest),
+    }
+    try:
+        IMPORT_LOG_PATH.parent.mkdir(parents=True, exist_ok=True)
+        exists = IMPORT_LOG_PATH.exists() and IMPORT_LOG_PATH.stat().st_size > 0
+        with open(IMPORT_LOG_PATH, "a", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=list(row.keys()))
+            if not exists:
+                writer.writeheader()
+            writer.writerow(row)
+    except Exception as e:
+        logger.error(f"Could not write import profile: {e}")
+
+
+if __name__ == "__main__":
+    # python scheduling.py importtime [module]
+    if len(sys.argv) > 1 and sys.argv[1] == "importtime":
+        target = sys.argv[2] if len(sys.argv) > 2 else "launcher"
+        total, heaviest = profile_imports(target)
+        print(f"⏱️ import {target}: {total:.0f} ms")
+        for t in heaviest:
+            print(f"  {t.cumulative_ms:8.1f} ms  {t.module}")
+    else:
+        print("Usage: python scheduling.py importtime [module]")
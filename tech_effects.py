@@ -1,6 +1,9 @@
-import copy
-from typing import Dict, Tuple, Set, Optional
-from unit_parser import Unit
+from collections import OrderedDict
+from typing import Dict, Iterator, Tuple, Set, Optional
+
+import numpy as np
+
+from unit_parser import Unit, UnitTable
 
 # ===========================================================================================
 # GLOBAL EFFECTS MAP (Text Descriptions)
@@ -190,121 +193,140 @@ BOOL_EFFECT_MAP: Dict[int, str] = {
     234: "ecm",                  # Electronic Counter Measures
 }
 
+def _unit_effects(tech_ids: Set[int], tech_light: Dict[int, dict]) -> Iterator[Tuple[int, float]]:
+    """(effect_id, value) of every effect of the given techs, in application order."""
+    for tid in tech_ids:
+        tech_info = tech_light.get(tid)
+        if not tech_info:
+            continue
+        for eff in tech_info.get("effects", []):
+            eid = eff.get("effect_id")
+            if eid is None:
+                continue
+            try:
+                yield eid, float(eff.get("value", 0.0))
+            except (TypeError, ValueError):
+                continue
+
+
+def _as_int(values: np.ndarray) -> np.ndarray:
+    """int() of every value (truncates toward zero)."""
+    return values.astype(np.int64)
+
+
+def apply_techs_to_table(
+    table: UnitTable,
+    tech_ids: Set[int],
+    tech_light: Dict[int, dict],
+    rows=None,
+) -> UnitTable:
+    """
+    Every effect of `tech_ids` applied to all units of `table` (or only `rows`)
+    with one array operation per effect. Returns a new table; `table` is untouched.
+    """
+    out = table.take(rows) if rows is not None else table.copy()
+    cols = out.columns
+
+    for eid, val in _unit_effects(tech_ids, tech_light):
+        # Handle Booleans (Enable/Disable flags)
+        if eid in BOOL_EFFECT_MAP:
+            cols[BOOL_EFFECT_MAP[eid]] = np.ones(len(out), dtype=np.int64)
+            continue
+
+        # Handle Global Military Bonuses (116-127)
+        if eid in GLOBAL_UNIT_EFFECT_MAP:
+            attrs, mode = GLOBAL_UNIT_EFFECT_MAP[eid]
+            for attr in attrs:
+                base = out.column(attr)
+                cols[attr] = base * (1.0 + val) if mode == "mul" else base + val
+            continue
+
+        # Handle Stats Unit Upgrade (Multiplicative/Additive)
+        if eid not in EFFECT_MAP:
+            continue
+        attr, mode = EFFECT_MAP[eid]
+
+        # Special Case: Range Modifiers (150-153) apply to RAW, DEF, and missile ranges
+        if eid in (150, 151, 152, 153):
+            if mode != "mul":
+                continue
+            factor = 1.0 + val
+            base = out.column(attr)
+            boosted = _as_int(base * factor)
+            cols[attr] = np.where(base > 0, boosted, _as_int(base))  # ranges stay int, as int() per unit did
+            for extra in (attr + "_def", "missile_range_km"):
+                base = out.column(extra)
+                cols[extra] = np.where(base > 0, base * factor, base)
+            continue
+
+        # Standard Handling for all other attributes
+        base = out.column(attr)
+        if mode == "mul":
+            # ex: val=0.1 (10%) -> base * 1.1
+            boosted = base * (1.0 + val)
+            # Keep int for ranges/spotting, float for others
+            if "range" in attr or "spot" in attr or "speed" in attr:
+                boosted = _as_int(boosted)
+            cols[attr] = boosted
+        elif mode == "add":
+            cols[attr] = base + val
+
+    return out
+
+
 def apply_techs_to_unit(
     unit: Optional[Unit],
     tech_ids: Set[int],
     tech_light: Dict[int, dict],
 ) -> Optional[Unit]:
-
+    """The unit with the techs applied, as a row of a new one-row table (the original is untouched)."""
     if unit is None or not tech_ids or not tech_light:
         return unit
+    return apply_techs_to_table(unit._table, tech_ids, tech_light, rows=slice(unit._row, unit._row + 1)).row(0)
 
-    modified = copy.deepcopy(unit)
 
-    for tid in tech_ids:
-        tech_info = tech_light.get(tid)
-        if not tech_info:
-            continue
+# ===========================================================================================
+# MEMOIZED APPLICATION (comparison table repaints)
+# The overlay repaints every frame; the B/C/D columns only change when a unit
+# is selected or a tech checkbox is toggled, so results are kept in an LRU
+# keyed by (unit row, active techs, tech-data version).
+# ===========================================================================================
+TECH_CACHE_SIZE = 256
 
-        effects = tech_info.get("effects", [])
-        for eff in effects:
-            eid = eff.get("effect_id")
-            val = eff.get("value", 0.0)
-
-            if eid is None: continue
-
-            # Handle Booleans (Enable/Disable flags)
-            if eid in BOOL_EFFECT_MAP:
-                attr_flag = BOOL_EFFECT_MAP[eid]
-                if not hasattr(modified, attr_flag):
-                    setattr(modified, attr_flag, 0)
-                try:
-                    setattr(modified, attr_flag, 1)
-                except: pass
-                continue
-                
-            # Handle Global Military Bonuses (116-127)
-            if eid in GLOBAL_UNIT_EFFECT_MAP:
-                attrs, mode = GLOBAL_UNIT_EFFECT_MAP[eid]
-                for attr in attrs:
-                    base = getattr(modified, attr, 0.0)
-                    if base is None:
-                        continue
-                    try:
-                        if mode == "mul":
-                            new_val = base * (1.0 + float(val))
-                            setattr(modified, attr, new_val)
-                        elif mode == "add":
-                            setattr(modified, attr, base + float(val))
-                    except:
-                        pass
-                continue
+
+class TechEffectCache:
+    def __init__(self, maxsize: int = TECH_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[tuple, Unit]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def apply(self, unit: Optional[Unit], tech_ids: Set[int], tech_light: Dict[int, dict],
+              version: int = 0) -> Optional[Unit]:
+        """apply_techs_to_unit, computed once per (unit, techs, version). Treat the result as read-only."""
+        if unit is None or not tech_ids or not tech_light:
+            return unit
+        # The table itself (not its id()) keeps the key valid while the entry lives
+        key = (unit._table, unit._row, unit.id, frozenset(tech_ids), version)
+        result = self._entries.get(key)
+        if result is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return result
+        self.misses += 1
+        result = self._entries[key] = apply_techs_to_unit(unit, tech_ids, tech_light)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return result
+
+    def clear(self):
+        self._entries.clear()
+
+
+TECH_CACHE = TechEffectCache()
 
 
-            # Handle Stats Unit Upgrade (Multiplicative/Additive)
-            if eid in EFFECT_MAP:
-                attr, mode = EFFECT_MAP[eid]
-                
-                # Special Case: Global Spotting (125) applies to BOTH ranges if possible
-                if eid == 125:
-                    # Apply to Visual
-                    base1 = getattr(modified, "spot1_range_km", 0)
-                    if base1 > 0:
-                        setattr(modified, "spot1_range_km", int(base1 * (1.0 + float(val))))
-                    
-                    # Apply to Radar
-                    base2 = getattr(modified, "spot2_range_km", 0)
-                    if base2 > 0:
-                        setattr(modified, "spot2_range_km", int(base2 * (1.0 + float(val))))
-                    continue
-                
-                # Special Case: Range Modifiers (150-153) apply to RAW, DEF, and missile ranges
-                if eid in (150, 151, 152, 153):
-                    # Apply to RAW range
-                    base = getattr(modified, attr, 0.0)
-                    if base is not None and base > 0:
-                        try:
-                            if mode == "mul":
-                                new_val = base * (1.0 + float(val))
-                                setattr(modified, attr, int(new_val))
-                        except: pass
-                    
-                    # Apply to corresponding DEF range
-                    def_attr = attr + "_def"
-                    base_def = getattr(modified, def_attr, 0.0)
-                    if base_def is not None and base_def > 0:
-                        try:
-                            if mode == "mul":
-                                new_val_def = base_def * (1.0 + float(val))
-                                setattr(modified, def_attr, new_val_def)
-                        except: pass
-                    
-                    # Apply to missile_range_km for missile units
-                    missile_base = getattr(modified, "missile_range_km", 0.0)
-                    if missile_base > 0:
-                        try:
-                            if mode == "mul":
-                                new_missile_range = missile_base * (1.0 + float(val))
-                                setattr(modified, "missile_range_km", new_missile_range)
-                        except: pass
-                    
-                    continue
-                
-                # Standard Handling for all other attributes
-                base = getattr(modified, attr, 0.0)
-                if base is None: continue
-
-                try:
-                    if mode == "mul":
-                        # ex: val=0.1 (10%) -> base * 1.1
-                        new_val = base * (1.0 + float(val))
-                        # Keep int for ranges/spotting, float for others
-                        if "range" in attr or "spot" in attr or "speed" in attr:
-                            setattr(modified, attr, int(new_val))
-                        else:
-                            setattr(modified, attr, new_val)
-                            
-                    elif mode == "add":
-                        setattr(modified, attr, base + float(val))
-                except: continue
-    return modified
\ No newline at end of file
+def apply_techs_cached(unit: Optional[Unit], tech_ids: Set[int], tech_light: Dict[int, dict],
+                       version: int = 0) -> Optional[Unit]:
+    """apply_techs_to_unit through the shared TECH_CACHE; bump `version` when the tech data is reloaded."""
+    return TECH_CACHE.apply(unit, tech_ids, tech_light, version)
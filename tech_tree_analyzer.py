@@ -48,6 +48,9 @@ except ImportError:
     IPC_AVAILABLE = False
     print("[System] WARNING: ipc_bridge.py not found. Overlay integration disabled.")
 
+from unit_cache import load_units as load_cached_units, find_spotting, find_range_database
+from unit_cache import clear_cache as clear_unit_cache
+
 # =============================================================================
 # CONSTANTS & STYLING
 # =============================================================================
@@ -1275,45 +1278,27 @@ def _calculate_depths(techs: Dict[int, TechData]):
         get_depth(tid)
 
 
-def load_units(path: str) -> Dict[int, UnitData]:
+def load_units(path: str, spotting_path: Optional[str] = None) -> Dict[int, UnitData]:
+    """
+    Units from the unit cache shared with the overlay (unit_cache.py), so
+    DEFAULT.UNIT is parsed once for both tools. Spotting.csv and the range
+    database are located the same way the overlay does.
+    """
+    spotting = find_spotting(spotting_path or load_launcher_config().get("default_spotting_path"))
     units = {}
-    try:
-        with open(path, "r", encoding="latin-1", errors="replace") as f:
-            lines = f.readlines()
-    except: return units
-    
-    start_idx = next((i+1 for i, l in enumerate(lines) if l.strip().startswith("&&UNITS")), 0)
-    
-    for row in csv.reader(lines[start_idx:], delimiter=",", quotechar='"'):
-        if not row or len(row) < 30 or row[0].strip().startswith("//"):
+    for u in load_cached_units(path, spotting, find_range_database()):
+        if u.id <= 0:
             continue
-        try:
-            u = UnitData()
-            u.id = parse_int(row[0])
-            u.name = row[1].strip().strip('"')
-            u.class_num = parse_int(row[2])
-            year_val = parse_int(row[4])
-            u.year = str(1900 + year_val) if year_val > 0 else ""
-            
-            # Tech Requirement is at column 23
-            u.req_tech_id = parse_int(row[23]) if len(row) > 23 else 0
-            u.region = row[12].strip() if len(row) > 12 else ""
-            
-            # Strength (numero soldati/veicoli) è alla colonna 13
-            strength = parse_int(row[13]) or 1
-            
-            # --- CORREZIONE DEFINITIVA ---
-            # 1. Usiamo la colonna 26 (come nel tuo file per Pennsylvania, Moltke, ecc.)
-            # 2. Moltiplichiamo per 1.000.000 (il file dice "11.1" per 11.1 Milioni)
-            # 3. Moltiplichiamo per strength (il costo nel file è solitamente per singolo pezzo)
-            cost_per_unit_m = parse_float(row[26]) if len(row) > 26 else 0.0
-            u.cost = cost_per_unit_m * 1000000.0 * strength
-            # -----------------------------
-            
-            if u.id > 0:
-                units[u.id] = u
-        except: continue
-    
+        units[u.id] = UnitData(
+            id=u.id,
+            name=u.name,
+            class_num=u.class_num,
+            year=u.year if u.year != "N/A" else "",
+            req_tech_id=u.req_tech_id,
+            # DEFAULT.UNIT costs are in millions, per single piece (already x strength)
+            cost=u.cost * 1000000.0,
+            region=u.region,
+        )
     return units
 
 
@@ -1400,6 +1385,7 @@ def clear_cache():
         if CACHE_DIR.exists():
             for f in CACHE_DIR.glob("techcache_*.pkl"):
                 f.unlink()
+        clear_unit_cache()
         return True
     except:
         return False
@@ -0,0 +1,164 @@
+import hashlib
+import os
+import pickle
+import time
+from pathlib import Path
+from typing import Iterable, List, Optional
+
+from spotting_parser import SPOTTING_DB, load_spotting_file
+from unit_parser import (RANGE_DATABASE, UNIT_FIELDS, Unit, UnitTable, load_range_database, parse_unit_table,
+                         schema_override_path)
+
+"""
+Supreme Ruler 2030 - Unit Cache
+- One compiled copy of DEFAULT.UNIT shared by the INS overlay and the Tech Tree
+  Analyzer: the parsed UnitTable (spotting ranges and in-game ranges already
+  resolved) pickled column by column, so loading it is a few array reads.
+- The cache key is a content hash of DEFAULT.UNIT, Spotting.csv, the range
+  database and a mod's schema override (DEFAULT.UNIT.schema.json), plus
+  CACHE_VERSION and UNIT_FIELDS, so editing any input or changing the unit
+  columns rebuilds it on the next load. Nothing to clear by hand.
+- One cache file per DEFAULT.UNIT location; written to a temp file and renamed,
+  so the two tools can rebuild it at the same time safely.
+"""
+
+CACHE_DIR = Path.home() / "Documents" / "SR2030_Logger" / "cache"
+CACHE_VERSION = 3  # Increment if parsing changes without a Unit field change
+
+STEAM_DATA_DIR = Path(r"C:/Program Files (x86)/Steam/steamapps/common/Supreme Ruler 2030/Maps/DATA")
+RANGE_DB_NAME = "unit_rangestats_database.csv"
+
+
+# ============================================================
+# INPUT FILES
+# ============================================================
+
+def _first_existing(candidates: Iterable[Optional[Path]]) -> Optional[str]:
+    for p in candidates:
+        if p and p.exists():
+            return str(p)
+    return None
+
+
+def find_spotting(path: Optional[str] = None) -> Optional[str]:
+    """Spotting.csv: the given path, the Steam install, or next to the scripts."""
+    return _first_existing([
+        Path(path) if path else None,
+        STEAM_DATA_DIR / "Spotting.csv",
+        Path(__file__).with_name("Spotting.csv"),
+    ])
+
+
+def find_range_database(path: Optional[str] = None) -> Optional[str]:
+    """Range stats CSV from the scanner: the given path, next to the scripts, or the working directory."""
+    return _first_existing([
+        Path(path) if path else None,
+        Path(__file__).parent / RANGE_DB_NAME,
+        Path.cwd() / RANGE_DB_NAME,
+    ])
+
+
+def _fields() -> List[str]:
+    return [f"{name}:{kind}" for name, kind, _ in UNIT_FIELDS]
+
+
+def cache_key(unit_path: str, spotting_path: Optional[str] = None, range_path: Optional[str] = None) -> str:
+    """Content hash of every input (a missing optional input hashes as empty)."""
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f"v{CACHE_VERSION}|{','.join(_fields())}".encode())
+    for path in (unit_path, spotting_path, range_path, schema_override_path(unit_path)):
+        h.update(b"\0file\0")
+        if path and Path(path).exists():
+            with open(path, "rb") as f:
+                for chunk in iter(lambda: f.read(1 << 20), b""):
+                    h.update(chunk)
+    return h.hexdigest()
+
+
+def _cache_path(unit_path: str) -> Path:
+    name = hashlib.md5(str(Path(unit_path).resolve()).encode()).hexdigest()[:12]
+    return CACHE_DIR / f"units_{name}.pkl"
+
+
+# ============================================================
+# LOAD / SAVE
+# ============================================================
+
+def _read(cache_path: Path, key: str) -> Optional[UnitTable]:
+    try:
+        with open(cache_path, "rb") as f:
+            data = pickle.load(f)
+        if data.get("key") != key or data.get("fields") != _fields():
+            return None
+        return UnitTable(data["columns"])
+    except Exception:
+        return None
+
+
+def _write(cache_path: Path, key: str, table: UnitTable):
+    data = {
+        "key": key,
+        "fields": _fields(),
+        "created": time.time(),
+        "columns": table.columns,
+    }
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp, "wb") as f:
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, cache_path)
+    except Exception as e:
+        print(f"[UnitCache] Could not save cache: {e}")
+
+
+def load_unit_table(unit_path: str, spotting_path: Optional[str] = None,
+                    range_path: Optional[str] = None) -> UnitTable:
+    """
+    UnitTable of DEFAULT.UNIT with spotting and range data applied: from the
+    cache when every input is unchanged, otherwise parsed and cached.
+    """
+    if not unit_path or not Path(unit_path).exists():
+        print(f"File not found: {unit_path}")
+        return UnitTable.from_records([])
+    key = cache_key(unit_path, spotting_path, range_path)
+    cache_path = _cache_path(unit_path)
+    table = _read(cache_path, key) if cache_path.exists() else None
+    if table is not None:
+        print(f"[UnitCache] ⚡ {len(table)} units from cache")
+        return table
+
+    t0 = time.perf_counter()
+    # The parser resolves ranges from these module-level tables
+    if range_path:
+        load_range_database(range_path)
+    else:
+        RANGE_DATABASE.clear()
+    if spotting_path:
+        load_spotting_file(spotting_path)
+    else:
+        SPOTTING_DB.clear()
+    table = parse_unit_table(unit_path)
+    if len(table):
+        _write(cache_path, key, table)
+    print(f"[UnitCache] 💾 Parsed {len(table)} units in {(time.perf_counter() - t0) * 1000:.0f} ms")
+    return table
+
+
+def load_units(unit_path: str, spotting_path: Optional[str] = None,
+               range_path: Optional[str] = None) -> List[Unit]:
+    """Row views of load_unit_table()."""
+    return load_unit_table(unit_path, spotting_path, range_path).rows()
+
+
+def clear_cache() -> int:
+    """Delete every unit cache file. Returns how many were removed."""
+    removed = 0
+    if CACHE_DIR.exists():
+        for f in CACHE_DIR.glob("units_*.pkl"):
+            try:
+                f.unlink()
+                removed += 1
+            except OSError:
+                pass
+    return removed
@@ -0,0 +1,262 @@
+import random
+import re
+import sys
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from unit_parser import Unit, UnitTable
+
+"""
+Supreme Ruler 2030 - Unit Index
+- Dict indexes over the overlay's unit list, built once when DEFAULT.UNIT is
+  loaded: unit ID -> Unit, class number -> units, region -> units.
+- The in-game selection sync (every 30 ms game_loop tick while the menu is
+  open) becomes one dict lookup instead of a scan of every unit, so it costs
+  the same for a 2k-unit vanilla file and a 20k-unit mod.
+- Duplicate IDs keep the first unit, like the linear scan did.
+- Search box: names are lowercased once, category rows bucketed once, and
+  each name gets a bitmask of its letters/digits, so a query only tests names
+  holding all its characters. Typing one more character narrows the previous
+  result set; backspace reuses it (recent result sets are kept).
+- Fuzzy: punctuation and spaces are ignored ("f35" finds "F-35A") and, from
+  FUZZY_MIN_CHARS on, letters in order match too ("abrms"). Results are ranked
+  exact name/ID, name prefix, word prefix, substring, fuzzy; file order within.
+- Benchmark:  python unit_index.py [units]   (default 10000)
+"""
+
+BENCH_UNITS = 10000
+BENCH_TICKS = 2000
+SEARCH_HISTORY = 64   # narrowed result sets kept per (category, query)
+FUZZY_MIN_CHARS = 3   # shorter queries only list names containing them
+
+TIER_EXACT, TIER_PREFIX, TIER_WORD, TIER_SUBSTRING, TIER_COMPACT, TIER_FUZZY = range(6)
+_SEPARATORS = re.compile(r"[^0-9a-z]+")
+_NO_ROWS = np.zeros(0, dtype=np.intp)
+
+
+class UnitIndex:
+    def __init__(self, table: UnitTable, units: Optional[List[Unit]] = None):
+        self.units = units if units is not None else table.rows()
+        ids = table.columns["id"].tolist()
+        self.by_id: Dict[int, Unit] = {}
+        for uid, u in zip(reversed(ids), reversed(self.units)):
+            self.by_id[uid] = u  # reversed: the first unit with an ID wins
+        self.by_class = self._group(table.columns["class_num"].tolist())
+        self.by_region = self._group(table.columns["region"].tolist())
+        self.search = UnitSearch(table)
+
+    def _group(self, keys: list) -> Dict[object, List[Unit]]:
+        groups: Dict[object, List[Unit]] = {}
+        for key, u in zip(keys, self.units):
+            groups.setdefault(key, []).append(u)
+        return groups
+
+    def get(self, uid: Optional[int]) -> Optional[Unit]:
+        return self.by_id.get(uid)
+
+    def of_class(self, class_num: int) -> List[Unit]:
+        return self.by_class.get(class_num, [])
+
+    def of_region(self, region: str) -> List[Unit]:
+        return self.by_region.get(region, [])
+
+
+# ============================================================
+# SEARCH
+# ============================================================
+
+def _compact(text: str) -> str:
+    """Lowercase letters and digits only: "F-35A Lightning" -> "f35alightning"."""
+    return _SEPARATORS.sub("", text.lower())
+
+
+def _char_mask(text: str) -> int:
+    mask = 0
+    for c in set(text):
+        mask |= 1 << (ord(c) & 63)
+    return mask
+
+
+def _char_masks(texts: np.ndarray) -> np.ndarray:
+    """_char_mask of every string of a str array, from its character codes."""
+    if not len(texts) or texts.dtype.itemsize == 0:
+        return np.zeros(len(texts), dtype=np.uint64)
+    codes = texts.view(np.uint32).reshape(len(texts), -1).astype(np.uint64)
+    bits = np.where(codes > 0, np.left_shift(np.uint64(1), codes & np.uint64(63)), np.uint64(0))
+    return np.bitwise_or.reduce(bits, axis=1)
+
+
+class UnitSearch:
+    """Ranked, incremental name/ID search over the rows of one UnitTable."""
+
+    def __init__(self, table: UnitTable):
+        names = [str(n).lower() for n in table.columns["name"]]
+        words = [" " + _SEPARATORS.sub(" ", n) for n in names]
+        self._compact_names = [w.replace(" ", "") for w in words]
+        self._lower = np.array(names, dtype=str)
+        self._words = np.array(words, dtype=str)
+        self._compact = np.array(self._compact_names, dtype=str)
+        self._masks = _char_masks(self._compact)
+        self._ids = table.columns["id"]
+        categories = table.categories()
+        self.buckets: Dict[str, np.ndarray] = {"all": np.arange(len(names), dtype=np.intp)}
+        for cat in ("land", "air", "naval", "unknown"):
+            self.buckets[cat] = np.flatnonzero(categories == cat)
+        self._history: "OrderedDict[tuple, np.ndarray]" = OrderedDict()
+
+    def _candidates(self, key: str, category: str) -> np.ndarray:
+        """Rows of the category whose compact name holds every character of `key` in order."""
+        rows = self._history.get((category, key))
+        if rows is not None:
+            self._history.move_to_end((category, key))
+            return rows
+        # Start from the longest query typed before this one (a superset)
+        base = None
+        for n in range(len(key) - 1, 0, -1):
+            base = self._history.get((category, key[:n]))
+            if base is not None:
+                break
+        if base is None:
+            base = self.buckets.get(category, _NO_ROWS)
+
+        need = np.uint64(_char_mask(key))
+        base = base[(self._masks[base] & need) == need]
+        pattern = re.compile(".*?".join(map(re.escape, key)))
+        names = self._compact_names
+        rows = np.fromiter((i for i in base.tolist() if pattern.search(names[i])), dtype=np.intp)
+
+        self._history[(category, key)] = rows
+        if len(self._history) > SEARCH_HISTORY:
+            self._history.popitem(last=False)
+        return rows
+
+    def filter(self, query: str, category: str = "all") -> np.ndarray:
+        """
+        Row indices matching `query` in `category` ("all", "land", "air",
+        "naval", "unknown"), best matches first. An empty query keeps file order.
+        """
+        q = query.strip().lower()
+        base = self.buckets.get(category, _NO_ROWS)
+        if not q:
+            return base
+        id_rows = base[self._ids[base] == int(q)] if q.isascii() and q.isdigit() and str(int(q)) == q else _NO_ROWS
+        key = _compact(q)
+        if not key:  # only punctuation: plain substring search
+            rows = base[np.char.find(self._lower[base], q) >= 0]
+        else:
+            rows = self._candidates(key, category)
+            lower = self._lower[rows]
+            tier = np.full(len(rows), TIER_FUZZY, dtype=np.int8)
+            tier[np.char.find(self._compact[rows], key) >= 0] = TIER_COMPACT
+            tier[np.char.find(lower, q) >= 0] = TIER_SUBSTRING
+            tier[np.char.find(self._words[rows], " " + _SEPARATORS.sub(" ", q).strip()) >= 0] = TIER_WORD
+            tier[np.char.startswith(lower, q)] = TIER_PREFIX
+            tier[lower == q] = TIER_EXACT
+            if len(key) < FUZZY_MIN_CHARS:
+                keep = tier < TIER_FUZZY
+                rows, tier = rows[keep], tier[keep]
+            rows = rows[np.lexsort((rows, tier))]
+        if len(id_rows):
+            rows = np.concatenate([id_rows, rows[~np.isin(rows, id_rows)]])
+        return rows
+
+
+# ============================================================
+# BENCHMARK
+# ============================================================
+
+BENCH_MODELS = ["F-35A Lightning II", "F-16C Fighting Falcon", "M1A2 Abrams", "T-90A", "Su-35 Flanker-E",
+                "Type 055 Destroyer", "Leopard 2A7", "MQ-9 Reaper", "AH-64D Apache", "Arleigh Burke DDG"]
+
+
+def _synthetic_table(count: int) -> UnitTable:
+    rng = random.Random(0)
+    ids = rng.sample(range(1, count * 3), count)
+    regions = ["USA", "RUS", "CHN", "GER", "UK", "FRA", "IND", "JPN"]
+    return UnitTable.from_records([
+        {"id": uid, "name": f"{rng.choice(BENCH_MODELS)} Mk{uid % 97}", "class_num": rng.randint(0, 22),
+         "region": rng.choice(regions)}
+        for uid in ids
+    ])
+
+
+def _linear(units: List[Unit], uid: int) -> Optional[Unit]:
+    for u in units:
+        if u.id == uid:
+            return u
+    return None
+
+
+def benchmark_selection_sync(count: int = BENCH_UNITS, ticks: int = BENCH_TICKS) -> Dict[str, float]:
+    """
+    Cost of one selection-sync tick (find the selected ID, compare with unit B)
+    with `count` units: linear scan vs UnitIndex. Times in microseconds.
+    """
+    table = _synthetic_table(count)
+    units = table.rows()
+    t0 = time.perf_counter()
+    index = UnitIndex(table, units)
+    build_ms = (time.perf_counter() - t0) * 1000
+
+    # The selection changes now and then; most ticks re-read the same unit
+    rng = random.Random(1)
+    ids = table.columns["id"]
+    selected = [int(ids[rng.randrange(count)]) for _ in range(ticks // 50 + 1)]
+    sequence = [selected[i // 50] for i in range(ticks)]
+
+    results = {"units": count, "build_ms": build_ms}
+    for name, lookup in (("linear_us", lambda uid: _linear(units, uid)), ("indexed_us", index.get)):
+        current = None
+        loops = ticks if name == "indexed_us" else max(20, ticks // 20)  # the scan is slow
+        t0 = time.perf_counter()
+        for uid in sequence[:loops]:
+            u = lookup(uid)
+            if u is not None and (current is None or current.id != u.id):
+                current = u
+        results[name] = (time.perf_counter() - t0) / loops * 1e6
+    results["speedup"] = results["linear_us"] / max(results["indexed_us"], 1e-9)
+    return results
+
+
+def benchmark_search(count: int = BENCH_UNITS, typed: str = "f35a mk1") -> Dict[str, float]:
+    """
+    Typing `typed` one key at a time and deleting it again with `count` units:
+    full-table mask per keystroke (UnitTable.matches) vs UnitSearch. Times in ms.
+    """
+    table = _synthetic_table(count)
+    t0 = time.perf_counter()
+    search = UnitSearch(table)
+    build_ms = (time.perf_counter() - t0) * 1000
+    queries = [typed[:n] for n in range(1, len(typed) + 1)]
+    queries += queries[-2::-1]  # backspace
+
+    t0 = time.perf_counter()
+    for q in queries:
+        np.flatnonzero(table.matches(q.strip()))
+    full_ms = (time.perf_counter() - t0) / len(queries) * 1000
+
+    worst = 0.0
+    t0 = time.perf_counter()
+    for q in queries:
+        t1 = time.perf_counter()
+        search.filter(q)
+        worst = max(worst, time.perf_counter() - t1)
+    indexed_ms = (time.perf_counter() - t0) / len(queries) * 1000
+    return {"units": count, "build_ms": build_ms, "full_ms": full_ms, "indexed_ms": indexed_ms,
+            "worst_ms": worst * 1000, "results": len(search.filter(typed))}
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else BENCH_UNITS
+    r = benchmark_selection_sync(n)
+    print(f"⏱️ selection sync with {r['units']} units (index built in {r['build_ms']:.1f} ms)")
+    print(f"  linear scan : {r['linear_us']:10.1f} µs/tick")
+    print(f"  indexed     : {r['indexed_us']:10.2f} µs/tick  ({r['speedup']:,.0f}x)")
+    s = benchmark_search(n)
+    print(f"⏱️ search box with {s['units']} units (index built in {s['build_ms']:.1f} ms)")
+    print(f"  full mask   : {s['full_ms']:10.2f} ms/key")
+    print(f"  indexed     : {s['indexed_ms']:10.2f} ms/key  (worst {s['worst_ms']:.2f} ms, "
+          f"{s['results']} results ranked)")
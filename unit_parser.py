@@ -1,6 +1,14 @@
 import csv
-from dataclasses import dataclass, field
+import json
+import sys
+from dataclasses import dataclass, replace
+from itertools import chain
+from operator import itemgetter
 from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
 # UPDATED IMPORT: uses the new dynamic parser instead of the static map
 from spotting_parser import get_spotting_data
 
@@ -71,123 +79,274 @@ def parse_float(value: str) -> float:
         return 0.0
 
 
-@dataclass
-class Unit:
-    """
-    Representation of an SR2030 unit based on DEFAULT.UNIT.
-    """
+# =============================================================================
+# UNIT TABLE (columnar storage)
+# =============================================================================
 
+# (field, kind, default) of every unit stat: one UnitTable column each.
+# Kinds: "i8" int64, "f8" float64, "str" interned strings, "ids" tuple of ints.
+UNIT_FIELDS: list[tuple[str, str, object]] = [
     # Identity
-    id: int = 0
-    name: str = ""
-    class_num: int = 0
-    year: str = "N/A"
-    region: str = ""
-    
+    ("id", "i8", 0),
+    ("name", "str", ""),
+    ("class_num", "i8", 0),
+    ("year", "str", "N/A"),
+    ("region", "str", ""),
+
     # Tech Requirement
-    req_tech_id: int = 0
+    ("req_tech_id", "i8", 0),
 
     # Strength / Personnel
-    strength: int = 1
-    crew: int = 0
-    personnel: int = 0
+    ("strength", "i8", 1),
+    ("crew", "i8", 0),
+    ("personnel", "i8", 0),
 
     # Economy / Production
-    days: int = 0
-    cost: float = 0.0
-    weight: int = 0
+    ("days", "i8", 0),
+    ("cost", "f8", 0.0),
+    ("weight", "i8", 0),
 
     # Movement / Supply
-    speed: int = 0               # km/h
-    move_range: int = 0          # km
-    
+    ("speed", "i8", 0),                     # km/h
+    ("move_range", "i8", 0),                # km
+
     # Fuel System
-    fuel: float = 0.0            # t per single vehicle (from file)
-    fuel_battalion: float = 0.0  # t per battalion (calculated for display)
-    
-    combat_time: int = 0
-    supply_t: float = 0.0        # t per battalion
+    ("fuel", "f8", 0.0),                    # t per single vehicle (from file)
+    ("fuel_battalion", "f8", 0.0),          # t per battalion (calculated for display)
+
+    ("combat_time", "i8", 0),
+    ("supply_t", "f8", 0.0),                # t per battalion
 
     # Initiative / Stealth
-    initiative: int = 0
-    stealth: int = 0
-    
+    ("initiative", "i8", 0),
+    ("stealth", "i8", 0),
+
     # Spotting System
-    spot1_id: int = 0            # Raw ID (es. 34) - usato per calcoli
-    spot2_id: int = 0
-    spot1_range_km: int = 0      # Range convertito (es. 35) - usato per display
-    spot2_range_km: int = 0
-    
+    ("spot1_id", "i8", 0),                  # Raw ID (es. 34) - usato per calcoli
+    ("spot2_id", "i8", 0),
+    ("spot1_range_km", "i8", 0),            # Range convertito (es. 35) - usato per display
+    ("spot2_range_km", "i8", 0),
+
     # Legacy fields (per compatibilità con painters vecchi, opzionale)
-    spot1: int = 0               
-    spot2: int = 0               
+    ("spot1", "i8", 0),
+    ("spot2", "i8", 0),
 
     # Capacities
-    missile_cap: int = 0
-    transport_cap: int = 0
-    cargo_cap: int = 0
-    carrier_cap: int = 0
-    
+    ("missile_cap", "i8", 0),
+    ("transport_cap", "i8", 0),
+    ("cargo_cap", "i8", 0),
+    ("carrier_cap", "i8", 0),
+
     # Missile Details
-    missile_size_max: int = 0      # MisislePtsValue
-    launch_type: int = 0           # LaunchType (bitmask)
-    launch_types_str: str = ""     # e.g., "Land, Air"
+    ("missile_size_max", "i8", 0),          # MisislePtsValue
+    ("launch_type", "i8", 0),               # LaunchType (bitmask)
+    ("launch_types_str", "str", ""),        # e.g., "Land, Air"
 
     # Combat Values (Attack)
-    soft: float = 0.0
-    hard: float = 0.0
-    fort: float = 0.0
-    air_low: float = 0.0
-    air_mid: float = 0.0
-    air_high: float = 0.0
-    naval_surf: float = 0.0
-    naval_sub: float = 0.0
-    close_combat: float = 0.0
+    ("soft", "f8", 0.0),
+    ("hard", "f8", 0.0),
+    ("fort", "f8", 0.0),
+    ("air_low", "f8", 0.0),
+    ("air_mid", "f8", 0.0),
+    ("air_high", "f8", 0.0),
+    ("naval_surf", "f8", 0.0),
+    ("naval_sub", "f8", 0.0),
+    ("close_combat", "f8", 0.0),
 
     # Defense Values
-    def_ground: float = 0.0
-    def_air: float = 0.0
-    def_indirect: float = 0.0
-    def_close: float = 0.0
+    ("def_ground", "f8", 0.0),
+    ("def_air", "f8", 0.0),
+    ("def_indirect", "f8", 0.0),
+    ("def_close", "f8", 0.0),
 
     # Ranges (km) - RAW from DEFAULT.UNIT
-    range_ground: int = 0
-    range_air: int = 0
-    range_surf: int = 0
-    range_sub: int = 0
-    
+    ("range_ground", "i8", 0),
+    ("range_air", "i8", 0),
+    ("range_surf", "i8", 0),
+    ("range_sub", "i8", 0),
+
     # Ranges (km) - INGAME from scanner database (DEF)
-    range_ground_def: float = 0.0
-    range_air_def: float = 0.0
-    range_surf_def: float = 0.0
-    range_sub_def: float = 0.0
-    
+    ("range_ground_def", "f8", 0.0),
+    ("range_air_def", "f8", 0.0),
+    ("range_surf_def", "f8", 0.0),
+    ("range_sub_def", "f8", 0.0),
+
     # Missile Range (special_41_B) - shown under attack stats in-game
-    missile_range_km: float = 0.0
+    ("missile_range_km", "f8", 0.0),
 
     # Boolean Flags (0/1)
-    indirect_fire: int = 0
-    ballistic_art: int = 0
-    nbc: int = 0
-    ecm: int = 0
-    no_eff_loss_move: int = 0
-    ftl: int = 0
-    survey: int = 0
-    river_xing: int = 0
-    airdrop: int = 0
-    air_tanker: int = 0
-    air_refuel: int = 0
-    amph: int = 0
-    bridge_build: int = 0
-    engineering: int = 0
-    stand_off: int = 0
-    move_fire_penalty: int = 0
-    no_land_cap: int = 0
-    has_production: int = 0
-    
+    ("indirect_fire", "i8", 0),
+    ("ballistic_art", "i8", 0),
+    ("nbc", "i8", 0),
+    ("ecm", "i8", 0),
+    ("no_eff_loss_move", "i8", 0),
+    ("ftl", "i8", 0),
+    ("survey", "i8", 0),
+    ("river_xing", "i8", 0),
+    ("airdrop", "i8", 0),
+    ("air_tanker", "i8", 0),
+    ("air_refuel", "i8", 0),
+    ("amph", "i8", 0),
+    ("bridge_build", "i8", 0),
+    ("engineering", "i8", 0),
+    ("stand_off", "i8", 0),
+    ("move_fire_penalty", "i8", 0),
+    ("no_land_cap", "i8", 0),
+    ("has_production", "i8", 0),
+
     # Techs that upgrade this unit
-    tech_ids: list[int] = field(default_factory=list)
+    ("tech_ids", "ids", ()),
+]
+
+FIELD_KINDS = {name: kind for name, kind, _ in UNIT_FIELDS}
+_NUMPY_KINDS = {"i8": np.int64, "f8": np.float64}
+
+
+def _object_column(values) -> np.ndarray:
+    col = np.empty(len(values), dtype=object)
+    for i, v in enumerate(values):
+        col[i] = v  # element-wise, so tuples are not unpacked into a 2-D array
+    return col
+
+
+class UnitTable:
+    """
+    All units of DEFAULT.UNIT as columns: one NumPy array per stat (UNIT_FIELDS),
+    names/regions/years as object arrays of interned strings. Filtering,
+    sorting and tech bonuses run on whole columns; Unit(table, i) is the row view
+    used by the overlay code.
+    Columns are never modified in place by the bulk operations: they return new
+    tables that share the untouched arrays.
+    """
 
+    def __init__(self, columns: dict[str, np.ndarray]):
+        self.columns = columns
+        self._names_lower: np.ndarray | None = None
+        self._id_text: np.ndarray | None = None
+
+    @classmethod
+    def from_records(cls, records: list[dict]) -> "UnitTable":
+        """Build the columns from dicts of field values (missing fields take their default)."""
+        columns = {}
+        for name, kind, default in UNIT_FIELDS:
+            values = [r.get(name, default) for r in records]
+            if kind == "str":
+                columns[name] = _object_column([sys.intern(str(v)) for v in values])
+            elif kind == "ids":
+                columns[name] = _object_column([tuple(v) for v in values])
+            else:
+                columns[name] = np.array(values, dtype=_NUMPY_KINDS[kind])
+        return cls(columns)
+
+    def __len__(self) -> int:
+        return len(self.columns["id"])
+
+    def row(self, i: int) -> "Unit":
+        return Unit(self, i)
+
+    def rows(self, indices=None) -> list["Unit"]:
+        """Row views of every unit, or of `indices` (ints or a boolean mask) in that order."""
+        if indices is None:
+            indices = range(len(self))
+        elif getattr(indices, "dtype", None) == bool:
+            indices = np.flatnonzero(indices)
+        return [Unit(self, int(i)) for i in indices]
+
+    def column(self, name: str) -> np.ndarray:
+        """Values of one stat; a stat no unit has reads as 0.0 everywhere."""
+        col = self.columns.get(name)
+        return col if col is not None else np.zeros(len(self))
+
+    def take(self, indices) -> "UnitTable":
+        """New table with only `indices` (ints, a boolean mask or a slice); always copies."""
+        if isinstance(indices, slice):
+            return UnitTable({name: col[indices].copy() for name, col in self.columns.items()})
+        return UnitTable({name: col[indices] for name, col in self.columns.items()})
+
+    def copy(self) -> "UnitTable":
+        """Shallow copy: replacing a column in the copy leaves this table untouched."""
+        return UnitTable(dict(self.columns))
+
+    def get(self, name: str, i: int):
+        v = self.columns[name][i]
+        return v.item() if isinstance(v, np.generic) else v
+
+    def set(self, name: str, i: int, value):
+        """Write one cell, adding the column or widening int to float as needed."""
+        col = self.columns.get(name)
+        if col is None:
+            if isinstance(value, (bool, int, np.integer)):
+                col = np.zeros(len(self), dtype=np.int64)
+            elif isinstance(value, (float, np.floating)):
+                col = np.zeros(len(self))
+            else:
+                col = _object_column([None] * len(self))
+            self.columns[name] = col
+        elif col.dtype.kind in "iu" and isinstance(value, (float, np.floating)) and not float(value).is_integer():
+            col = self.columns[name] = col.astype(np.float64)
+        if isinstance(value, str):
+            value = sys.intern(value)
+        col[i] = value
+
+    # ---------------- VECTORIZED QUERIES ----------------
+
+    def categories(self) -> np.ndarray:
+        """"land" / "air" / "naval" / "unknown" per unit, from the class number."""
+        c = self.columns["class_num"]
+        return np.select([(c >= 0) & (c <= 6), (c >= 7) & (c <= 14), (c >= 15) & (c <= 20)],
+                         ["land", "air", "naval"], "unknown")
+
+    def matches(self, query: str) -> np.ndarray:
+        """Boolean mask of Unit.matches(query) for every unit."""
+        q = query.lower()
+        if self._names_lower is None:
+            self._names_lower = np.array([n.lower() for n in self.columns["name"]], dtype=str)
+            self._id_text = self.columns["id"].astype(str)
+        return (np.char.find(self._names_lower, q) >= 0) | (self._id_text == q)
+
+
+class Unit:
+    """
+    Representation of an SR2030 unit based on DEFAULT.UNIT: a view of one row
+    of a UnitTable. Reading a stat returns a plain Python value; assigning one
+    writes it into the table. Unit() builds a one-row table of defaults.
+    """
+
+    __slots__ = ("_table", "_row")
+
+    def __init__(self, table: UnitTable | None = None, row: int = 0, **values):
+        if table is None:
+            table = UnitTable.from_records([values])
+        object.__setattr__(self, "_table", table)
+        object.__setattr__(self, "_row", row)
+
+    def __getattr__(self, name):
+        if name.startswith("__") or name in Unit.__slots__:
+            raise AttributeError(name)
+        try:
+            col = self._table.columns[name]
+        except KeyError:
+            raise AttributeError(name) from None
+        v = col[self._row]
+        return v.item() if isinstance(v, np.generic) else v
+
+    def __setattr__(self, name, value):
+        self._table.set(name, self._row, value)
+
+    def __eq__(self, other):
+        if not isinstance(other, Unit):
+            return NotImplemented
+        if self._table is other._table and self._row == other._row:
+            return True
+        return self.as_dict() == other.as_dict()
+
+    __hash__ = None  # mutable, like the dataclass it replaces
+
+    def __repr__(self):
+        return f"Unit(id={self.id}, name={self.name!r})"
+
+    def as_dict(self) -> dict:
+        return {name: self._table.get(name, self._row) for name in self._table.columns}
 
     def matches(self, query: str) -> bool:
         """Search by Name or ID."""
@@ -195,194 +354,382 @@ class Unit:
         return q in self.name.lower() or q == str(self.id)
 
 
+# =============================================================================
+# DEFAULT.UNIT SCHEMA
+# =============================================================================
+
+@dataclass(frozen=True)
+class ColumnSpec:
+    """One DEFAULT.UNIT column read into one UnitTable field."""
+    field: str
+    column: int                     # 0-based; negative counts from the end of the row
+    kind: str = "int"               # "int", "float", "str", "year", "ids"
+    per_piece: bool = False         # value of a single vehicle: multiplied by strength
+    digits: Optional[int] = None    # round() after the strength scaling
+    count: int = 1                  # "ids": consecutive columns read together
+    min_row: int = 0                # rows with fewer cells read the field as blank
+
+
+UNIT_SCHEMA: list[ColumnSpec] = [
+    # --- 1. Identity ---
+    ColumnSpec("id", 0),
+    ColumnSpec("name", 1, "str"),
+    ColumnSpec("class_num", 2),
+    ColumnSpec("year", 4, "year"),          # years since 1900, 0 = "N/A"
+    ColumnSpec("region", 12, "str"),
+    ColumnSpec("req_tech_id", 23),
+
+    # --- 2. Strength & Personnel ---
+    ColumnSpec("strength", 13),             # 0 reads as 1
+    ColumnSpec("crew", 14),
+
+    # --- 3. Initiative & Stealth ---
+    ColumnSpec("initiative", 9),
+    ColumnSpec("stealth", 10),
+
+    # --- 4. Capacities ---
+    ColumnSpec("carrier_cap", 11),
+    ColumnSpec("missile_cap", 20, per_piece=True),
+    ColumnSpec("cargo_cap", 30),
+    ColumnSpec("transport_cap", 31),
+
+    # --- 5. Spotting System (IDs; ranges come from Spotting.csv) ---
+    ColumnSpec("spot1_id", 21),
+    ColumnSpec("spot2_id", 22),
+
+    # --- 6. Economy ---
+    ColumnSpec("days", 25, "float", per_piece=True),
+    ColumnSpec("cost", 26, "float", per_piece=True),
+    ColumnSpec("weight", 29, "float", per_piece=True),
+
+    # --- 7. Movement & Fuel ---
+    ColumnSpec("speed", 19),
+    ColumnSpec("move_range", 32),
+    ColumnSpec("fuel", 34, "float"),                                  # Per vehicle
+    ColumnSpec("fuel_battalion", 34, "float", per_piece=True, digits=1),  # Total Battalion
+    ColumnSpec("combat_time", 35),
+    ColumnSpec("supply_t", 36, "float", per_piece=True, digits=2),
+
+    # --- 8. Combat Values (Attack) ---
+    ColumnSpec("soft", 37, "float"),
+    ColumnSpec("hard", 38, "float"),
+    ColumnSpec("fort", 39, "float"),
+    ColumnSpec("air_low", 40, "float"),
+    ColumnSpec("air_mid", 41, "float"),
+    ColumnSpec("air_high", 42, "float"),
+    ColumnSpec("naval_surf", 43, "float"),
+    ColumnSpec("naval_sub", 44, "float"),
+    ColumnSpec("close_combat", 45, "float"),
+
+    # --- 9. Defense ---
+    ColumnSpec("def_ground", 46, "float"),
+    ColumnSpec("def_air", 47, "float"),
+    ColumnSpec("def_indirect", 48, "float"),
+    ColumnSpec("def_close", 49, "float"),
+
+    # --- 10. Ranges ---
+    ColumnSpec("range_ground", 50),
+    ColumnSpec("range_air", 51),
+    ColumnSpec("range_surf", 52),
+    ColumnSpec("range_sub", 53),
+
+    # --- 11. Flags (missing trailing columns read as 0) ---
+    ColumnSpec("indirect_fire", 56),
+    ColumnSpec("ballistic_art", 57),
+    ColumnSpec("nbc", 58),
+    ColumnSpec("ecm", 65),
+    ColumnSpec("no_eff_loss_move", 66),
+    ColumnSpec("ftl", 67),
+    ColumnSpec("survey", 68),
+    ColumnSpec("river_xing", 69),
+    ColumnSpec("airdrop", 70),
+    ColumnSpec("air_tanker", 71),
+    ColumnSpec("air_refuel", 72),
+    ColumnSpec("amph", 75),
+    ColumnSpec("bridge_build", 78),
+    ColumnSpec("engineering", 80),
+    ColumnSpec("stand_off", 82),
+    ColumnSpec("move_fire_penalty", 83),
+    ColumnSpec("no_land_cap", 84),
+    ColumnSpec("has_production", 85),
+
+    # --- 12. Missiles Details ---
+    # Both only from rows that reach column 110
+    ColumnSpec("launch_type", 109, min_row=111),    # bitmask: 1 Land, 2 Air, 4 Naval, 8 Sub
+    ColumnSpec("missile_size_max", 110, min_row=111),
+
+    # --- 13. Linked Techs (the 8 columns before the last one) ---
+    ColumnSpec("tech_ids", -9, "ids", count=8),
+]
+
+MIN_COLUMNS = 80
+# A mod with shifted columns ships "DEFAULT.UNIT.schema.json" next to its DEFAULT.UNIT:
+#   {"min_columns": 80, "columns": {"soft": 38, "cost": {"column": 27, "per_piece": true}}}
+SCHEMA_SUFFIX = ".schema.json"
+LAUNCH_TYPE_NAMES = ((1, "Land"), (2, "Air"), (4, "Naval"), (8, "Sub"))
+
+
+def schema_override_path(unit_path: str) -> Optional[str]:
+    """The schema override shipped next to a DEFAULT.UNIT, if any."""
+    p = Path(str(unit_path) + SCHEMA_SUFFIX)
+    return str(p) if p.exists() else None
+
+
+def load_schema(override_path: Optional[str] = None) -> tuple[list[ColumnSpec], int]:
+    """UNIT_SCHEMA and MIN_COLUMNS with the columns of an override file replaced."""
+    schema, min_columns = list(UNIT_SCHEMA), MIN_COLUMNS
+    if not override_path:
+        return schema, min_columns
+    try:
+        with open(override_path, "r", encoding="utf-8") as f:
+            override = json.load(f)
+    except Exception as e:
+        print(f"[Units] Schema override {override_path} ignored: {e}")
+        return schema, min_columns
+
+    min_columns = int(override.get("min_columns", min_columns))
+    index = {spec.field: i for i, spec in enumerate(schema)}
+    for name, change in override.get("columns", {}).items():
+        if name not in FIELD_KINDS:
+            print(f"[Units] Schema override: unknown field '{name}' ignored")
+            continue
+        if not isinstance(change, dict):
+            change = {"column": change}
+        try:
+            if name in index:
+                schema[index[name]] = replace(schema[index[name]], **change)
+            else:
+                schema.append(ColumnSpec(name, **change))
+                index[name] = len(schema) - 1
+        except TypeError as e:
+            print(f"[Units] Schema override for '{name}' ignored: {e}")
+    print(f"[Units] Schema override loaded from {Path(override_path).name}")
+    return schema, min_columns
+
+
+# =============================================================================
+# DECODER
+# =============================================================================
+
+class _NumberCache(dict):
+    """parse_float() of each distinct cell text, computed once: unit tables repeat a few hundred values."""
+
+    def __missing__(self, text: str) -> float:
+        value = self[text] = parse_float(text)
+        return value
+
+
+def _numbers(raw, cache: _NumberCache) -> np.ndarray:
+    """float() of every cell; blank or unreadable cells are 0.0 (like parse_float)."""
+    return np.fromiter(map(cache.__getitem__, raw), dtype=np.float64, count=len(raw))
+
+
+def _integers(values: np.ndarray) -> np.ndarray:
+    """int() of every value, non-finite as 0 (like parse_int)."""
+    return np.where(np.isfinite(values), values, 0.0).astype(np.int64)
+
+
+class _IdCache(dict):
+    """int() of each distinct tech ID cell; blank or unreadable cells are 0."""
+
+    def __missing__(self, text: str) -> int:
+        try:
+            value = int(text.strip())
+        except ValueError:
+            value = 0
+        self[text] = value
+        return value
+
+
+def _round(values: np.ndarray, digits: int) -> np.ndarray:
+    """Python round() of every value (computed once per distinct value)."""
+    uniq, inverse = np.unique(values, return_inverse=True)
+    rounded = np.array([round(v, digits) for v in uniq.tolist()], dtype=np.float64)
+    return rounded[inverse.reshape(-1)]
+
+
+class UnitDecoder:
+    """
+    A schema compiled for one pass over DEFAULT.UNIT: add() keeps only the
+    cells the schema reads from each row (two itemgetter calls), table() turns
+    all numeric cells into one (rows x cells) array in a single pass, then
+    scales, converts and derives whole columns with NumPy.
+    """
+
+    NUMERIC = ("int", "float", "year")
+
+    def __init__(self, schema: list[ColumnSpec], min_columns: int = MIN_COLUMNS):
+        self.schema = schema
+        self.min_columns = min_columns
+        head = [spec for spec in schema if spec.column >= 0]
+        numeric = sorted({spec.column for spec in head if spec.kind in self.NUMERIC})
+        text = sorted({spec.column + k for spec in head if spec.kind not in self.NUMERIC
+                       for k in range(spec.count)})
+        self._width = max(numeric + text, default=-1) + 1
+        self._num_slot = {c: i for i, c in enumerate(numeric)}
+        self._text_slot = {c: i for i, c in enumerate(text)}
+        self._pick_num = self._getter(numeric)
+        self._pick_text = self._getter(text)
+
+        tail = [spec for spec in schema if spec.column < 0]
+        self._tail_start = min((spec.column for spec in tail), default=0)
+        tail_stop = max((spec.column + spec.count for spec in tail), default=0)
+        self._tail = slice(self._tail_start, tail_stop if tail_stop < 0 else None)
+        self._numeric: list[tuple] = []
+        self._text: list[tuple] = []
+        self._tails: list[list[str]] = []
+        self._lengths: list[int] | None = [] if any(spec.min_row for spec in schema) else None
+
+    @staticmethod
+    def _getter(cells: list[int]):
+        if len(cells) == 1:
+            return lambda row: (row[cells[0]],)
+        return itemgetter(*cells) if cells else (lambda row: ())
+
+    def add(self, row: list[str]):
+        if self._tail_start < 0:
+            self._tails.append(row[self._tail])
+        if self._lengths is not None:
+            self._lengths.append(len(row))
+        if len(row) < self._width:
+            row = row + [""] * (self._width - len(row))
+        self._numeric.append(self._pick_num(row))
+        self._text.append(self._pick_text(row))
+
+    def _cells(self, spec: ColumnSpec, text_columns: list[tuple]) -> list:
+        """Raw strings of one text or tail spec, per row (lists of strings when count > 1)."""
+        if spec.column < 0:
+            start = spec.column - self._tail_start
+            return [t[start:start + spec.count] if spec.count > 1 else t[start] for t in self._tails]
+        if spec.count == 1:
+            return text_columns[self._text_slot[spec.column]]
+        picked = [text_columns[self._text_slot[spec.column + k]] for k in range(spec.count)]
+        return [list(cells) for cells in zip(*picked)]
+
+    def table(self) -> UnitTable:
+        n = len(self._numeric)
+        numbers = _NumberCache()
+        width = len(self._num_slot)
+        matrix = np.fromiter(map(numbers.__getitem__, chain.from_iterable(self._numeric)),
+                             dtype=np.float64, count=n * width).reshape(n, width)
+        text_columns = list(zip(*self._text)) if n else [()] * len(self._text_slot)
+        lengths = np.array(self._lengths, dtype=np.int64) if self._lengths is not None else None
+        values: dict[str, np.ndarray] = {}
+        per_piece = []
+
+        for spec in self.schema:
+            short = lengths < spec.min_row if spec.min_row and n else None
+            if spec.kind in self.NUMERIC:
+                if spec.column >= 0:
+                    raw = matrix[:, self._num_slot[spec.column]]
+                else:
+                    raw = _numbers(self._cells(spec, text_columns), numbers)
+                if short is not None:
+                    raw = np.where(short, 0.0, raw)
+                if spec.kind == "year":
+                    col = _object_column([sys.intern(str(1900 + y)) if y > 0 else "N/A"
+                                          for y in _integers(raw).tolist()])
+                else:
+                    col = raw if spec.kind == "float" else _integers(raw)
+            elif spec.kind == "ids":
+                ids = _IdCache().__getitem__
+                col = _object_column([tuple(filter(None, map(ids, cells if spec.count > 1 else [cells])))
+                                      for cells in self._cells(spec, text_columns)])
+            else:
+                col = _object_column([sys.intern(v.strip().strip('"')) for v in self._cells(spec, text_columns)])
+            if short is not None and spec.kind not in self.NUMERIC:
+                for i in np.flatnonzero(short).tolist():
+                    col[i] = () if spec.kind == "ids" else ""
+            values[spec.field] = col
+            if spec.per_piece or spec.digits is not None:
+                per_piece.append(spec)
+
+        # --- Strength scaling (the file gives single-vehicle values) ---
+        strength = values.get("strength", np.ones(n, dtype=np.int64))
+        strength = values["strength"] = np.where(strength == 0, 1, strength)
+        for spec in per_piece:
+            col = values[spec.field] * strength if spec.per_piece else values[spec.field]
+            if spec.digits is not None:
+                col = _round(col, spec.digits)
+            values[spec.field] = col
+
+        self._derive(values, strength, n)
+
+        columns = {}
+        for name, kind, default in UNIT_FIELDS:
+            col = values.get(name)
+            if col is None:
+                col = _object_column([default] * n) if kind in ("str", "ids") else np.full(n, default)
+            if kind in _NUMPY_KINDS:
+                col = _integers(col) if kind == "i8" and col.dtype.kind == "f" else col
+                col = col.astype(_NUMPY_KINDS[kind])
+            columns[name] = col
+        return UnitTable(columns)
+
+    def _derive(self, values: dict, strength: np.ndarray, n: int):
+        """Fields computed from other fields or from the Spotting / range tables."""
+        zeros = np.zeros(n, dtype=np.int64)
+        ids = values.get("id", zeros)
+        values["personnel"] = strength * values.get("crew", zeros)
+
+        # Spotting: legacy copies of the IDs, ranges from the loaded SPOTTING_DB
+        for k in (1, 2):
+            spot = values.get(f"spot{k}_id", zeros)
+            values[f"spot{k}"] = spot
+            uniq, inverse = np.unique(spot, return_inverse=True)
+            ranges = np.array([get_spotting_data(int(s))[0] for s in uniq], dtype=np.int64)
+            values[f"spot{k}_range_km"] = ranges[inverse.reshape(-1)] if n else zeros
+
+        # In-game ranges from the scanner database (DEF)
+        if RANGE_DATABASE:
+            db_fields = (("range_ground_def", "ground"), ("range_air_def", "air"), ("range_surf_def", "surface"),
+                         ("range_sub_def", "sub"), ("missile_range_km", "special_41_B"))
+            db_cols = {name: np.zeros(n) for name, _ in db_fields}
+            for i, uid in enumerate(ids.tolist()):
+                entry = RANGE_DATABASE.get(uid)
+                if entry:
+                    for name, key in db_fields:
+                        db_cols[name][i] = entry.get(key, 0.0)
+            values.update(db_cols)
+
+        # Launch types: "Land, Air" from the bitmask
+        lt = values.get("launch_type", zeros)
+        uniq, inverse = np.unique(lt, return_inverse=True)
+        names = [", ".join(name for bit, name in LAUNCH_TYPE_NAMES if v & bit) or "-" for v in uniq.tolist()]
+        values["launch_types_str"] = _object_column([names[i] for i in inverse.reshape(-1).tolist()])
+
+
+# =============================================================================
+# PARSING
+# =============================================================================
+
 def parse_default_unit(file_path: str) -> list[Unit]:
     """
-    Parses DEFAULT.UNIT into a list of Unit objects.
+    Parses DEFAULT.UNIT into a list of Unit objects (row views of one UnitTable).
     """
-    units: list[Unit] = []
+    return parse_unit_table(file_path).rows()
 
+
+def parse_unit_table(file_path: str, schema_path: Optional[str] = None) -> UnitTable:
+    """
+    Parses DEFAULT.UNIT into a UnitTable, streaming the rows after &&UNITS.
+    Columns follow UNIT_SCHEMA, or the override next to the file (see SCHEMA_SUFFIX).
+    """
+    schema, min_columns = load_schema(schema_path or schema_override_path(file_path))
+    decoder = UnitDecoder(schema, min_columns)
     try:
         with open(file_path, "r", encoding="latin-1", errors="replace") as f:
-            lines = f.readlines()
-
-        start_index = 0
-        for i, line in enumerate(lines):
-            if line.strip().startswith("&&UNITS"):
-                start_index = i + 1
-                break
-
-        csv_reader = csv.reader(lines[start_index:], delimiter=",", quotechar='"')
-
-        for row in csv_reader:
-            if not row: continue
-            if row[0].strip().startswith("//"): continue
-            if len(row) < 80: continue
-
-            try:
-                u = Unit()
-
-                # --- 1. Identity ---
-                u.id = parse_int(row[0])
-                u.name = row[1].strip().strip('"')
-                u.class_num = parse_int(row[2])
-
-                year_val = parse_int(row[4])
-                u.year = str(1900 + year_val) if year_val > 0 else "N/A"
-                u.region = row[12].strip()
-                
-                # Tech Req
-                try:
-                    u.req_tech_id = parse_int(row[23])
-                except:
-                    u.req_tech_id = 0
-
-                # --- 2. Strength & Personnel ---
-                u.strength = parse_int(row[13]) or 1      
-                u.crew = parse_int(row[14])               
-                u.personnel = u.strength * u.crew
-
-                # --- 3. Initiative & Stealth ---
-                u.initiative = parse_int(row[9])
-                u.stealth = parse_int(row[10])
-
-                # --- 4. Capacities ---
-                u.carrier_cap = parse_int(row[11])
-                u.missile_cap = parse_int(row[20]) * u.strength
-                u.cargo_cap = parse_int(row[30])
-                u.transport_cap = parse_int(row[31])
-
-                # --- 5. Spotting System (ID -> Range Conversion) ---
-                u.spot1_id = parse_int(row[21])              
-                u.spot2_id = parse_int(row[22])
-                
-                # Manteniamo compatibilità legacy
-                u.spot1 = u.spot1_id
-                u.spot2 = u.spot2_id
-
-                # Conversione DYNAMICA usando il DB caricato
-                # Note: get_spotting_data checks the SPOTTING_DB loaded in spotting_parser
-                try:
-                    r1, s1 = get_spotting_data(u.spot1_id)
-                    r2, s2 = get_spotting_data(u.spot2_id)
-                    u.spot1_range_km = r1
-                    u.spot2_range_km = r2
-                except Exception:
-                    # Fallback
-                    u.spot1_range_km = 0
-                    u.spot2_range_km = 0
-
-                # --- 6. Economy ---
-                days_per_unit = parse_float(row[25])
-                cost_per_unit = parse_float(row[26])
-                weight_per_unit = parse_float(row[29])
-
-                u.days = int(days_per_unit * u.strength)
-                u.cost = cost_per_unit * u.strength
-                u.weight = int(weight_per_unit * u.strength)
-
-                # --- 7. Movement & Fuel ---
-                u.speed = parse_int(row[19])
-                u.move_range = parse_int(row[32])
-                
-                # Fuel calculation
-                u.fuel = parse_float(row[34])             # Per vehicle
-                u.fuel_battalion = round(u.fuel * u.strength, 1) # Total Battalion
-                
-                u.combat_time = parse_int(row[35])
-
-                supply_cap_per_unit = parse_float(row[36])
-                if supply_cap_per_unit:
-                    u.supply_t = round(supply_cap_per_unit * u.strength, 2)
-
-                # --- 8. Combat Values (Attack) ---
-                u.soft = parse_float(row[37])
-                u.hard = parse_float(row[38])
-                u.fort = parse_float(row[39])
-                u.air_low = parse_float(row[40])
-                u.air_mid = parse_float(row[41])
-                u.air_high = parse_float(row[42])
-                u.naval_surf = parse_float(row[43])
-                u.naval_sub = parse_float(row[44])
-                u.close_combat = parse_float(row[45])
-
-                # --- 9. Defense ---
-                u.def_ground = parse_float(row[46])
-                u.def_air = parse_float(row[47])
-                u.def_indirect = parse_float(row[48])
-                u.def_close = parse_float(row[49])
-
-                # --- 10. Ranges ---
-                u.range_ground = parse_int(row[50])
-                u.range_air = parse_int(row[51])
-                u.range_surf = parse_int(row[52])
-                u.range_sub = parse_int(row[53])
-                
-                # --- 10b. Load DEF Ranges from Database ---
-                if u.id in RANGE_DATABASE:
-                    db_entry = RANGE_DATABASE[u.id]
-                    u.range_ground_def = db_entry.get('ground', 0.0)
-                    u.range_air_def = db_entry.get('air', 0.0)
-                    u.range_surf_def = db_entry.get('surface', 0.0)
-                    u.range_sub_def = db_entry.get('sub', 0.0)
-                    u.missile_range_km = db_entry.get('special_41_B', 0.0)
-
-                # --- 11. Flags ---
-                u.indirect_fire = parse_int(row[56])
-                u.ballistic_art = parse_int(row[57])
-                u.nbc = parse_int(row[58])
-                u.ecm = parse_int(row[65]) if len(row) > 65 else 0
-                u.no_eff_loss_move = parse_int(row[66]) if len(row) > 66 else 0
-                u.ftl = parse_int(row[67]) if len(row) > 67 else 0
-                u.survey = parse_int(row[68]) if len(row) > 68 else 0
-                u.river_xing = parse_int(row[69]) if len(row) > 69 else 0
-                u.airdrop = parse_int(row[70]) if len(row) > 70 else 0
-                u.air_tanker = parse_int(row[71]) if len(row) > 71 else 0
-                u.air_refuel = parse_int(row[72]) if len(row) > 72 else 0
-                u.amph = parse_int(row[75]) if len(row) > 75 else 0
-                u.bridge_build = parse_int(row[78]) if len(row) > 78 else 0
-                u.engineering = parse_int(row[80]) if len(row) > 80 else 0
-                u.stand_off = parse_int(row[82]) if len(row) > 82 else 0
-                u.move_fire_penalty = parse_int(row[83]) if len(row) > 83 else 0
-                u.no_land_cap = parse_int(row[84]) if len(row) > 84 else 0
-                u.has_production = parse_int(row[85]) if len(row) > 85 else 0
-                
-                # --- 12. Missiles Details ---
-                if len(row) > 110:
-                    u.launch_type = parse_int(row[109]) if len(row) > 109 else 0
-                    u.missile_size_max = parse_int(row[110])
-                    lt = u.launch_type
-                    types = []
-                    if lt & 1: types.append("Land")
-                    if lt & 2: types.append("Air")
-                    if lt & 4: types.append("Naval")
-                    if lt & 8: types.append("Sub")
-                    u.launch_types_str = ", ".join(types) if types else "-"
-                else:
-                    u.launch_types_str = "-"
-                    
-                # --- 13. Linked Techs ---
-                if len(row) >= 9:
-                    raw_techs = row[-9:-1]
-                    tech_ids: list[int] = []
-                    for t in raw_techs:
-                        t = t.strip()
-                        if not t: continue
-                        try:
-                            tid = int(t)
-                            if tid != 0: tech_ids.append(tid)
-                        except ValueError:
-                            continue
-                    u.tech_ids = tech_ids
-
-                units.append(u)
-
-            except Exception as e:
-                # Uncomment to debug specific row errors
-                # print(f"Error parsing row {row[0]}: {e}")
-                continue
-
+            for line in f:
+                if line.strip().startswith("&&UNITS"):
+                    break
+            else:
+                f.seek(0)  # no section marker: the whole file is the unit table
+
+            for row in csv.reader(f, delimiter=",", quotechar='"'):
+                if not row or len(row) < min_columns or row[0].strip().startswith("//"):
+                    continue
+                decoder.add(row)
     except FileNotFoundError:
         print(f"File not found: {file_path}")
-        return []
 
-    return units
\ No newline at end of file
+    return decoder.table()
@@ -0,0 +1,291 @@
+import json
+import struct
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+"""
+Supreme Ruler 2030 - Variable Registry
+- Single source of truth for every memory variable: name, offset, type, base
+  pointer, analytics category and display format.
+- memory_reader compiles it into block read plans; data_logger and analytics
+  derive their column lists, categories and formats from it.
+- Users can add (or override) variables without touching code by editing
+  Documents/SR2030_Logger/variables.json.
+"""
+
+logger = logging.getLogger(__name__)
+
+BASE_DIR = Path.home() / "Documents" / "SR2030_Logger"
+USER_REGISTRY_PATH = BASE_DIR / "variables.json"
+
+BASES = ("nation", "market")
+FORMATS = ("plain", "percent", "million", "thousand")
+
+TYPE_CODES = {"float": ("f", 4), "double": ("d", 8), "int": ("i", 4), "uint": ("I", 4)}
+
+# Fields further apart than this are read as separate blocks
+MAX_BLOCK_GAP = 512
+
+# Category display order in analytics
+CATEGORIES = [
+    "Economy",
+    "Resources - Stock",
+    "Resources - Production Costs",
+    "Resources - Market Prices",
+    "Resources - Trades",
+    "Demographics",
+    "Politics & Military",
+    "Research",
+]
+
+RESOURCES = [
+    "Agriculture", "Rubber", "Timber", "Petroleum", "Coal", "Metal Ore",
+    "Uranium", "Electric Power", "Consumer Goods", "Industry Goods", "Military Goods",
+]
+
+
+@dataclass(frozen=True)
+class VarDef:
+    name: str
+    offset: int
+    type: str = "float"
+    base: str = "nation"
+    category: str = ""
+    format: str = "plain"
+
+
+def _v(name, offset, type_="float", category="", fmt="plain", base="nation") -> VarDef:
+    return VarDef(name, offset, type_, base, category, fmt)
+
+
+# ============================================================
+# BUILT-IN DEFINITIONS (order = CSV column order)
+# ============================================================
+
+DEFAULT_VARIABLES: List[VarDef] = [
+    _v("Population", 0x14B48, category="Demographics", fmt="thousand"),
+    _v("Domestic Approval", 0x14B04, category="Politics & Military", fmt="percent"),
+    _v("Military Approval", 0x14B08, category="Politics & Military", fmt="percent"),
+    _v("Literacy", 0x14B20, category="Politics & Military", fmt="percent"),
+    _v("Credit Rating", 0x14B18, category="Economy", fmt="percent"),
+    _v("Treaty Integrity", 0x14AF4, category="Politics & Military", fmt="percent"),
+    # NOTE: same offset as Military Approval in the original tables - kept until verified in-game
+    _v("Subsidy Rate", 0x14B08, category="Politics & Military", fmt="percent"),
+    _v("Tourism", 0x14B1C, category="Demographics", fmt="percent"),
+    _v("Treasury", 0x14B88, "double", category="Economy", fmt="million"),
+    _v("Bond Debt", 0x14B98, category="Economy", fmt="million"),
+    _v("GDP/c", 0x14C50, category="Economy"),
+    _v("Inflation", 0x14C60, category="Economy", fmt="percent"),
+    _v("Unemployment", 0x14B68, category="Economy", fmt="percent"),
+    _v("Research Efficiency", 0x14CEC, category="Research", fmt="percent"),
+    _v("Active Personnel", 0x14B60, category="Politics & Military", fmt="thousand"),
+    _v("Reserve Personnel", 0x14B64, category="Politics & Military", fmt="thousand"),
+    _v("Emigration", 0x14B70, category="Demographics"),
+    _v("Immigration", 0x14B6C, category="Demographics"),
+    _v("Births", 0x14B74, category="Demographics"),
+    _v("Deaths", 0x14B78, category="Demographics"),
+]
+
+# Per-resource records are 0x150 apart in the nation struct; market prices 0x84 apart
+_RESOURCE_STRIDE = 0x150
+_MARKET_STRIDE = 0x84
+
+DEFAULT_VARIABLES += [
+    _v(res, 0x14DA4 + i * _RESOURCE_STRIDE, category="Resources - Stock") for i, res in enumerate(RESOURCES)
+]
+DEFAULT_VARIABLES += [
+    _v(f"{res} Production Cost", 0x14DFC + i * _RESOURCE_STRIDE, category="Resources - Production Costs")
+    for i, res in enumerate(RESOURCES)
+]
+DEFAULT_VARIABLES += [
+    _v(f"{res} Market Price", 0x074 + i * _MARKET_STRIDE, category="Resources - Market Prices", base="market")
+    for i, res in enumerate(RESOURCES)
+]
+DEFAULT_VARIABLES += [
+    _v(f"{res} Trades", 0x14E00 + i * _RESOURCE_STRIDE, category="Resources - Trades")
+    for i, res in enumerate(RESOURCES)
+]
+
+
+# ============================================================
+# LOADING
+# ============================================================
+
+def _parse_entry(entry: dict) -> VarDef:
+    offset = entry["offset"]
+    if isinstance(offset, str):
+        offset = int(offset, 0)
+    var = VarDef(
+        name=str(entry["name"]).strip(),
+        offset=int(offset),
+        type=entry.get("type", "float"),
+        base=entry.get("base", "nation"),
+        category=entry.get("category", "Custom"),
+        format=entry.get("format", "plain"),
+    )
+    if var.type not in TYPE_CODES:
+        raise ValueError(f"unknown type '{var.type}'")
+    if var.base not in BASES:
+        raise ValueError(f"unknown base '{var.base}'")
+    if var.format not in FORMATS:
+        raise ValueError(f"unknown format '{var.format}'")
+    return var
+
+
+def _write_user_template(path: Path):
+    template = {
+        "_help": (
+            "Add or override memory variables here. Entries with an existing name replace "
+            "the built-in definition; new names are appended as new log columns. "
+            f"type: {', '.join(TYPE_CODES)} | base: {', '.join(BASES)} | format: {', '.join(FORMATS)}"
+        ),
+        "_example": {"name": "Some Value", "offset": "0x14C00", "type": "float",
+                     "base": "nation", "category": "Custom", "format": "plain"},
+        "variables": [],
+    }
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(template, f, indent=4)
+    except OSError:
+        pass
+
+
+def load_registry(user_path: Path = USER_REGISTRY_PATH) -> "Registry":
+    """Built-in definitions merged with the user's variables.json (if any)."""
+    variables = {v.name: v for v in DEFAULT_VARIABLES}
+
+    if not user_path.exists():
+        _write_user_template(user_path)
+    else:
+        try:
+            with open(user_path, "r", encoding="utf-8") as f:
+                entries = json.load(f).get("variables", [])
+        except (OSError, json.JSONDecodeError) as e:
+            logger.error(f"Variable registry {user_path} unreadable, using built-ins: {e}")
+            entries = []
+
+        for entry in entries:
+            try:
+                var = _parse_entry(entry)
+            except (KeyError, ValueError, TypeError) as e:
+                logger.warning(f"Skipping registry entry {entry!r}: {e}")
+                continue
+            variables[var.name] = var  # dict keeps the original position on override
+
+    return Registry(list(variables.values()))
+
+
+# ============================================================
+# REGISTRY + READ PLANS
+# ============================================================
+
+class Registry:
+    def __init__(self, variables: List[VarDef]):
+        self.variables = variables
+        self.by_name: Dict[str, VarDef] = {v.name: v for v in variables}
+        self._warn_duplicates()
+
+    def _warn_duplicates(self):
+        seen: Dict[Tuple[str, int], str] = {}
+        for v in self.variables:
+            key = (v.base, v.offset)
+            if key in seen:
+                logger.warning(f"Registry: '{v.name}' shares offset {v.offset:#x} with '{seen[key]}'")
+            else:
+                seen[key] = v.name
+
+    def names(self) -> List[str]:
+        return [v.name for v in self.variables]
+
+    def for_base(self, base: str) -> List[VarDef]:
+        return [v for v in self.variables if v.base == base]
+
+    def categories(self) -> Dict[str, List[str]]:
+        """Category -> variable names, in display order (custom categories last)."""
+        cats: Dict[str, List[str]] = {c: [] for c in CATEGORIES}
+        for v in self.variables:
+            cats.setdefault(v.category or "Custom", []).append(v.name)
+        return {c: names for c, names in cats.items() if names}
+
+    def with_format(self, fmt: str) -> set:
+        return {v.name for v in self.variables if v.format == fmt}
+
+    def read_plan(self, base: str, names: Optional[List[str]] = None, max_gap: int = MAX_BLOCK_GAP) -> "ReadPlan":
+        wanted = set(names) if names is not None else None
+        fields = [v for v in self.for_base(base) if wanted is None or v.name in wanted]
+        return ReadPlan(fields, max_gap)
+
+
+class ReadBlock:
+    """
+    One contiguous memory read decoded with a single precompiled struct.
+    Aliased fields (same offset as an earlier field) are decoded separately.
+    """
+
+    def __init__(self, fields: List[VarDef]):
+        fields = sorted(fields, key=lambda v: v.offset)
+        self.start = fields[0].offset
+        fmt = "<"
+        pos = self.start
+        self.names: List[str] = []
+        self.aliases: List[Tuple[str, int, struct.Struct]] = []
+        for v in fields:
+            code, size = TYPE_CODES[v.type]
+            if v.offset < pos:
+                self.aliases.append((v.name, v.offset - self.start, struct.Struct("<" + code)))
+                continue
+            if v.offset > pos:
+                fmt += f"{v.offset - pos}x"
+            fmt += code
+            pos = v.offset + size
+            self.names.append(v.name)
+        self.size = pos - self.start
+        self.struct = struct.Struct(fmt)
+
+    def decode(self, raw: bytes) -> Iterator[Tuple[str, float]]:
+        yield from zip(self.names, self.struct.unpack_from(raw))
+        for name, off, s in self.aliases:
+            yield name, s.unpack_from(raw, off)[0]
+
+    def all_names(self) -> List[str]:
+        return self.names + [a[0] for a in self.aliases]
+
+
+class ReadPlan:
+    """Fields of one base pointer grouped into as few block reads as possible."""
+
+    def __init__(self, fields: List[VarDef], max_gap: int = MAX_BLOCK_GAP):
+        self.blocks: List[ReadBlock] = []
+        group: List[VarDef] = []
+        end = 0
+        for v in sorted(fields, key=lambda v: v.offset):
+            if group and v.offset - end > max_gap:
+                self.blocks.append(ReadBlock(group))
+                group = []
+            v_end = v.offset + TYPE_CODES[v.type][1]
+            end = max(end, v_end) if group else v_end
+            group.append(v)
+        if group:
+            self.blocks.append(ReadBlock(group))
+
+    def __bool__(self):
+        return bool(self.blocks)
+
+    def read(self, read_bytes, base_addr: int, out: dict):
+        """
+        Execute the plan. `read_bytes(addr, size)` returns bytes or None.
+        Fields of a failed block are set to None.
+        """
+        for block in self.blocks:
+            raw = read_bytes(base_addr + block.start, block.size)
+            if raw is None:
+                for name in block.all_names():
+                    out[name] = None
+            else:
+                out.update(block.decode(raw))
+
+
+REGISTRY = load_registry()
@@ -0,0 +1,179 @@
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+from tkinter import ttk
+
+"""
+Supreme Ruler 2030 - Virtual Table
+- Shows a frame of any length in a ttk.Treeview that only ever holds one
+  screenful of items: scrolling rewrites those items with the rows now in
+  view, so a 10k-row history costs the same as 20 rows.
+- Click a heading to sort by it (again to reverse): one argsort of the
+  column, missing values always last. Date strings sort by `GameDate`.
+- Cells are formatted per column on the visible slice only, through
+  `formatter(column, values) -> list of str`.
+"""
+
+WHEEL_ROWS = 3
+
+
+class VirtualTable:
+    def __init__(self, tree, scrollbar, formatter: Callable[[str, np.ndarray], List[str]]):
+        self.tree = tree
+        self.scrollbar = scrollbar
+        self.formatter = formatter
+        self.columns: List[str] = []
+        self._frame: Optional[pd.DataFrame] = None
+        self._arrays: Dict[str, np.ndarray] = {}
+        self._order: Optional[np.ndarray] = None  # row order (None = frame order)
+        self._sort: Optional[str] = None
+        self._descending = False
+        self._top = 0
+        self._page = int(tree.cget("height"))
+        self._items: List[str] = []
+
+        scrollbar.configure(command=self.yview)
+        tree.configure(yscrollcommand="")
+        tree.bind("<Configure>", self._on_resize, add="+")
+        tree.bind("<MouseWheel>", lambda e: self._scroll(-WHEEL_ROWS if e.delta > 0 else WHEEL_ROWS))
+        tree.bind("<Button-4>", lambda e: self._scroll(-WHEEL_ROWS))
+        tree.bind("<Button-5>", lambda e: self._scroll(WHEEL_ROWS))
+        tree.bind("<Prior>", lambda e: self._scroll(-self._page))
+        tree.bind("<Next>", lambda e: self._scroll(self._page))
+        tree.bind("<Home>", lambda e: self._scroll_to(0))
+        tree.bind("<End>", lambda e: self._scroll_to(self._rows()))
+
+    # ---------------- DATA ----------------
+
+    def _rows(self) -> int:
+        return 0 if self._frame is None else len(self._frame)
+
+    def set_frame(self, frame: Optional[pd.DataFrame], columns: List[str], headers: Optional[Dict[str, str]] = None):
+        """
+        Show `columns` of `frame` (shared views are fine: nothing is copied).
+        New columns start at the newest rows; a refresh with the same columns
+        keeps the position, or keeps following the end if it was there.
+        """
+        at_end = self._top + self._page >= self._rows()
+        same = columns == self.columns
+        self._frame = frame
+        self._arrays = {}
+        if not same:
+            self.columns = list(columns)
+            self.tree["columns"] = self.columns
+            self.tree["show"] = "headings"
+            for c in self.columns:
+                text = (headers or {}).get(c, c)
+                self.tree.heading(c, text=text, command=lambda c=c: self.sort_by(c))
+                self.tree.column(c, width=max(100, min(200, len(text) * 8 + 20)), anchor="center")
+            if self._sort not in self.columns:
+                self._sort, self._descending = None, False
+        self._order = self._sorted_order()
+        if not same or at_end:
+            self._top = max(0, self._rows() - self._page)
+        self._render()
+
+    def clear(self):
+        self.set_frame(None, [])
+
+    def _array(self, col: str) -> np.ndarray:
+        arr = self._arrays.get(col)
+        if arr is None:
+            arr = self._arrays[col] = self._frame[col].to_numpy()
+        return arr
+
+    def _sort_key(self, col: str) -> np.ndarray:
+        if col == "GameDate_str" and "GameDate" in self._frame.columns:
+            col = "GameDate"
+        values = self._array(col)
+        if values.dtype.kind == "M":
+            return values.astype("datetime64[ns]").astype(np.int64).astype(float)
+        if values.dtype.kind in "iufb":
+            return values.astype(float)
+        return pd.Series(values).astype(str).to_numpy()
+
+    def _sorted_order(self) -> Optional[np.ndarray]:
+        if self._sort is None or self._frame is None:
+            return None
+        key = self._sort_key(self._sort)
+        if key.dtype.kind == "f" and self._descending:
+            return np.argsort(-key, kind="stable")  # NaN stays last
+        order = np.argsort(key, kind="stable")
+        return order[::-1] if self._descending else order
+
+    def sort_by(self, col: str):
+        if self._frame is None:
+            return
+        self._descending = (not self._descending) if self._sort == col else False
+        self._sort = col
+        self._order = self._sorted_order()
+        for c in self.columns:
+            text = self.tree.heading(c, "text").rstrip(" ▲▼")
+            mark = (" ▼" if self._descending else " ▲") if c == col else ""
+            self.tree.heading(c, text=text + mark)
+        self._top = 0
+        self.tree.selection_remove(self.tree.selection())
+        self._render()
+
+    # ---------------- PAGING ----------------
+
+    def yview(self, *args):
+        """Scrollbar command: ("moveto", fraction) or ("scroll", n, "units"|"pages")."""
+        if not args:
+            return
+        if args[0] == "moveto":
+            self._scroll_to(int(round(float(args[1]) * self._rows())))
+        elif args[0] == "scroll":
+            step = int(args[1]) * (self._page if args[2] == "pages" else 1)
+            self._scroll(step)
+
+    def _scroll(self, rows: int):
+        self._scroll_to(self._top + rows)
+        return "break"
+
+    def _scroll_to(self, top: int):
+        top = max(0, min(top, self._rows() - self._page))
+        if top != self._top or not self._items:
+            self._top = top
+            self.tree.selection_remove(self.tree.selection())  # items are reused for other rows
+            self._render()
+        return "break"
+
+    def _on_resize(self, event):
+        style_height = ttk.Style(self.tree).lookup("Treeview", "rowheight")
+        row_height = int(style_height) if str(style_height).strip() else 20
+        page = max(1, (event.height - row_height - 4) // row_height)  # minus the heading row
+        if page != self._page:
+            self._page = page
+            self._top = max(0, min(self._top, self._rows() - page))
+            self._render()
+
+    def _render(self):
+        n = self._rows()
+        top, stop = self._top, min(n, self._top + self._page)
+        rows = np.arange(top, stop) if self._order is None else self._order[top:stop]
+
+        cells = []
+        for col in self.columns:
+            values = self._array(col)[rows]
+            if values.dtype.kind in "iufb":
+                cells.append(self.formatter(col, values))
+            else:
+                cells.append(["" if pd.isna(v) else str(v) for v in values])
+
+        # Reuse one screenful of items; add or drop only when the page size changes
+        count = stop - top
+        while len(self._items) < count:
+            self._items.append(self.tree.insert("", "end"))
+        if len(self._items) > count:
+            self.tree.delete(*self._items[count:])
+            del self._items[count:]
+        for i, item in enumerate(self._items):
+            self.tree.item(item, values=[c[i] for c in cells])
+        self.tree.yview_moveto(0)
+
+        if n:
+            self.scrollbar.set(top / n, stop / n)
+        else:
+            self.scrollbar.set(0.0, 1.0)